@@ -1,11 +1,15 @@
 import zlib
+import functools
 import hashlib
+import hmac
 import json
 import re
+import threading
 from pathlib import Path
 
 import streamlit as st
 import streamlit.components.v1 as components
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
 ASSETS_DIR = Path(__file__).parent / "assets"
 LOGO_PATH = ASSETS_DIR / "terra_sports.svg"
@@ -47,16 +51,63 @@ KINEMATIC_FPS = 250
 MS_PER_FRAME = 1000 / KINEMATIC_FPS  # 4 ms per frame
 REPORT_METRIC_LOGIC_VERSION = "report_metrics_v2_br_plus4_normalized"
 
+# --------------------------------------------------
+# Cache lifetimes
+# --------------------------------------------------
+# Database contents only change when new takes are ingested; append
+# ?refresh=1 to the URL to drop cached results after an ingest.
+CACHE_TTL_SECONDS = 60 * 60
+LOOKUP_CACHE_TTL_SECONDS = 24 * 60 * 60
+
 import numpy as np
 import plotly.graph_objects as go
-from scipy.signal import savgol_filter
+from scipy.signal import savgol_coeffs
 from dotenv import load_dotenv
-from db.connection import get_connection
+from cache_keys import TAKE_ID_HASH_FUNCS, take_id_key
+from db.connection import execute_prepared, pooled_connection, pooled_cursor
+from db.params import as_date_list
+from loader_executor import get_loader_executor, in_loader_thread
 
-def login():
+
+@st.cache_resource(show_spinner=False)
+def get_auth_users():
+    """
+    Returns {username: stored password} from st.secrets, resolved once per process.
+    """
     raw_users = st.secrets["auth"]["users"]
-    users = {str(username).strip(): str(password) for username, password in raw_users.items()}
+    return {str(username).strip(): str(password) for username, password in raw_users.items()}
+
+
+def verify_password(submitted_password, stored_password):
+    """
+    Compares a submitted password with its stored secret in constant time.
 
+    Stored values are either "scrypt$<salt hex>$<hash hex>" (scrypt, n=2**14,
+    r=8, p=1) or, for entries not migrated yet, the plaintext password. A
+    malformed scrypt secret rejects the login instead of raising.
+    """
+    if stored_password.startswith("scrypt$"):
+        try:
+            _, salt_hex, hash_hex = stored_password.split("$", 2)
+            salt = bytes.fromhex(salt_hex)
+            expected = bytes.fromhex(hash_hex)
+            if not expected:
+                return False
+            candidate = hashlib.scrypt(
+                submitted_password.encode(),
+                salt=salt,
+                n=2**14,
+                r=8,
+                p=1,
+                dklen=len(expected),
+            )
+        except ValueError:
+            return False
+        return hmac.compare_digest(candidate, expected)
+    return hmac.compare_digest(submitted_password.encode(), stored_password.encode())
+
+
+def login():
     if "authenticated" not in st.session_state:
         st.session_state.authenticated = False
 
@@ -109,9 +160,10 @@ def login():
         st.markdown("</div>", unsafe_allow_html=True)
 
     if login_clicked:
+        users = get_auth_users()
         submitted_username = username.strip()
         submitted_password = password
-        if submitted_username in users and users[submitted_username] == submitted_password:
+        if submitted_username in users and verify_password(submitted_password, users[submitted_username]):
             st.session_state.authenticated = True
             st.session_state.user = submitted_username
             st.rerun()
@@ -124,49 +176,57 @@ def login():
 if not login():
     st.stop()
 
+if st.query_params.get("refresh") == "1":
+    st.cache_data.clear()
+    st.cache_resource.clear()
+    del st.query_params["refresh"]
+
 # --- Safe color resolver for named/hex colors ---
+# Named colors packed as 0xRRGGBB so they share the hex bitshift path.
+NAMED_COLORS_RGB = {
+    "blue": 0x1F77B4,
+    "orange": 0xFF7F0E,
+    "green": 0x2CA02C,
+    "red": 0xD62728,
+    "purple": 0x9467BD,
+    "brown": 0x8C564B,
+    "pink": 0xE377C2,
+    "gray": 0x7F7F7F,
+    "olive": 0xBCBD22,
+    "teal": 0x17BECF,
+    "cyan": 0x00FFFF,
+    "magenta": 0xFF00FF,
+    "deeppink": 0xFF1493,
+    "dodgerblue": 0x1E90FF,
+    "crimson": 0xDC143C,
+    "darkorange": 0xFF8C00,
+    "charcoal": 0x374151,
+    "darkblue": 0x00008B,
+    "darkred": 0x8B0000,
+    "darkgreen": 0x006400,
+}
+
+
+@functools.lru_cache(maxsize=512)
 def to_rgba(color, alpha=0.35):
     """
     Convert a hex color (#RRGGBB) or basic named color to an rgba() string
     without requiring matplotlib.
     """
-    named_colors = {
-        "blue": (31, 119, 180),
-        "orange": (255, 127, 14),
-        "green": (44, 160, 44),
-        "red": (214, 39, 40),
-        "purple": (148, 103, 189),
-        "brown": (140, 86, 75),
-        "pink": (227, 119, 194),
-        "gray": (127, 127, 127),
-        "olive": (188, 189, 34),
-        "teal": (23, 190, 207),
-        "cyan": (0, 255, 255),
-        "magenta": (255, 0, 255),
-        "deeppink": (255, 20, 147),
-        "dodgerblue": (30, 144, 255),
-        "crimson": (220, 20, 60),
-        "darkorange": (255, 140, 0),
-        "charcoal": (55, 65, 81),
-        "darkblue": (0, 0, 139),
-        "darkred": (139, 0, 0),
-        "darkgreen": (0, 100, 0)
-    }
-
+    packed = None
     if isinstance(color, str):
         color = color.lower()
 
         # Hex color
         if color.startswith("#") and len(color) == 7:
-            r = int(color[1:3], 16)
-            g = int(color[3:5], 16)
-            b = int(color[5:7], 16)
-            return f"rgba({r},{g},{b},{alpha})"
+            packed = int(color[1:], 16)
 
         # Named color
-        if color in named_colors:
-            r, g, b = named_colors[color]
-            return f"rgba({r},{g},{b},{alpha})"
+        elif color in NAMED_COLORS_RGB:
+            packed = NAMED_COLORS_RGB[color]
+
+    if packed is not None:
+        return f"rgba({packed >> 16},{(packed >> 8) & 0xFF},{packed & 0xFF},{alpha})"
 
     # Fallback (neutral gray)
     return f"rgba(150,150,150,{alpha})"
@@ -180,6 +240,142 @@ def ms_to_rel_frame(milliseconds):
     return int(round(milliseconds / MS_PER_FRAME))
 
 
+def release_window(frames, br_frame, window_start=None, window_end=None):
+    """
+    Shared half of normalize_to_release(): times (ms) relative to br_frame for
+    every frame, plus the mask of frames within [window_start, window_end].
+    Series recorded on the same frame axis can compute this once and pass it
+    to normalize_to_release(window=...).
+    """
+    rel_frames = np.asarray(frames, dtype=np.int64) - br_frame
+    in_window = np.ones(rel_frames.shape, dtype=bool)
+    if window_start is not None:
+        in_window &= rel_frames >= window_start
+    if window_end is not None:
+        in_window &= rel_frames <= window_end
+    times_ms = np.rint(rel_frames * MS_PER_FRAME).astype(np.int64)
+    return times_ms, in_window
+
+
+def same_frame_axis(frames, other_frames):
+    """
+    True when two sorted frame sequences are the same gap-free run of frames,
+    checked from their ends instead of element by element.
+    """
+    count = len(frames)
+    return (
+        count > 0
+        and count == len(other_frames)
+        and frames[0] == other_frames[0]
+        and frames[-1] == other_frames[-1]
+        and frames[-1] - frames[0] + 1 == count
+    )
+
+
+def normalize_to_release(frames, values, br_frame, window_start=None, window_end=None, sign=1.0, as_arrays=False, window=None):
+    """
+    Re-expresses one take's series as ms relative to ball release in a single
+    vectorized pass. Missing and non-finite samples are dropped and, when given,
+    only frames within [window_start, window_end] of br_frame are kept. Values
+    are scaled by sign (-1.0 to mirror handedness / flip direction).
+    window takes a precomputed release_window() for the same frames instead.
+    Returns (times_ms, values) as lists, or as int64 / float64 arrays with
+    as_arrays=True.
+    """
+    if window is None:
+        window = release_window(frames, br_frame, window_start, window_end)
+    times_ms, in_window = window
+    values = np.asarray(values, dtype=np.float64)
+    keep = in_window & np.isfinite(values)
+    times_ms = times_ms[keep]
+    kept_values = values[keep]
+    if sign != 1.0:
+        kept_values = kept_values * sign
+    if as_arrays:
+        return times_ms, kept_values
+    return times_ms.tolist(), kept_values.tolist()
+
+
+def values_at_times(times_ms, values, target_times_ms):
+    """
+    Values sampled exactly at each target time, found with one searchsorted
+    pass over the sorted times_ms. Targets that are None or were not sampled
+    map to None.
+    """
+    results = [None] * len(target_times_ms)
+    present = [i for i, target in enumerate(target_times_ms) if target is not None]
+    times_ms = np.asarray(times_ms)
+    if not present or times_ms.size == 0:
+        return results
+
+    wanted = np.asarray([target_times_ms[i] for i in present])
+    positions = np.minimum(np.searchsorted(times_ms, wanted), times_ms.size - 1)
+    hits = times_ms[positions] == wanted
+    for i, position, hit in zip(present, positions.tolist(), hits.tolist()):
+        if hit:
+            results[i] = values[position]
+    return results
+
+
+def extreme_frame(frames, values, largest=True):
+    """
+    Frame at the first maximum (or minimum, with largest=False) of values,
+    skipping missing samples. Returns None when no value is present.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if values.size == 0 or np.isnan(values).all():
+        return None
+    idx = np.nanargmax(values) if largest else np.nanargmin(values)
+    return frames[idx]
+
+
+POLYLINE_GAP = np.array([np.nan])
+# Plotly 5 writes arrays as JSON text; hover shows one decimal, so two keep
+# the lines exact on screen while dropping the float64 repr tail
+PLOT_VALUE_DECIMALS = 2
+
+
+def append_polyline(polylines, key, x_values, y_values, customdata_row):
+    """
+    Appends one curve to the polyline stored under key, followed by a NaN gap
+    so Plotly breaks the line there. Curves sharing a style can then be drawn
+    as a single trace; customdata_row is repeated for every point of the curve.
+    y values are rounded to PLOT_VALUE_DECIMALS to keep the figure JSON short.
+    """
+    polyline = polylines.setdefault(key, {"x": [], "y": [], "customdata": []})
+    polyline["x"].extend((np.asarray(x_values, dtype=np.float64), POLYLINE_GAP))
+    polyline["y"].extend((np.round(np.asarray(y_values, dtype=np.float64), PLOT_VALUE_DECIMALS), POLYLINE_GAP))
+    polyline["customdata"].extend([customdata_row] * len(x_values))
+    polyline["customdata"].append([None] * len(customdata_row))
+
+
+@functools.lru_cache(maxsize=None)
+def get_savgol_kernel(window_length, polyorder):
+    """
+    Precomputes the Savitzky-Golay convolution kernel plus the edge projections
+    savgol_filter(mode="interp") applies to the first / last half-window.
+    """
+    coeffs = savgol_coeffs(window_length, polyorder)
+    vander = np.vander(np.arange(window_length), polyorder + 1)
+    projection = vander @ np.linalg.pinv(vander)
+    half = window_length // 2
+    return coeffs, projection[:half], projection[-half:]
+
+
+def savgol_smooth(values, window_length, polyorder):
+    """
+    Equivalent to savgol_filter(values, window_length, polyorder) but reuses the
+    cached kernel instead of re-solving the least-squares fit on every call.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    coeffs, head, tail = get_savgol_kernel(window_length, polyorder)
+    half = window_length // 2
+    smoothed = np.convolve(values, coeffs, mode="same")
+    smoothed[:half] = head @ values[:window_length]
+    smoothed[-half:] = tail @ values[-window_length:]
+    return smoothed
+
+
 SEGMENT_DISPLAY_NAMES = {
     "Pelvis": "Pelvis Rotation",
     "Torso": "Torso Rotation",
@@ -193,6 +389,59 @@ def segment_display_name(label):
     return SEGMENT_DISPLAY_NAMES.get(label, label)
 
 
+def format_number_column(values, decimals, unit=None, prefix=""):
+    """
+    Formats a numeric column to display strings in one pass; None / NaN become "".
+
+    unit: optional unit suffix, either one string or a Series aligned with values
+    """
+    import pandas as pd
+
+    numbers = pd.to_numeric(pd.Series(values), errors="coerce")
+    text = prefix + numbers.map(f"{{:.{decimals}f}}".format, na_action="ignore")
+    if unit is not None:
+        text = (text + " " + unit).str.strip()
+    return text.fillna("")
+
+
+def add_event_markers(fig, markers, label_y, font_size, font_family=None, line_opacity=None):
+    """
+    Draws a dashed vertical line per event with its label above the plot area.
+
+    markers: sequence of (x_ms, color, label)
+    All shapes and annotations go in with a single layout update rather than
+    one add_vline / add_annotation pair per event.
+    """
+    shapes = []
+    annotations = []
+    for x_ms, color, label in markers:
+        shapes.append(dict(
+            type="line",
+            x0=x_ms,
+            x1=x_ms,
+            xref="x",
+            y0=0,
+            y1=1,
+            yref="y domain",
+            line=dict(color=color, width=3, dash="dash"),
+            **({"opacity": line_opacity} if line_opacity is not None else {}),
+        ))
+        annotations.append(dict(
+            x=x_ms,
+            y=label_y,
+            xref="x",
+            yref="paper",
+            text=label,
+            showarrow=False,
+            font=dict(color=color, size=font_size, **({"family": font_family} if font_family else {})),
+            align="center",
+        ))
+    fig.update_layout(
+        shapes=[*fig.layout.shapes, *shapes],
+        annotations=[*fig.layout.annotations, *annotations],
+    )
+
+
 def add_event_iqr_band(fig, event_frames, color, show_band, opacity=0.10):
     if not show_band or not event_frames:
         return
@@ -216,248 +465,236 @@ def add_event_iqr_band(fig, event_frames, color, show_band, opacity=0.10):
 
 load_dotenv()
 
-@st.cache_data(ttl=300)
 def get_all_pitchers():
     """
     Returns all athlete names from the athletes table.
     """
-    conn = get_connection()
-    try:
-        with conn.cursor() as cur:
-            cur.execute("""
-                SELECT athlete_name
-                FROM athletes
-                WHERE athlete_name IS NOT NULL
-                ORDER BY athlete_name
-            """)
-            return [row[0] for row in cur.fetchall()]
-    finally:
-        conn.close()
+    return sorted(
+        athlete_name
+        for athlete_name in get_reference_id_maps()["athlete"]
+        if athlete_name is not None
+    )
 
 
 # --------------------------------------------------
 # Velocity Bounds Helper
 # --------------------------------------------------
-@st.cache_data(ttl=300)
-def get_velocity_bounds(athlete_name, selected_dates):
+@st.cache_data(ttl=CACHE_TTL_SECONDS, show_spinner=False)
+def get_velocity_bounds(athlete_id, selected_dates):
     """
     Returns (min_velocity, max_velocity) for the selected pitcher and dates.
     Assumes pitch velocity is stored as `pitch_velo` on the takes table.
     """
-    if athlete_name is None:
+    if athlete_id is None:
         return None, None
 
-    conn = get_connection()
-    try:
-        with conn.cursor() as cur:
-            if not selected_dates or "All Dates" in selected_dates:
-                cur.execute("""
-                    SELECT MIN(t.pitch_velo), MAX(t.pitch_velo)
-                    FROM takes t
-                    JOIN athletes a ON a.athlete_id = t.athlete_id
-                    WHERE a.athlete_name = %s
-                      AND t.pitch_velo IS NOT NULL
-                """, (athlete_name,))
-            else:
-                placeholders = ",".join(["%s"] * len(selected_dates))
-                cur.execute(f"""
-                    SELECT MIN(t.pitch_velo), MAX(t.pitch_velo)
-                    FROM takes t
-                    JOIN athletes a ON a.athlete_id = t.athlete_id
-                    WHERE a.athlete_name = %s
-                      AND t.take_date IN ({placeholders})
-                      AND t.pitch_velo IS NOT NULL
-                """, (athlete_name, *selected_dates))
-
-            row = cur.fetchone()
-            return row if row else (None, None)
-    finally:
-        conn.close()
-
-@st.cache_data(ttl=300, show_spinner=False)
+    with pooled_cursor() as cur:
+        if not selected_dates or "All Dates" in selected_dates:
+            execute_prepared(cur, "velocity_bounds_all_dates", """
+                SELECT MIN(t.pitch_velo), MAX(t.pitch_velo)
+                FROM takes t
+                WHERE t.athlete_id = $1
+                  AND t.pitch_velo IS NOT NULL
+            """, (athlete_id,))
+        else:
+            execute_prepared(cur, "velocity_bounds_by_dates", """
+                SELECT MIN(t.pitch_velo), MAX(t.pitch_velo)
+                FROM takes t
+                WHERE t.athlete_id = $1
+                  AND t.take_date = ANY($2::date[])
+                  AND t.pitch_velo IS NOT NULL
+            """, (athlete_id, as_date_list(selected_dates)))
+
+        row = cur.fetchone()
+        return row if row else (None, None)
+
+@st.cache_data(ttl=CACHE_TTL_SECONDS, show_spinner=False)
 def get_control_group_take_pool(handedness_filter):
     """
     Returns control-group candidates from all takes in the database, optionally
     filtered by pitcher handedness.
     """
-    conn = get_connection()
-    try:
-        with conn.cursor() as cur:
-            params = []
-            handedness_clause = ""
-            if handedness_filter in ("R", "L"):
-                handedness_clause = "AND a.handedness = %s"
-                params.append(handedness_filter)
-
-            cur.execute(f"""
-                WITH ids AS (
-                    SELECT
-                        (SELECT category_id FROM categories WHERE category_name = 'KINETIC_KINEMATIC_CGVel') AS cat_kk_cgvel,
-                        (SELECT category_id FROM categories WHERE category_name = 'KINETIC_KINEMATIC_ProxEndPos') AS cat_kk_prox_pos,
-                        (SELECT category_id FROM categories WHERE category_name = 'KINETIC_KINEMATIC_DistEndPos') AS cat_kk_dist_endpos,
-                        (SELECT segment_id FROM segments WHERE segment_name = 'LHA') AS seg_hand_l,
-                        (SELECT segment_id FROM segments WHERE segment_name = 'RHA') AS seg_hand_r,
-                        (SELECT segment_id FROM segments WHERE segment_name = 'LAR') AS seg_arm_l,
-                        (SELECT segment_id FROM segments WHERE segment_name = 'RAR') AS seg_arm_r
-                ),
-                candidate_takes AS (
-                    SELECT
-                        t.take_id,
-                        t.pitch_velo,
-                        a.athlete_name,
-                        a.handedness,
-                        CASE WHEN a.handedness = 'L' THEN i.seg_hand_l ELSE i.seg_hand_r END AS seg_hand_dom,
-                        CASE WHEN a.handedness = 'L' THEN i.seg_arm_l ELSE i.seg_arm_r END AS seg_arm_dom,
-                        i.seg_hand_l,
-                        i.seg_hand_r,
-                        i.cat_kk_cgvel,
-                        i.cat_kk_prox_pos,
-                        i.cat_kk_dist_endpos
-                    FROM takes t
-                    JOIN athletes a ON a.athlete_id = t.athlete_id
-                    CROSS JOIN ids i
-                    WHERE t.pitch_velo IS NOT NULL
-                      AND t.throw_type = 'Mound'
-                      AND a.handedness IN ('R', 'L')
-                      {handedness_clause}
-                      AND EXISTS (
-                          SELECT 1
-                          FROM time_series_data d
-                          WHERE d.take_id = t.take_id
-                      )
-                ),
-                hand_vel AS (
-                    SELECT
-                        t.take_id,
-                        t.pitch_velo,
-                        t.handedness,
-                        d.frame,
-                        d.x_data,
-                        LAG(d.x_data) OVER (
-                            PARTITION BY t.take_id
-                            ORDER BY d.frame
-                        ) AS prev_x
-                    FROM time_series_data d
-                    JOIN candidate_takes t ON t.take_id = d.take_id
-                    WHERE d.category_id = t.cat_kk_cgvel
-                      AND d.segment_id IN (t.seg_hand_l, t.seg_hand_r)
-                      AND d.x_data IS NOT NULL
-                ),
-                cross_15 AS (
-                    SELECT DISTINCT ON (take_id)
-                        take_id,
-                        frame AS cross_frame
-                    FROM hand_vel
-                    WHERE x_data >= 15
-                      AND (prev_x < 15 OR prev_x IS NULL)
-                    ORDER BY take_id, frame
-                ),
-                positive_phase AS (
-                    SELECT
-                        h.take_id,
-                        h.frame,
-                        h.x_data,
-                        LAG(h.x_data, 5) OVER (
-                            PARTITION BY h.take_id
-                            ORDER BY h.frame
-                        ) AS prev_5_x,
-                        LEAD(h.x_data) OVER (
-                            PARTITION BY h.take_id
-                            ORDER BY h.frame
-                        ) AS next_x
-                    FROM hand_vel h
-                    JOIN cross_15 c ON c.take_id = h.take_id
-                    WHERE h.frame >= c.cross_frame
-                      AND h.x_data > 0
-                ),
-                per_take_br AS (
-                    SELECT DISTINCT ON (p.take_id)
-                        p.take_id,
-                        p.frame AS br_frame
-                    FROM positive_phase p
-                    WHERE p.next_x IS NOT NULL
-                      AND p.prev_5_x IS NOT NULL
-                      AND p.x_data > p.next_x
-                      AND p.x_data > p.prev_5_x
-                    ORDER BY p.take_id, p.frame ASC
-                ),
-                per_take_arm_points AS (
-                    SELECT
-                        br.take_id,
-                        MAX(CASE WHEN d_arm.segment_id = t.seg_arm_dom THEN d_arm.x_data END) AS x_arm,
-                        MAX(CASE WHEN d_arm.segment_id = t.seg_arm_dom THEN d_arm.y_data END) AS y_arm,
-                        MAX(CASE WHEN d_arm.segment_id = t.seg_arm_dom THEN d_arm.z_data END) AS z_arm,
-                        MAX(CASE WHEN d_hand.segment_id = t.seg_hand_dom THEN d_hand.x_data END) AS x_hand,
-                        MAX(CASE WHEN d_hand.segment_id = t.seg_hand_dom THEN d_hand.y_data END) AS y_hand,
-                        MAX(CASE WHEN d_hand.segment_id = t.seg_hand_dom THEN d_hand.z_data END) AS z_hand
-                    FROM per_take_br br
-                    JOIN candidate_takes t ON t.take_id = br.take_id
-                    LEFT JOIN time_series_data d_arm
-                        ON d_arm.take_id = br.take_id
-                       AND d_arm.frame = br.br_frame
-                       AND d_arm.category_id = t.cat_kk_prox_pos
-                       AND d_arm.segment_id = t.seg_arm_dom
-                    LEFT JOIN time_series_data d_hand
-                        ON d_hand.take_id = br.take_id
-                       AND d_hand.frame = br.br_frame
-                       AND d_hand.category_id = t.cat_kk_dist_endpos
-                       AND d_hand.segment_id = t.seg_hand_dom
-                    GROUP BY br.take_id
-                ),
-                per_take_arm_angle AS (
-                    SELECT
-                        p.take_id,
-                        CASE
-                            WHEN p.x_arm IS NULL OR p.x_hand IS NULL THEN NULL
-                            ELSE DEGREES(
-                                ATAN2(
-                                    (p.z_hand - p.z_arm),
-                                    NULLIF(SQRT(
-                                        POWER(p.x_hand - p.x_arm, 2) +
-                                        POWER(p.y_hand - p.y_arm, 2)
-                                    ), 0)
-                                )
-                            )
-                        END AS arm_slot_deg
-                    FROM per_take_arm_points p
-                )
+    with pooled_cursor() as cur:
+        params = []
+        handedness_clause = ""
+        if handedness_filter in ("R", "L"):
+            handedness_clause = "AND a.handedness = %s"
+            params.append(handedness_filter)
+
+        cur.execute(f"""
+            WITH ids AS (
+                SELECT
+                    (SELECT category_id FROM categories WHERE category_name = 'KINETIC_KINEMATIC_CGVel') AS cat_kk_cgvel,
+                    (SELECT category_id FROM categories WHERE category_name = 'KINETIC_KINEMATIC_ProxEndPos') AS cat_kk_prox_pos,
+                    (SELECT category_id FROM categories WHERE category_name = 'KINETIC_KINEMATIC_DistEndPos') AS cat_kk_dist_endpos,
+                    (SELECT segment_id FROM segments WHERE segment_name = 'LHA') AS seg_hand_l,
+                    (SELECT segment_id FROM segments WHERE segment_name = 'RHA') AS seg_hand_r,
+                    (SELECT segment_id FROM segments WHERE segment_name = 'LAR') AS seg_arm_l,
+                    (SELECT segment_id FROM segments WHERE segment_name = 'RAR') AS seg_arm_r
+            ),
+            candidate_takes AS (
+                SELECT
+                    t.take_id,
+                    t.pitch_velo,
+                    a.athlete_name,
+                    a.handedness,
+                    CASE WHEN a.handedness = 'L' THEN i.seg_hand_l ELSE i.seg_hand_r END AS seg_hand_dom,
+                    CASE WHEN a.handedness = 'L' THEN i.seg_arm_l ELSE i.seg_arm_r END AS seg_arm_dom,
+                    i.seg_hand_l,
+                    i.seg_hand_r,
+                    i.cat_kk_cgvel,
+                    i.cat_kk_prox_pos,
+                    i.cat_kk_dist_endpos
+                FROM takes t
+                JOIN athletes a ON a.athlete_id = t.athlete_id
+                CROSS JOIN ids i
+                WHERE t.pitch_velo IS NOT NULL
+                  AND t.throw_type = 'Mound'
+                  AND a.handedness IN ('R', 'L')
+                  {handedness_clause}
+                  AND EXISTS (
+                      SELECT 1
+                      FROM time_series_data d
+                      WHERE d.take_id = t.take_id
+                  )
+            ),
+            hand_vel AS (
                 SELECT
                     t.take_id,
                     t.pitch_velo,
-                    t.athlete_name,
                     t.handedness,
-                    a.arm_slot_deg
-                FROM candidate_takes t
-                LEFT JOIN per_take_arm_angle a ON a.take_id = t.take_id
-                ORDER BY t.take_id
-            """, tuple(params))
-            return cur.fetchall()
-    finally:
-        conn.close()
-
-@st.cache_data(ttl=300)
-def get_session_dates_for_pitcher(athlete_name):
+                    d.frame,
+                    d.x_data,
+                    LAG(d.x_data) OVER (
+                        PARTITION BY t.take_id
+                        ORDER BY d.frame
+                    ) AS prev_x
+                FROM time_series_data d
+                JOIN candidate_takes t ON t.take_id = d.take_id
+                WHERE d.category_id = t.cat_kk_cgvel
+                  AND d.segment_id IN (t.seg_hand_l, t.seg_hand_r)
+                  AND d.x_data IS NOT NULL
+            ),
+            cross_15 AS (
+                SELECT DISTINCT ON (take_id)
+                    take_id,
+                    frame AS cross_frame
+                FROM hand_vel
+                WHERE x_data >= 15
+                  AND (prev_x < 15 OR prev_x IS NULL)
+                ORDER BY take_id, frame
+            ),
+            positive_phase AS (
+                SELECT
+                    h.take_id,
+                    h.frame,
+                    h.x_data,
+                    LAG(h.x_data, 5) OVER (
+                        PARTITION BY h.take_id
+                        ORDER BY h.frame
+                    ) AS prev_5_x,
+                    LEAD(h.x_data) OVER (
+                        PARTITION BY h.take_id
+                        ORDER BY h.frame
+                    ) AS next_x
+                FROM hand_vel h
+                JOIN cross_15 c ON c.take_id = h.take_id
+                WHERE h.frame >= c.cross_frame
+                  AND h.x_data > 0
+            ),
+            per_take_br AS (
+                SELECT DISTINCT ON (p.take_id)
+                    p.take_id,
+                    p.frame AS br_frame
+                FROM positive_phase p
+                WHERE p.next_x IS NOT NULL
+                  AND p.prev_5_x IS NOT NULL
+                  AND p.x_data > p.next_x
+                  AND p.x_data > p.prev_5_x
+                ORDER BY p.take_id, p.frame ASC
+            ),
+            per_take_arm_points AS (
+                SELECT
+                    br.take_id,
+                    MAX(CASE WHEN d_arm.segment_id = t.seg_arm_dom THEN d_arm.x_data END) AS x_arm,
+                    MAX(CASE WHEN d_arm.segment_id = t.seg_arm_dom THEN d_arm.y_data END) AS y_arm,
+                    MAX(CASE WHEN d_arm.segment_id = t.seg_arm_dom THEN d_arm.z_data END) AS z_arm,
+                    MAX(CASE WHEN d_hand.segment_id = t.seg_hand_dom THEN d_hand.x_data END) AS x_hand,
+                    MAX(CASE WHEN d_hand.segment_id = t.seg_hand_dom THEN d_hand.y_data END) AS y_hand,
+                    MAX(CASE WHEN d_hand.segment_id = t.seg_hand_dom THEN d_hand.z_data END) AS z_hand
+                FROM per_take_br br
+                JOIN candidate_takes t ON t.take_id = br.take_id
+                LEFT JOIN time_series_data d_arm
+                    ON d_arm.take_id = br.take_id
+                   AND d_arm.frame = br.br_frame
+                   AND d_arm.category_id = t.cat_kk_prox_pos
+                   AND d_arm.segment_id = t.seg_arm_dom
+                LEFT JOIN time_series_data d_hand
+                    ON d_hand.take_id = br.take_id
+                   AND d_hand.frame = br.br_frame
+                   AND d_hand.category_id = t.cat_kk_dist_endpos
+                   AND d_hand.segment_id = t.seg_hand_dom
+                GROUP BY br.take_id
+            ),
+            per_take_arm_angle AS (
+                SELECT
+                    p.take_id,
+                    CASE
+                        WHEN p.x_arm IS NULL OR p.x_hand IS NULL THEN NULL
+                        ELSE DEGREES(
+                            ATAN2(
+                                (p.z_hand - p.z_arm),
+                                NULLIF(SQRT(
+                                    POWER(p.x_hand - p.x_arm, 2) +
+                                    POWER(p.y_hand - p.y_arm, 2)
+                                ), 0)
+                            )
+                        )
+                    END AS arm_slot_deg
+                FROM per_take_arm_points p
+            )
+            SELECT
+                t.take_id,
+                t.pitch_velo,
+                t.athlete_name,
+                t.handedness,
+                a.arm_slot_deg
+            FROM candidate_takes t
+            LEFT JOIN per_take_arm_angle a ON a.take_id = t.take_id
+            ORDER BY t.take_id
+        """, tuple(params))
+        return cur.fetchall()
+
+@st.cache_resource(ttl=CACHE_TTL_SECONDS, show_spinner=False)
+def get_session_dates_by_athlete():
+    """
+    Loads every pitcher's distinct session dates in one query, shared by all
+    sessions of the process.
+
+    Returns { athlete_id: ["YYYY-MM-DD", ...] } with dates in ascending order.
+    """
+    with pooled_cursor() as cur:
+        cur.execute("""
+            SELECT DISTINCT t.athlete_id, t.take_date
+            FROM takes t
+            ORDER BY t.athlete_id, t.take_date
+        """)
+        session_dates = {}
+        for athlete_id, take_date in cur.fetchall():
+            session_dates.setdefault(athlete_id, []).append(take_date.strftime("%Y-%m-%d"))
+    return session_dates
+
+
+def get_session_dates_for_pitcher(athlete_id):
     """
     Returns distinct session dates (take_date) for a given pitcher.
     """
-    if athlete_name is None:
+    if athlete_id is None:
         return []
 
-    conn = get_connection()
-    try:
-        with conn.cursor() as cur:
-            cur.execute("""
-                SELECT DISTINCT t.take_date
-                FROM takes t
-                JOIN athletes a ON a.athlete_id = t.athlete_id
-                WHERE a.athlete_name = %s
-                ORDER BY t.take_date
-            """, (athlete_name,))
-            return [row[0].strftime("%Y-%m-%d") for row in cur.fetchall()]
-    finally:
-        conn.close()
-
-@st.cache_data(ttl=300)
+    # Copy so callers cannot mutate the process-wide cached list.
+    return list(get_session_dates_by_athlete().get(athlete_id, ()))
+
 def get_pitcher_handedness(athlete_name):
     """
     Returns handedness ('R' or 'L') for a given pitcher.
@@ -465,1199 +702,663 @@ def get_pitcher_handedness(athlete_name):
     if athlete_name is None:
         return None
 
-    conn = get_connection()
-    try:
-        with conn.cursor() as cur:
-            cur.execute("""
-                SELECT handedness
-                FROM athletes
-                WHERE athlete_name = %s
-                LIMIT 1
-            """, (athlete_name,))
-            row = cur.fetchone()
-            return row[0] if row else None
-    finally:
-        conn.close()
-
-@st.cache_data(ttl=300)
-def get_pelvis_angular_velocity(take_ids):
-    """
-    Returns pelvis angular velocity (z_data) over frames for given take_ids.
-    """
-    if not take_ids:
-        return {}
+    athlete = get_reference_id_maps()["athlete"].get(athlete_name)
+    return athlete["handedness"] if athlete else None
 
-    conn = get_connection()
-    try:
-        with conn.cursor() as cur:
-            placeholders = ",".join(["%s"] * len(take_ids))
-            cur.execute(f"""
-                SELECT
-                    ts.take_id,
-                    ts.frame,
-                    ts.z_data
-                FROM time_series_data ts
-                JOIN categories c ON ts.category_id = c.category_id
-                JOIN segments s ON ts.segment_id = s.segment_id
-                WHERE c.category_name = 'ORIGINAL'
-                  AND s.segment_name = 'PELVIS_ANGULAR_VELOCITY'
-                  AND ts.take_id IN ({placeholders})
-                ORDER BY ts.take_id, ts.frame
-            """, tuple(take_ids))
-
-            rows = cur.fetchall()
-
-            data = {}
-            for take_id, frame, z in rows:
-                data.setdefault(take_id, {"frame": [], "z": []})
-                data[take_id]["frame"].append(frame)
-                data[take_id]["z"].append(z)
-
-            return data
-    finally:
-        conn.close()
 
-# --------------------------------------------------
-# Torso Angular Velocity (Z) helper
-# --------------------------------------------------
-
-@st.cache_data(ttl=300)
-def get_torso_angular_velocity(take_ids):
+def get_athlete_id(athlete_name):
     """
-    Returns torso angular velocity (z_data) over frames for given take_ids.
-    Category: ORIGINAL
-    Segment: TORSO_ANGULAR_VELOCITY
+    Returns the athlete_id for a pitcher name, or None if it is unknown.
     """
-    if not take_ids:
-        return {}
-
-    conn = get_connection()
-    try:
-        with conn.cursor() as cur:
-            placeholders = ",".join(["%s"] * len(take_ids))
-            cur.execute(f"""
-                SELECT
-                    ts.take_id,
-                    ts.frame,
-                    ts.z_data
-                FROM time_series_data ts
-                JOIN categories c ON ts.category_id = c.category_id
-                JOIN segments s ON ts.segment_id = s.segment_id
-                WHERE c.category_name = 'ORIGINAL'
-                  AND s.segment_name = 'TORSO_ANGULAR_VELOCITY'
-                  AND ts.take_id IN ({placeholders})
-                ORDER BY ts.take_id, ts.frame
-            """, tuple(take_ids))
-
-            rows = cur.fetchall()
-
-            data = {}
-            for take_id, frame, z in rows:
-                data.setdefault(take_id, {"frame": [], "z": []})
-                data[take_id]["frame"].append(frame)
-                data[take_id]["z"].append(z)
+    athlete = get_reference_id_maps()["athlete"].get(athlete_name)
+    return athlete["athlete_id"] if athlete else None
 
-            return data
-    finally:
-        conn.close()
 
-# --------------------------------------------------
-# Torso-Pelvis Angular Velocity (Z) helper
-# --------------------------------------------------
-@st.cache_data(ttl=300)
-def get_torso_pelvis_angular_velocity(take_ids):
+@st.cache_resource(ttl=LOOKUP_CACHE_TTL_SECONDS, show_spinner=False)
+def get_reference_id_maps():
     """
-    Returns torso-pelvis angular velocity (z_data) over frames for given take_ids.
-    Category: ORIGINAL
-    Segment: TORSO_PELVIS_ANGULAR_VELOCITY
+    Loads the small lookup tables once per process so time series queries can
+    filter on integer ids instead of joining categories / segments by name.
+
+    Returns {
+        "athlete": { athlete_name: {"athlete_id": int, "handedness": str} },
+        "category": { category_name: category_id },
+        "segment": { segment_name: segment_id },
+    }
     """
-    if not take_ids:
-        return {}
+    with pooled_cursor() as cur:
+        cur.execute("""
+            SELECT athlete_id, athlete_name, handedness
+            FROM athletes
+            ORDER BY athlete_id
+        """)
+        athletes = {}
+        for athlete_id, athlete_name, handedness in cur.fetchall():
+            athletes.setdefault(athlete_name, {"athlete_id": athlete_id, "handedness": handedness})
 
-    conn = get_connection()
-    try:
-        with conn.cursor() as cur:
-            placeholders = ",".join(["%s"] * len(take_ids))
-            cur.execute(f"""
-                SELECT
-                    ts.take_id,
-                    ts.frame,
-                    ts.z_data
-                FROM time_series_data ts
-                JOIN categories c ON ts.category_id = c.category_id
-                JOIN segments s ON ts.segment_id = s.segment_id
-                WHERE c.category_name = 'ORIGINAL'
-                  AND s.segment_name = 'TORSO_PELVIS_ANGULAR_VELOCITY'
-                  AND ts.take_id IN ({placeholders})
-                ORDER BY ts.take_id, ts.frame
-            """, tuple(take_ids))
-
-            rows = cur.fetchall()
-
-            data = {}
-            for take_id, frame, z in rows:
-                data.setdefault(take_id, {"frame": [], "z": []})
-                data[take_id]["frame"].append(frame)
-                data[take_id]["z"].append(z)
+        cur.execute("SELECT category_id, category_name FROM categories")
+        categories = {name: category_id for category_id, name in cur.fetchall()}
+
+        cur.execute("SELECT segment_id, segment_name FROM segments")
+        segments = {name: segment_id for segment_id, name in cur.fetchall()}
+
+    return {"athlete": athletes, "category": categories, "segment": segments}
 
-            return data
-    finally:
-        conn.close()
 
 # --------------------------------------------------
-# Elbow Angular Velocity (X) helper
+# Concurrent loading
 # --------------------------------------------------
-@st.cache_data(ttl=300)
-def get_elbow_angular_velocity(take_ids, handedness):
+
+
+def run_loaders_concurrently(loaders):
     """
-    Returns elbow angular velocity (x_data) over frames for given take_ids.
+    Runs independent loader calls in parallel and returns their results by name.
 
-    Category: ORIGINAL
-    Segments:
-      RHP → RT_ELBOW_ANGULAR_VELOCITY
-      LHP → LT_ELBOW_ANGULAR_VELOCITY
+    loaders: { name: zero-argument callable }
+    Each call checks its own connection out of the pool; psycopg2 releases the
+    GIL while waiting on the socket, so the round trips overlap. Calls made
+    from inside a loader thread run inline instead of fanning out again, so
+    nested loaders never wait on the shared pool they are occupying.
     """
-    if not take_ids or handedness not in ("R", "L"):
-        return {}
+    if len(loaders) <= 1 or in_loader_thread():
+        return {name: load() for name, load in loaders.items()}
 
-    segment_name = (
-        "RT_ELBOW_ANGULAR_VELOCITY"
-        if handedness == "R"
-        else "LT_ELBOW_ANGULAR_VELOCITY"
-    )
+    ctx = get_script_run_ctx()
 
-    conn = get_connection()
-    try:
-        with conn.cursor() as cur:
-            placeholders = ",".join(["%s"] * len(take_ids))
-            cur.execute(f"""
-                SELECT
-                    ts.take_id,
-                    ts.frame,
-                    ts.x_data
-                FROM time_series_data ts
-                JOIN categories c ON ts.category_id = c.category_id
-                JOIN segments s ON ts.segment_id = s.segment_id
-                WHERE c.category_name = 'ORIGINAL'
-                  AND s.segment_name = %s
-                  AND ts.take_id IN ({placeholders})
-                ORDER BY ts.take_id, ts.frame
-            """, (segment_name, *take_ids))
-
-            rows = cur.fetchall()
-
-            data = {}
-            for take_id, frame, x in rows:
-                data.setdefault(take_id, {"frame": [], "x": []})
-                data[take_id]["frame"].append(frame)
-                data[take_id]["x"].append(x)
+    def run(load):
+        add_script_run_ctx(threading.current_thread(), ctx)
+        return load()
 
-            return data
-    finally:
-        conn.close()
+    executor = get_loader_executor()
+    futures = {name: executor.submit(run, load) for name, load in loaders.items()}
+    return {name: future.result() for name, future in futures.items()}
 
-@st.cache_data(ttl=300)
-def get_elbow_flexion_angle(take_ids, handedness):
-    """
-    Returns elbow flexion angle (x_data) for the throwing elbow.
 
-    Category: ORIGINAL
-    Segments:
-      RHP → RT_ELBOW_ANGLE
-      LHP → LT_ELBOW_ANGLE
+def load_merged_by_handedness(loader_fn, take_ids_by_handedness):
     """
-    if not take_ids or handedness not in ("R", "L"):
-        return {}
+    Calls loader_fn(ids, hand) for every handedness group concurrently and
+    merges the per-take results in group order.
+    """
+    results = run_loaders_concurrently({
+        hand: functools.partial(loader_fn, ids, hand)
+        for hand, ids in take_ids_by_handedness.items()
+        if ids
+    })
+    merged = {}
+    for result in results.values():
+        merged.update(result)
+    return merged
+
+
+TIME_SERIES_COMPONENTS = ("x", "y", "z")
+TIME_SERIES_BATCH_COLUMNS = {
+    "category_id": "int4",
+    "segment_id": "int4",
+    "take_id": "int8",
+    "frame": "int4",
+    "x": "float8",
+    "y": "float8",
+    "z": "float8",
+}
 
-    segment_name = (
-        "RT_ELBOW_ANGLE"
-        if handedness == "R"
-        else "LT_ELBOW_ANGLE"
-    )
+# Big-endian wire layout of the fixed-width types COPY ... (FORMAT BINARY) emits
+PG_BINARY_DTYPES = {
+    "int4": ">i4",
+    "int8": ">i8",
+    "float8": ">f8",
+}
+PG_BINARY_COPY_HEADER_SIZE = 19  # 11-byte signature + flags + extension length
 
-    conn = get_connection()
-    try:
-        with conn.cursor() as cur:
-            placeholders = ",".join(["%s"] * len(take_ids))
-            cur.execute(f"""
-                SELECT
-                    ts.take_id,
-                    ts.frame,
-                    ts.x_data
-                FROM time_series_data ts
-                JOIN categories c ON ts.category_id = c.category_id
-                JOIN segments s ON ts.segment_id = s.segment_id
-                WHERE c.category_name = 'ORIGINAL'
-                  AND s.segment_name = %s
-                  AND ts.take_id IN ({placeholders})
-                ORDER BY ts.take_id, ts.frame
-            """, (segment_name, *take_ids))
-
-            rows = cur.fetchall()
-
-            data = {}
-            for take_id, frame, x in rows:
-                data.setdefault(take_id, {"frame": [], "value": []})
-                data[take_id]["frame"].append(frame)
-                data[take_id]["value"].append(x)
 
-            return data
-    finally:
-        conn.close()
-
-# --- SHOULDER EXTERNAL ROTATION ANGLE helper ---
-@st.cache_data(ttl=300)
-def get_shoulder_er_angle(take_ids, handedness):
+def parse_pg_binary_copy(payload, columns):
     """
-    Returns shoulder external rotation angle (z_data) for the throwing shoulder.
+    Decodes a COPY ... (FORMAT BINARY) payload of fixed-width, non-NULL columns
+    into native NumPy arrays with a single np.frombuffer over the tuple stream.
 
-    Category: ORIGINAL
-    Segments:
-      RHP → RT_SHOULDER_ANGLE
-      LHP → LT_SHOULDER_ANGLE
+    columns: { name: pg type } in SELECT order, types from PG_BINARY_DTYPES
+    Returns { name: ndarray }
     """
-    if not take_ids:
-        return {}
+    extension_size = int.from_bytes(payload[15:PG_BINARY_COPY_HEADER_SIZE], "big")
+    # Tuples sit between the header and the 2-byte end-of-data marker
+    body = payload[PG_BINARY_COPY_HEADER_SIZE + extension_size:-2]
 
-    segment = "RT_SHOULDER" if handedness == "R" else "LT_SHOULDER"
+    fields = [("field_count", ">i2")]
+    for name, pg_type in columns.items():
+        fields.append((f"{name}_size", ">i4"))
+        fields.append((name, PG_BINARY_DTYPES[pg_type]))
+    row_dtype = np.dtype(fields)
 
-    conn = get_connection()
-    try:
-        with conn.cursor() as cur:
-            placeholders = ",".join(["%s"] * len(take_ids))
-            cur.execute(f"""
-                    SELECT
-                        ts.take_id,
-                        ts.frame,
-                        ts.z_data
-                    FROM time_series_data ts
-                    JOIN categories c ON ts.category_id = c.category_id
-                    JOIN segments s ON ts.segment_id = s.segment_id
-                    WHERE c.category_name = 'JOINT_ANGLES'
-                      AND s.segment_name = %s
-                      AND ts.take_id IN ({placeholders})
-                      AND ts.z_data IS NOT NULL
-                    ORDER BY ts.take_id, ts.frame
-                """, (segment, *take_ids))
-
-            rows = cur.fetchall()
-
-            data = {}
-            for take_id, frame, z in rows:
-                data.setdefault(take_id, {"frame": [], "value": []})
-                data[take_id]["frame"].append(frame)
-                data[take_id]["value"].append(z)
+    if len(body) % row_dtype.itemsize:
+        raise ValueError("COPY payload does not match the expected fixed-width columns")
+    rows = np.frombuffer(body, dtype=row_dtype)
+    if not (rows["field_count"] == len(columns)).all():
+        raise ValueError("COPY payload does not match the expected fixed-width columns")
+    for name in columns:
+        if not (rows[f"{name}_size"] == row_dtype[name].itemsize).all():
+            raise ValueError(f"COPY column {name} contains NULLs or has an unexpected width")
 
-            return data
-    finally:
-        conn.close()
+    return {name: rows[name].astype(row_dtype[name].newbyteorder("=")) for name in columns}
 
-# --- SHOULDER ABDUCTION ANGLE helper ---
 
-@st.cache_data(ttl=300)
-def get_shoulder_abduction_angle(take_ids, handedness):
+def copy_query_to_frame(cur, query, params, columns):
     """
-    Returns shoulder abduction angle (y_data) for the throwing shoulder.
+    Runs a SELECT through COPY ... TO STDOUT WITH (FORMAT BINARY) and decodes
+    the stream straight into a pandas DataFrame of NumPy column buffers,
+    skipping both per-row Python tuples and text parsing.
 
-    Category: JOINT_ANGLES
-    Segments:
-      RHP → RT_SHOULDER
-      LHP → LT_SHOULDER
+    columns: { name: pg type } matching the SELECT list. Every column must be
+    cast to that type in SQL and must not be NULL (COALESCE floats to 'NaN').
     """
-    if not take_ids or handedness not in ("R", "L"):
-        return {}
+    import io
+    import pandas as pd
 
-    segment_name = (
-        "RT_SHOULDER"
-        if handedness == "R"
-        else "LT_SHOULDER"
-    )
+    select_sql = cur.mogrify(query, params).decode()
+    buffer = io.BytesIO()
+    cur.copy_expert(f"COPY ({select_sql}) TO STDOUT WITH (FORMAT BINARY)", buffer)
+    return pd.DataFrame(parse_pg_binary_copy(buffer.getvalue(), columns))
 
-    conn = get_connection()
-    try:
-        with conn.cursor() as cur:
-            placeholders = ",".join(["%s"] * len(take_ids))
-            cur.execute(f"""
-                SELECT
-                    ts.take_id,
-                    ts.frame,
-                    ts.y_data
-                FROM time_series_data ts
-                JOIN categories c ON ts.category_id = c.category_id
-                JOIN segments s ON ts.segment_id = s.segment_id
-                WHERE c.category_name = 'JOINT_ANGLES'
-                  AND s.segment_name = %s
-                  AND ts.take_id IN ({placeholders})
-                ORDER BY ts.take_id, ts.frame
-            """, (segment_name, *take_ids))
-
-            rows = cur.fetchall()
-
-            data = {}
-            for take_id, frame, y in rows:
-                data.setdefault(take_id, {"frame": [], "value": []})
-                data[take_id]["frame"].append(frame)
-                data[take_id]["value"].append(y)
 
-            return data
-    finally:
-        conn.close()
+def numpy_column_to_list(values):
+    """
+    Converts a float array back to a Python list, restoring NULLs (NaN) as None.
+    """
+    missing = np.isnan(values)
+    if missing.any():
+        return np.where(missing, None, values).tolist()
+    return values.tolist()
 
-# --- SHOULDER HORIZONTAL ABDUCTION ANGLE helper ---
 
-@st.cache_data(ttl=300)
-def get_front_knee_flexion_angle(take_ids, handedness):
+def get_time_series_batch(take_ids, series_keys, frame_windows=None):
     """
-    Returns front (lead) knee flexion angle (x_data).
+    Returns raw x/y/z time series for several (category, segment) pairs in one query.
 
-    Category: ORIGINAL
-    Segments:
-      RHP → LT_KNEE_ANGLE
-      LHP → RT_KNEE_ANGLE
+    Names are resolved to ids through get_reference_id_maps(), so the query reads
+    time_series_data alone and can be served by its
+    (category_id, segment_id, take_id, frame) index.
+
+    series_keys: sequence of (category_name, segment_name) pairs
+    frame_windows: optional { take_id: (first_frame, last_frame) }; when given, only
+      frames inside each take's window are read and takes without a window are skipped
+    Returns { (category_name, segment_name): { take_id: {"frame": ndarray, "x": ndarray, "y": ndarray, "z": ndarray} } }
+
+    Frames are int32 and components float64, with NULLs kept as NaN. The arrays
+    are read-only views into the cached column buffers.
     """
-    if not take_ids or handedness not in ("R", "L"):
+    series_keys = tuple(dict.fromkeys(tuple(key) for key in series_keys))
+    if not take_ids or not series_keys:
         return {}
 
-    segment_name = (
-        "LT_KNEE_ANGLE"
-        if handedness == "R"
-        else "RT_KNEE_ANGLE"
-    )
+    # Shallow copy so callers can reshape the per-series dicts without touching
+    # the process-wide cache entry; the arrays themselves are shared.
+    if frame_windows is None:
+        take_ids_key = tuple(sorted(set(take_ids)))
+        windows_key = None
+    else:
+        take_ids_key = tuple(sorted(
+            take_id for take_id in set(take_ids) if frame_windows.get(take_id) is not None
+        ))
+        if not take_ids_key:
+            return {key: {} for key in series_keys}
+        windows_key = tuple(
+            (int(frame_windows[take_id][0]), int(frame_windows[take_id][1]))
+            for take_id in take_ids_key
+        )
 
-    conn = get_connection()
-    try:
-        with conn.cursor() as cur:
-            placeholders = ",".join(["%s"] * len(take_ids))
-            cur.execute(f"""
-                SELECT
-                    ts.take_id,
-                    ts.frame,
-                    ts.x_data
-                FROM time_series_data ts
-                JOIN categories c ON ts.category_id = c.category_id
-                JOIN segments s ON ts.segment_id = s.segment_id
-                WHERE c.category_name = 'ORIGINAL'
-                  AND s.segment_name = %s
-                  AND ts.take_id IN ({placeholders})
-                ORDER BY ts.take_id, ts.frame
-            """, (segment_name, *take_ids))
-
-            rows = cur.fetchall()
-
-            data = {}
-            for take_id, frame, x in rows:
-                data.setdefault(take_id, {"frame": [], "value": []})
-                data[take_id]["frame"].append(frame)
-                data[take_id]["value"].append(x)
+    cached = _load_time_series_batch(take_ids_key, series_keys, windows_key)
+    return {key: dict(by_take) for key, by_take in cached.items()}
 
-            return data
-    finally:
-        conn.close()
 
-# --- FRONT KNEE EXTENSION VELOCITY helper ---
-@st.cache_data(ttl=300)
-def get_front_knee_extension_velocity(take_ids, handedness):
+@st.cache_resource(ttl=CACHE_TTL_SECONDS, max_entries=64, show_spinner=False)
+def _load_time_series_batch(take_ids_key, series_keys, windows_key=None):
     """
-    Returns front (lead) knee angular velocity (x_data).
+    Process-wide cache behind get_time_series_batch().
 
-    Category: ORIGINAL
-    Segments:
-      RHP → LT_KNEE_ANGULAR_VELOCITY
-      LHP → RT_KNEE_ANGULAR_VELOCITY
+    st.cache_resource hands back the stored object itself, so cache hits skip
+    the pickle round-trip st.cache_data does for these large array payloads.
+    take_ids_key is the sorted tuple of take ids, so the same set of takes hits
+    the same entry regardless of selection order. windows_key holds the
+    (first_frame, last_frame) pair for each take, aligned with take_ids_key.
     """
-    if not take_ids or handedness not in ("R", "L"):
-        return {}
+    data = {key: {} for key in series_keys}
 
-    segment_name = (
-        "LT_KNEE_ANGULAR_VELOCITY"
-        if handedness == "R"
-        else "RT_KNEE_ANGULAR_VELOCITY"
-    )
+    id_maps = get_reference_id_maps()
+    keys_by_id = {}
+    for category_name, segment_name in series_keys:
+        category_id = id_maps["category"].get(category_name)
+        segment_id = id_maps["segment"].get(segment_name)
+        if category_id is not None and segment_id is not None:
+            keys_by_id[(category_id, segment_id)] = (category_name, segment_name)
+    if not keys_by_id:
+        return data
 
-    conn = get_connection()
-    try:
-        with conn.cursor() as cur:
-            placeholders = ",".join(["%s"] * len(take_ids))
-            cur.execute(f"""
-                SELECT
-                    ts.take_id,
-                    ts.frame,
-                    ts.x_data
-                FROM time_series_data ts
-                JOIN categories c ON ts.category_id = c.category_id
-                JOIN segments s ON ts.segment_id = s.segment_id
-                WHERE c.category_name = 'ORIGINAL'
-                  AND s.segment_name = %s
-                  AND ts.take_id IN ({placeholders})
-                ORDER BY ts.take_id, ts.frame
-            """, (segment_name, *take_ids))
-
-            rows = cur.fetchall()
-
-            data = {}
-            for take_id, frame, x in rows:
-                data.setdefault(take_id, {"frame": [], "value": []})
-                data[take_id]["frame"].append(frame)
-                data[take_id]["value"].append(x)
+    if windows_key is None:
+        window_join = ""
+        take_clause = "AND ts.take_id = ANY(%s::bigint[])"
+        params = (tuple(keys_by_id), list(take_ids_key))
+    else:
+        window_join = """
+            JOIN unnest(%s::bigint[], %s::int[], %s::int[]) AS w(take_id, first_frame, last_frame)
+              ON w.take_id = ts.take_id
+             AND ts.frame BETWEEN w.first_frame AND w.last_frame
+        """
+        take_clause = ""
+        params = (
+            list(take_ids_key),
+            [first_frame for first_frame, _ in windows_key],
+            [last_frame for _, last_frame in windows_key],
+            tuple(keys_by_id),
+        )
 
-            return data
-    finally:
-        conn.close()
+    with pooled_cursor() as cur:
+        rows = copy_query_to_frame(cur, f"""
+            SELECT
+                ts.category_id::int4,
+                ts.segment_id::int4,
+                ts.take_id::int8,
+                ts.frame::int4,
+                COALESCE(ts.x_data, 'NaN')::float8,
+                COALESCE(ts.y_data, 'NaN')::float8,
+                COALESCE(ts.z_data, 'NaN')::float8
+            FROM time_series_data ts
+            {window_join}
+            WHERE (ts.category_id, ts.segment_id) IN %s
+              {take_clause}
+            ORDER BY ts.category_id, ts.segment_id, ts.take_id, ts.frame
+        """, params, TIME_SERIES_BATCH_COLUMNS)
+
+    if rows.empty:
+        return data
+
+    frames = rows["frame"].to_numpy(dtype=np.int32)
+    components = {
+        component: rows[component].to_numpy(dtype=np.float64)
+        for component in TIME_SERIES_COMPONENTS
+    }
+    # Cached buffers are shared by every session, so lock them against writes.
+    for values in (frames, *components.values()):
+        values.flags.writeable = False
+
+    # Rows arrive sorted by (category_id, segment_id, take, frame), so every take's
+    # series is one contiguous slice of the column buffers.
+    group_positions = rows.groupby(
+        ["category_id", "segment_id", "take_id"], sort=False
+    ).indices
+    for (category_id, segment_id, take_id), positions in group_positions.items():
+        start, stop = positions[0], positions[-1] + 1
+        series_key = keys_by_id[(int(category_id), int(segment_id))]
+        data[series_key][int(take_id)] = {
+            "frame": frames[start:stop],
+            **{
+                component: values[start:stop]
+                for component, values in components.items()
+            },
+        }
 
-@st.cache_data(ttl=300)
-def get_shoulder_horizontal_abduction_angle(take_ids, handedness):
+    return data
+
+
+def select_time_series_component(series, component, value_key="value", drop_null=False, as_arrays=False):
     """
-    Returns shoulder horizontal abduction angle (x_data) for the throwing shoulder.
+    Projects one component out of a get_time_series_batch() entry into the
+    { take_id: {"frame": [...], value_key: [...]} } shape the loaders return.
 
-    Category: JOINT_ANGLES
-    Segments:
-      RHP → RT_SHOULDER
-      LHP → LT_SHOULDER
+    With as_arrays=True the frame / value entries stay NumPy arrays (int32 / float64,
+    NULLs as NaN); otherwise they are converted to lists with NULLs as None.
     """
-    if not take_ids or handedness not in ("R", "L"):
-        return {}
+    data = {}
+    for take_id, d in series.items():
+        frames = d["frame"]
+        values = d[component]
+        if drop_null:
+            present = ~np.isnan(values)
+            if not present.any():
+                continue
+            if not present.all():
+                frames = frames[present]
+                values = values[present]
+        if as_arrays:
+            data[take_id] = {"frame": frames, value_key: values}
+        else:
+            data[take_id] = {"frame": frames.tolist(), value_key: numpy_column_to_list(values)}
+    return data
 
-    segment_name = (
-        "RT_SHOULDER"
-        if handedness == "R"
-        else "LT_SHOULDER"
-    )
 
-    conn = get_connection()
-    try:
-        with conn.cursor() as cur:
-            placeholders = ",".join(["%s"] * len(take_ids))
-            cur.execute(f"""
-                SELECT
-                    ts.take_id,
-                    ts.frame,
-                    ts.x_data
-                FROM time_series_data ts
-                JOIN categories c ON ts.category_id = c.category_id
-                JOIN segments s ON ts.segment_id = s.segment_id
-                WHERE c.category_name = 'JOINT_ANGLES'
-                  AND s.segment_name = %s
-                  AND ts.take_id IN ({placeholders})
-                ORDER BY ts.take_id, ts.frame
-            """, (segment_name, *take_ids))
-
-            rows = cur.fetchall()
-
-            data = {}
-            for take_id, frame, x in rows:
-                data.setdefault(take_id, {"frame": [], "value": []})
-                data[take_id]["frame"].append(frame)
-                data[take_id]["value"].append(x)
+def load_time_series_xyz(take_ids, category_name, segment_name):
+    """
+    Loads all three components of a single (category, segment) series through
+    the batched loader as { take_id: {"frame": [...], "x": [...], "y": [...], "z": [...]} }.
+    """
+    batch = get_time_series_batch(take_ids, ((category_name, segment_name),))
+    return {
+        take_id: {
+            "frame": d["frame"].tolist(),
+            "x": numpy_column_to_list(d["x"]),
+            "y": numpy_column_to_list(d["y"]),
+            "z": numpy_column_to_list(d["z"]),
+        }
+        for take_id, d in batch.get((category_name, segment_name), {}).items()
+    }
 
-            return data
-    finally:
-        conn.close()
 
-# --- TORSO ANGLE COMPONENTS helper ---
-@st.cache_data(ttl=300)
-def get_torso_angle_components(take_ids):
+def load_time_series_component(take_ids, category_name, segment_name, component, value_key="value", drop_null=False, as_arrays=False):
     """
-    Returns torso angle components for each take.
+    Loads one component of a single (category, segment) series through the batched loader.
+    """
+    batch = get_time_series_batch(take_ids, ((category_name, segment_name),))
+    return select_time_series_component(
+        batch.get((category_name, segment_name), {}),
+        component,
+        value_key=value_key,
+        drop_null=drop_null,
+        as_arrays=as_arrays,
+    )
 
-    Category: ORIGINAL
-    Segment: TORSO_ANGLE
 
-    Components:
-      x_data → Forward Trunk Tilt
-      y_data → Lateral Trunk Tilt
-      z_data → Trunk Angle
+def get_pelvis_angular_velocity(take_ids):
+    """
+    Returns pelvis angular velocity (z_data) over frames for given take_ids.
     """
     if not take_ids:
         return {}
 
-    conn = get_connection()
-    try:
-        with conn.cursor() as cur:
-            placeholders = ",".join(["%s"] * len(take_ids))
-            cur.execute(f"""
-                SELECT
-                    ts.take_id,
-                    ts.frame,
-                    ts.x_data,
-                    ts.y_data,
-                    ts.z_data
-                FROM time_series_data ts
-                JOIN categories c ON ts.category_id = c.category_id
-                JOIN segments s ON ts.segment_id = s.segment_id
-                WHERE c.category_name = 'ORIGINAL'
-                  AND s.segment_name = 'TORSO_ANGLE'
-                  AND ts.take_id IN ({placeholders})
-                ORDER BY ts.take_id, ts.frame
-            """, tuple(take_ids))
-
-            rows = cur.fetchall()
-
-            data = {}
-            for take_id, frame, x, y, z in rows:
-                data.setdefault(take_id, {
-                    "frame": [],
-                    "x": [],
-                    "y": [],
-                    "z": []
-                })
-                data[take_id]["frame"].append(frame)
-                data[take_id]["x"].append(x)
-                data[take_id]["y"].append(y)
-                data[take_id]["z"].append(z)
+    return load_time_series_component(
+        take_ids,
+        "ORIGINAL",
+        "PELVIS_ANGULAR_VELOCITY",
+        "z",
+        value_key="z",
+    )
 
-            return data
-    finally:
-        conn.close()
+# --------------------------------------------------
+# Torso Angular Velocity (Z) helper
+# --------------------------------------------------
 
-@st.cache_data(ttl=300)
-def get_pelvis_angle(take_ids):
+def get_torso_angular_velocity(take_ids):
     """
-    Returns pelvis angle (z_data).
-
+    Returns torso angular velocity (z_data) over frames for given take_ids.
     Category: ORIGINAL
-    Segment: PELVIS_ANGLE
+    Segment: TORSO_ANGULAR_VELOCITY
     """
     if not take_ids:
         return {}
 
-    conn = get_connection()
-    try:
-        with conn.cursor() as cur:
-            placeholders = ",".join(["%s"] * len(take_ids))
-            cur.execute(f"""
-                SELECT
-                    ts.take_id,
-                    ts.frame,
-                    ts.z_data
-                FROM time_series_data ts
-                JOIN categories c ON ts.category_id = c.category_id
-                JOIN segments s ON ts.segment_id = s.segment_id
-                WHERE c.category_name = 'ORIGINAL'
-                  AND s.segment_name = 'PELVIS_ANGLE'
-                  AND ts.take_id IN ({placeholders})
-                ORDER BY ts.take_id, ts.frame
-            """, tuple(take_ids))
-
-            rows = cur.fetchall()
-
-            data = {}
-            for take_id, frame, z in rows:
-                data.setdefault(take_id, {"frame": [], "value": []})
-                data[take_id]["frame"].append(frame)
-                data[take_id]["value"].append(z)
-
-            return data
-    finally:
-        conn.close()
-
+    return load_time_series_component(
+        take_ids,
+        "ORIGINAL",
+        "TORSO_ANGULAR_VELOCITY",
+        "z",
+        value_key="z",
+    )
 
-@st.cache_data(ttl=300)
-def get_pelvic_lateral_tilt(take_ids):
+# --------------------------------------------------
+# Torso-Pelvis Angular Velocity (Z) helper
+# --------------------------------------------------
+def get_torso_pelvis_angular_velocity(take_ids):
     """
-    Returns pelvic lateral tilt from pelvis angle (y_data).
-
+    Returns torso-pelvis angular velocity (z_data) over frames for given take_ids.
     Category: ORIGINAL
-    Segment: PELVIS_ANGLE
+    Segment: TORSO_PELVIS_ANGULAR_VELOCITY
     """
     if not take_ids:
         return {}
 
-    conn = get_connection()
-    try:
-        with conn.cursor() as cur:
-            placeholders = ",".join(["%s"] * len(take_ids))
-            cur.execute(f"""
-                SELECT
-                    ts.take_id,
-                    ts.frame,
-                    ts.y_data
-                FROM time_series_data ts
-                JOIN categories c ON ts.category_id = c.category_id
-                JOIN segments s ON ts.segment_id = s.segment_id
-                WHERE c.category_name = 'ORIGINAL'
-                  AND s.segment_name = 'PELVIS_ANGLE'
-                  AND ts.take_id IN ({placeholders})
-                ORDER BY ts.take_id, ts.frame
-            """, tuple(take_ids))
-
-            rows = cur.fetchall()
-
-            data = {}
-            for take_id, frame, y in rows:
-                data.setdefault(take_id, {"frame": [], "value": []})
-                data[take_id]["frame"].append(frame)
-                data[take_id]["value"].append(y)
-
-            return data
-    finally:
-        conn.close()
-
+    return load_time_series_component(
+        take_ids,
+        "ORIGINAL",
+        "TORSO_PELVIS_ANGULAR_VELOCITY",
+        "z",
+        value_key="z",
+    )
 
-@st.cache_data(ttl=300)
-def get_hip_shoulder_separation(take_ids):
+# --------------------------------------------------
+# Elbow Angular Velocity (X) helper
+# --------------------------------------------------
+def get_elbow_angular_velocity(take_ids, handedness):
     """
-    Returns hip–shoulder separation angle (z_data).
+    Returns elbow angular velocity (x_data) over frames for given take_ids.
 
     Category: ORIGINAL
-    Segment: TORSO_PELVIS_ANGLE
+    Segments:
+      RHP → RT_ELBOW_ANGULAR_VELOCITY
+      LHP → LT_ELBOW_ANGULAR_VELOCITY
     """
-    if not take_ids:
+    if not take_ids or handedness not in ("R", "L"):
         return {}
 
-    conn = get_connection()
-    try:
-        with conn.cursor() as cur:
-            placeholders = ",".join(["%s"] * len(take_ids))
-            cur.execute(f"""
-                SELECT
-                    ts.take_id,
-                    ts.frame,
-                    ts.z_data
-                FROM time_series_data ts
-                JOIN categories c ON ts.category_id = c.category_id
-                JOIN segments s ON ts.segment_id = s.segment_id
-                WHERE c.category_name = 'ORIGINAL'
-                  AND s.segment_name = 'TORSO_PELVIS_ANGLE'
-                  AND ts.take_id IN ({placeholders})
-                ORDER BY ts.take_id, ts.frame
-            """, tuple(take_ids))
-
-            rows = cur.fetchall()
-
-            data = {}
-            for take_id, frame, z in rows:
-                data.setdefault(take_id, {"frame": [], "value": []})
-                data[take_id]["frame"].append(frame)
-                data[take_id]["value"].append(z)
-
-            return data
-    finally:
-        conn.close()
+    segment_name = "RT_ELBOW_ANGULAR_VELOCITY" if handedness == "R" else "LT_ELBOW_ANGULAR_VELOCITY"
 
+    return load_time_series_component(take_ids, "ORIGINAL", segment_name, "x", value_key="x")
 
-@st.cache_data(ttl=300)
-def get_shoulder_ir_velocity(take_ids, handedness):
+def get_elbow_flexion_angle(take_ids, handedness):
     """
-    Returns shoulder internal rotation angular velocity (x_data).
+    Returns elbow flexion angle (x_data) for the throwing elbow.
 
     Category: ORIGINAL
     Segments:
-      RHP → RT_SHOULDER_ANGULAR_VELOCITY
-      LHP → LT_SHOULDER_ANGULAR_VELOCITY
-
-    L-handed pitchers will be sign-normalized later.
+      RHP → RT_ELBOW_ANGLE
+      LHP → LT_ELBOW_ANGLE
     """
     if not take_ids or handedness not in ("R", "L"):
         return {}
 
-    segment_name = (
-        "RT_SHOULDER_ANGULAR_VELOCITY"
-        if handedness == "R"
-        else "LT_SHOULDER_ANGULAR_VELOCITY"
-    )
-
-    conn = get_connection()
-    try:
-        with conn.cursor() as cur:
-            placeholders = ",".join(["%s"] * len(take_ids))
-            cur.execute(f"""
-                SELECT
-                    ts.take_id,
-                    ts.frame,
-                    ts.z_data
-                FROM time_series_data ts
-                JOIN categories c ON ts.category_id = c.category_id
-                JOIN segments s   ON ts.segment_id  = s.segment_id
-                WHERE c.category_name = 'ORIGINAL'
-                  AND s.segment_name = %s
-                  AND ts.take_id IN ({placeholders})
-                ORDER BY ts.take_id, ts.frame
-            """, (segment_name, *take_ids))
-
-            rows = cur.fetchall()
-
-            data = {}
-            for take_id, frame, x in rows:
-                data.setdefault(take_id, {"frame": [], "x": []})
-                data[take_id]["frame"].append(frame)
-                data[take_id]["x"].append(x)
+    segment_name = "RT_ELBOW_ANGLE" if handedness == "R" else "LT_ELBOW_ANGLE"
 
-            return data
-    finally:
-        conn.close()
+    return load_time_series_component(take_ids, "ORIGINAL", segment_name, "x")
 
-@st.cache_data(ttl=300)
-def get_arm_proximal_energy_transfer(take_ids, handedness):
+# --- SHOULDER EXTERNAL ROTATION ANGLE helper ---
+def get_shoulder_er_angle(take_ids, handedness):
     """
-    Arm proximal energy transfer (power flowing into the arm).
+    Returns shoulder external rotation angle (z_data) for the throwing shoulder.
 
-    Category: SEGMENT_POWERS
+    Category: ORIGINAL
     Segments:
-      RHP → RAR_PROX
-      LHP → LAR_PROX
-    Component: x_data
+      RHP → RT_SHOULDER_ANGLE
+      LHP → LT_SHOULDER_ANGLE
     """
-    if not take_ids or handedness not in ("R", "L"):
+    if not take_ids:
         return {}
 
-    segment_name = "RAR_PROX" if handedness == "R" else "LAR_PROX"
+    segment_name = "RT_SHOULDER" if handedness == "R" else "LT_SHOULDER"
 
-    conn = get_connection()
-    try:
-        with conn.cursor() as cur:
-            placeholders = ",".join(["%s"] * len(take_ids))
-            cur.execute(f"""
-                SELECT
-                    ts.take_id,
-                    ts.frame,
-                    ts.x_data
-                FROM time_series_data ts
-                JOIN categories c ON ts.category_id = c.category_id
-                JOIN segments s ON ts.segment_id = s.segment_id
-                WHERE c.category_name = 'SEGMENT_POWERS'
-                  AND s.segment_name = %s
-                  AND ts.take_id IN ({placeholders})
-                  AND ts.x_data IS NOT NULL
-                ORDER BY ts.take_id, ts.frame
-            """, (segment_name, *take_ids))
-
-            rows = cur.fetchall()
-
-            data = {}
-            for take_id, frame, x in rows:
-                data.setdefault(take_id, {"frame": [], "value": []})
-                data[take_id]["frame"].append(frame)
-                data[take_id]["value"].append(x)
+    return load_time_series_component(take_ids, "JOINT_ANGLES", segment_name, "z", drop_null=True)
 
-            return data
-    finally:
-        conn.close()
+# --- SHOULDER ABDUCTION ANGLE helper ---
 
-# --- DISTAL ARM SEGMENT POWER loader ---
-@st.cache_data(ttl=300)
-def get_distal_arm_segment_power(take_ids, handedness):
+def get_shoulder_abduction_angle(take_ids, handedness):
     """
-    Returns distal throwing arm segment power (Watts).
+    Returns shoulder abduction angle (y_data) for the throwing shoulder.
 
-    Category: SEGMENT_POWERS
+    Category: JOINT_ANGLES
     Segments:
-      RHP → RTA_DIST_R
-      LHP → RTA_DIST_L
+      RHP → RT_SHOULDER
+      LHP → LT_SHOULDER
     """
     if not take_ids or handedness not in ("R", "L"):
         return {}
 
-    segment_name = "RTA_DIST_R" if handedness == "R" else "RTA_DIST_L"
-
-    conn = get_connection()
-    try:
-        with conn.cursor() as cur:
-            placeholders = ",".join(["%s"] * len(take_ids))
-            cur.execute(f"""
-                SELECT
-                    ts.take_id,
-                    ts.frame,
-                    ts.x_data
-                FROM time_series_data ts
-                JOIN categories c ON ts.category_id = c.category_id
-                JOIN segments s ON ts.segment_id = s.segment_id
-                WHERE c.category_name = 'SEGMENT_POWERS'
-                  AND s.segment_name = %s
-                  AND ts.take_id IN ({placeholders})
-                  AND ts.x_data IS NOT NULL
-                ORDER BY ts.take_id, ts.frame
-            """, (segment_name, *take_ids))
-
-            rows = cur.fetchall()
-
-            data = {}
-            for take_id, frame, x in rows:
-                data.setdefault(take_id, {"frame": [], "value": []})
-                data[take_id]["frame"].append(frame)
-                data[take_id]["value"].append(x)
+    segment_name = "RT_SHOULDER" if handedness == "R" else "LT_SHOULDER"
 
-            return data
-    finally:
-        conn.close()
+    return load_time_series_component(take_ids, "JOINT_ANGLES", segment_name, "y")
 
+# --- SHOULDER HORIZONTAL ABDUCTION ANGLE helper ---
 
-@st.cache_data(ttl=300)
-def get_glove_side_trunk_shoulder_energy_flow(take_ids, handedness):
+def get_front_knee_flexion_angle(take_ids, handedness):
     """
-    Returns glove-side distal arm/trunk-shoulder energy flow (Watts).
+    Returns front (lead) knee flexion angle (x_data).
 
-    Category: SEGMENT_POWERS
+    Category: ORIGINAL
     Segments:
-      RHP -> RTA_DIST_L
-      LHP -> RTA_DIST_R
+      RHP → LT_KNEE_ANGLE
+      LHP → RT_KNEE_ANGLE
     """
     if not take_ids or handedness not in ("R", "L"):
         return {}
 
-    segment_name = "RTA_DIST_L" if handedness == "R" else "RTA_DIST_R"
-
-    conn = get_connection()
-    try:
-        with conn.cursor() as cur:
-            placeholders = ",".join(["%s"] * len(take_ids))
-            cur.execute(f"""
-                SELECT
-                    ts.take_id,
-                    ts.frame,
-                    ts.x_data
-                FROM time_series_data ts
-                JOIN categories c ON ts.category_id = c.category_id
-                JOIN segments s ON ts.segment_id = s.segment_id
-                WHERE c.category_name = 'SEGMENT_POWERS'
-                  AND s.segment_name = %s
-                  AND ts.take_id IN ({placeholders})
-                  AND ts.x_data IS NOT NULL
-                ORDER BY ts.take_id, ts.frame
-            """, (segment_name, *take_ids))
-
-            rows = cur.fetchall()
-
-            data = {}
-            for take_id, frame, x in rows:
-                data.setdefault(take_id, {"frame": [], "value": []})
-                data[take_id]["frame"].append(frame)
-                data[take_id]["value"].append(x)
-
-            return data
-    finally:
-        conn.close()
+    segment_name = "LT_KNEE_ANGLE" if handedness == "R" else "RT_KNEE_ANGLE"
 
+    return load_time_series_component(take_ids, "ORIGINAL", segment_name, "x")
 
-@st.cache_data(ttl=300)
-def get_glove_arm_energy_flow(take_ids, handedness):
+# --- FRONT KNEE EXTENSION VELOCITY helper ---
+def get_front_knee_extension_velocity(take_ids, handedness):
     """
-    Returns glove-side proximal arm energy flow (Watts).
+    Returns front (lead) knee angular velocity (x_data).
 
-    Category: SEGMENT_POWERS
+    Category: ORIGINAL
     Segments:
-      RHP -> LAR_PROX
-      LHP -> RAR_PROX
+      RHP → LT_KNEE_ANGULAR_VELOCITY
+      LHP → RT_KNEE_ANGULAR_VELOCITY
     """
     if not take_ids or handedness not in ("R", "L"):
         return {}
 
-    segment_name = "LAR_PROX" if handedness == "R" else "RAR_PROX"
-
-    conn = get_connection()
-    try:
-        with conn.cursor() as cur:
-            placeholders = ",".join(["%s"] * len(take_ids))
-            cur.execute(f"""
-                SELECT
-                    ts.take_id,
-                    ts.frame,
-                    ts.x_data
-                FROM time_series_data ts
-                JOIN categories c ON ts.category_id = c.category_id
-                JOIN segments s ON ts.segment_id = s.segment_id
-                WHERE c.category_name = 'SEGMENT_POWERS'
-                  AND s.segment_name = %s
-                  AND ts.take_id IN ({placeholders})
-                  AND ts.x_data IS NOT NULL
-                ORDER BY ts.take_id, ts.frame
-            """, (segment_name, *take_ids))
-
-            rows = cur.fetchall()
-
-            data = {}
-            for take_id, frame, x in rows:
-                data.setdefault(take_id, {"frame": [], "value": []})
-                data[take_id]["frame"].append(frame)
-                data[take_id]["value"].append(x)
-
-            return data
-    finally:
-        conn.close()
+    segment_name = "LT_KNEE_ANGULAR_VELOCITY" if handedness == "R" else "RT_KNEE_ANGULAR_VELOCITY"
 
+    return load_time_series_component(take_ids, "ORIGINAL", segment_name, "x")
 
-@st.cache_data(ttl=300)
-def get_trunk_shoulder_rot_energy_flow(take_ids, handedness):
+def get_shoulder_horizontal_abduction_angle(take_ids, handedness):
     """
-    Trunk–Shoulder rotational energy flow.
+    Returns shoulder horizontal abduction angle (x_data) for the throwing shoulder.
 
-    Category: JCS_STP_ROT
+    Category: JOINT_ANGLES
     Segments:
-      RHP → RTA_RAR
-      LHP → RTA_LAR
-    Component: x_data
+      RHP → RT_SHOULDER
+      LHP → LT_SHOULDER
     """
     if not take_ids or handedness not in ("R", "L"):
         return {}
 
-    segment_name = "RTA_RAR" if handedness == "R" else "RTA_LAR"
-
-    conn = get_connection()
-    try:
-        with conn.cursor() as cur:
-            placeholders = ",".join(["%s"] * len(take_ids))
-            cur.execute(f"""
-                SELECT
-                    ts.take_id,
-                    ts.frame,
-                    ts.x_data
-                FROM time_series_data ts
-                JOIN categories c ON ts.category_id = c.category_id
-                JOIN segments s   ON ts.segment_id  = s.segment_id
-                WHERE c.category_name = 'JCS_STP_ROT'
-                  AND s.segment_name = %s
-                  AND ts.take_id IN ({placeholders})
-                  AND ts.x_data IS NOT NULL
-                ORDER BY ts.take_id, ts.frame
-            """, (segment_name, *take_ids))
-
-            rows = cur.fetchall()
-
-            data = {}
-            for take_id, frame, x in rows:
-                data.setdefault(take_id, {"frame": [], "value": []})
-                data[take_id]["frame"].append(frame)
-                data[take_id]["value"].append(x)
-
-            return data
-    finally:
-        conn.close()
-
+    segment_name = "RT_SHOULDER" if handedness == "R" else "LT_SHOULDER"
 
-# --- Trunk–Shoulder Elevation/Depression Energy Flow loader ---
+    return load_time_series_component(take_ids, "JOINT_ANGLES", segment_name, "x")
 
-@st.cache_data(ttl=300)
-def get_trunk_shoulder_elev_energy_flow(take_ids, handedness):
+# --- TORSO ANGLE COMPONENTS helper ---
+def get_torso_angle_components(take_ids):
     """
-    Trunk–Shoulder elevation/depression energy flow.
+    Returns torso angle components for each take.
 
-    Category: JCS_STP_ELEV
-    Segments:
-      RHP → RTA_RAR
-      LHP → RTA_LAR
-    Component: x_data
+    Category: ORIGINAL
+    Segment: TORSO_ANGLE
+
+    Components:
+      x_data → Forward Trunk Tilt
+      y_data → Lateral Trunk Tilt
+      z_data → Trunk Angle
     """
-    if not take_ids or handedness not in ("R", "L"):
+    if not take_ids:
         return {}
 
-    segment_name = "RTA_RAR" if handedness == "R" else "RTA_LAR"
+    return load_time_series_xyz(take_ids, "ORIGINAL", "TORSO_ANGLE")
 
-    conn = get_connection()
-    try:
-        with conn.cursor() as cur:
-            placeholders = ",".join(["%s"] * len(take_ids))
-            cur.execute(f"""
-                SELECT
-                    ts.take_id,
-                    ts.frame,
-                    ts.x_data
-                FROM time_series_data ts
-                JOIN categories c ON ts.category_id = c.category_id
-                JOIN segments s   ON ts.segment_id  = s.segment_id
-                WHERE c.category_name = 'JCS_STP_ELEV'
-                  AND s.segment_name = %s
-                  AND ts.take_id IN ({placeholders})
-                  AND ts.x_data IS NOT NULL
-                ORDER BY ts.take_id, ts.frame
-            """, (segment_name, *take_ids))
-
-            rows = cur.fetchall()
-
-            data = {}
-            for take_id, frame, x in rows:
-                data.setdefault(take_id, {"frame": [], "value": []})
-                data[take_id]["frame"].append(frame)
-                data[take_id]["value"].append(x)
+def get_pelvis_angle(take_ids):
+    """
+    Returns pelvis angle (z_data).
 
-            return data
-    finally:
-        conn.close()
+    Category: ORIGINAL
+    Segment: PELVIS_ANGLE
+    """
+    if not take_ids:
+        return {}
 
+    return load_time_series_component(take_ids, "ORIGINAL", "PELVIS_ANGLE", "z")
 
-# --- Trunk–Shoulder Horizontal Abduction/Adduction Energy Flow loader ---
 
-@st.cache_data(ttl=300)
-def get_trunk_shoulder_horizabd_energy_flow(take_ids, handedness):
+def get_pelvic_lateral_tilt(take_ids):
     """
-    Trunk–Shoulder horizontal abduction/adduction energy flow.
+    Returns pelvic lateral tilt from pelvis angle (y_data).
 
-    Category: JCS_STP_HORIZABD
-    Segments:
-      RHP → RTA_RAR
-      LHP → RTA_LAR
-    Component: x_data
+    Category: ORIGINAL
+    Segment: PELVIS_ANGLE
     """
-    if not take_ids or handedness not in ("R", "L"):
+    if not take_ids:
         return {}
 
-    segment_name = "RTA_RAR" if handedness == "R" else "RTA_LAR"
-
-    conn = get_connection()
-    try:
-        with conn.cursor() as cur:
-            placeholders = ",".join(["%s"] * len(take_ids))
-            cur.execute(f"""
-                SELECT
-                    ts.take_id,
-                    ts.frame,
-                    ts.x_data
-                FROM time_series_data ts
-                JOIN categories c ON ts.category_id = c.category_id
-                JOIN segments s   ON ts.segment_id  = s.segment_id
-                WHERE c.category_name = 'JCS_STP_HORIZABD'
-                  AND s.segment_name = %s
-                  AND ts.take_id IN ({placeholders})
-                  AND ts.x_data IS NOT NULL
-                ORDER BY ts.take_id, ts.frame
-            """, (segment_name, *take_ids))
-
-            rows = cur.fetchall()
-
-            data = {}
-            for take_id, frame, x in rows:
-                data.setdefault(take_id, {"frame": [], "value": []})
-                data[take_id]["frame"].append(frame)
-                data[take_id]["value"].append(x)
-
-            return data
-    finally:
-        conn.close()
+    return load_time_series_component(take_ids, "ORIGINAL", "PELVIS_ANGLE", "y")
 
 
-# --- Arm Rotational Energy Flow loader ---
-@st.cache_data(ttl=300)
-def get_arm_rot_energy_flow(take_ids, handedness):
+def get_hip_shoulder_separation(take_ids):
     """
-    Arm rotational energy flow.
+    Returns hip–shoulder separation angle (z_data).
 
-    Category: JCS_STP_ROT
-    Segments:
-      RHP → RTA_RAR
-      LHP → RTA_LAR
-    Component: x_data
+    Category: ORIGINAL
+    Segment: TORSO_PELVIS_ANGLE
     """
-    if not take_ids or handedness not in ("R", "L"):
+    if not take_ids:
         return {}
 
-    segment_name = "RAR" if handedness == "R" else "LAR"
-
-    conn = get_connection()
-    try:
-        with conn.cursor() as cur:
-            placeholders = ",".join(["%s"] * len(take_ids))
-            cur.execute(f"""
-                SELECT ts.take_id, ts.frame, ts.x_data
-                FROM time_series_data ts
-                JOIN categories c ON ts.category_id = c.category_id
-                JOIN segments s   ON ts.segment_id  = s.segment_id
-                WHERE c.category_name = 'JCS_STP_ROT'
-                  AND s.segment_name = %s
-                  AND ts.take_id IN ({placeholders})
-                  AND ts.x_data IS NOT NULL
-                ORDER BY ts.take_id, ts.frame
-            """, (segment_name, *take_ids))
-
-            rows = cur.fetchall()
-            data = {}
-            for tid, frame, x in rows:
-                data.setdefault(tid, {"frame": [], "value": []})
-                data[tid]["frame"].append(frame)
-                data[tid]["value"].append(x)
-            return data
-    finally:
-        conn.close()
+    return load_time_series_component(take_ids, "ORIGINAL", "TORSO_PELVIS_ANGLE", "z")
 
 
-# --- Arm Elevation/Depression Energy Flow loader ---
-@st.cache_data(ttl=300)
-def get_arm_elev_energy_flow(take_ids, handedness):
+def get_shoulder_ir_velocity(take_ids, handedness):
     """
-    Arm elevation/depression energy flow.
+    Returns shoulder internal rotation angular velocity (x_data).
 
-    Category: JCS_STP_ELEV
+    Category: ORIGINAL
     Segments:
-      RHP → RTA_RAR
-      LHP → RTA_LAR
-    Component: x_data
+      RHP → RT_SHOULDER_ANGULAR_VELOCITY
+      LHP → LT_SHOULDER_ANGULAR_VELOCITY
+
+    L-handed pitchers will be sign-normalized later.
     """
     if not take_ids or handedness not in ("R", "L"):
         return {}
 
-    segment_name = "RAR" if handedness == "R" else "LAR"
+    segment_name = "RT_SHOULDER_ANGULAR_VELOCITY" if handedness == "R" else "LT_SHOULDER_ANGULAR_VELOCITY"
 
-    conn = get_connection()
-    try:
-        with conn.cursor() as cur:
-            placeholders = ",".join(["%s"] * len(take_ids))
-            cur.execute(f"""
-                SELECT ts.take_id, ts.frame, ts.x_data
-                FROM time_series_data ts
-                JOIN categories c ON ts.category_id = c.category_id
-                JOIN segments s   ON ts.segment_id  = s.segment_id
-                WHERE c.category_name = 'JCS_STP_ELEV'
-                  AND s.segment_name = %s
-                  AND ts.take_id IN ({placeholders})
-                  AND ts.x_data IS NOT NULL
-                ORDER BY ts.take_id, ts.frame
-            """, (segment_name, *take_ids))
-
-            rows = cur.fetchall()
-            data = {}
-            for tid, frame, x in rows:
-                data.setdefault(tid, {"frame": [], "value": []})
-                data[tid]["frame"].append(frame)
-                data[tid]["value"].append(x)
-            return data
-    finally:
-        conn.close()
+    return load_time_series_component(take_ids, "ORIGINAL", segment_name, "z", value_key="x")
 
 
-# --- Arm Horizontal Abduction/Adduction Energy Flow loader ---
-@st.cache_data(ttl=300)
-def get_arm_horizabd_energy_flow(take_ids, handedness):
+def make_handed_series_loader(category_name, right_segment, left_segment, component="x"):
     """
-    Arm horizontal abduction/adduction energy flow.
-
-    Category: JCS_STP_HORIZABD
-    Segments:
-      RHP → RTA_RAR
-      LHP → RTA_LAR
-    Component: x_data
+    Builds a (take_ids, handedness) loader for one component of a handed series:
+    RHP takes read right_segment, LHP takes left_segment. Rows with a NULL
+    component are dropped, and frame / value come back as NumPy arrays.
     """
-    if not take_ids or handedness not in ("R", "L"):
-        return {}
+    def load(take_ids, handedness):
+        if not take_ids or handedness not in ("R", "L"):
+            return {}
 
-    segment_name = "RAR" if handedness == "R" else "LAR"
+        segment_name = right_segment if handedness == "R" else left_segment
+
+        return load_time_series_component(
+            take_ids, category_name, segment_name, component, drop_null=True, as_arrays=True
+        )
+
+    load.__doc__ = (
+        f"Category: {category_name}\n"
+        f"Segments: RHP → {right_segment}, LHP → {left_segment}\n"
+        f"Component: {component}_data"
+    )
+    return load
 
-    conn = get_connection()
-    try:
-        with conn.cursor() as cur:
-            placeholders = ",".join(["%s"] * len(take_ids))
-            cur.execute(f"""
-                SELECT ts.take_id, ts.frame, ts.x_data
-                FROM time_series_data ts
-                JOIN categories c ON ts.category_id = c.category_id
-                JOIN segments s   ON ts.segment_id  = s.segment_id
-                WHERE c.category_name = 'JCS_STP_HORIZABD'
-                  AND s.segment_name = %s
-                  AND ts.take_id IN ({placeholders})
-                  AND ts.x_data IS NOT NULL
-                ORDER BY ts.take_id, ts.frame
-            """, (segment_name, *take_ids))
-
-            rows = cur.fetchall()
-            data = {}
-            for tid, frame, x in rows:
-                data.setdefault(tid, {"frame": [], "value": []})
-                data[tid]["frame"].append(frame)
-                data[tid]["value"].append(x)
-            return data
-    finally:
-        conn.close()
 
-@st.cache_data(ttl=300)
+# --------------------------------------------------
+# Segment power / energy flow loaders (Watts)
+# --------------------------------------------------
+# Arm proximal energy transfer (power flowing into the arm)
+get_arm_proximal_energy_transfer = make_handed_series_loader("SEGMENT_POWERS", "RAR_PROX", "LAR_PROX")
+# Distal throwing arm segment power
+get_distal_arm_segment_power = make_handed_series_loader("SEGMENT_POWERS", "RTA_DIST_R", "RTA_DIST_L")
+# Glove-side distal arm / trunk-shoulder energy flow
+get_glove_side_trunk_shoulder_energy_flow = make_handed_series_loader("SEGMENT_POWERS", "RTA_DIST_L", "RTA_DIST_R")
+# Glove-side proximal arm energy flow
+get_glove_arm_energy_flow = make_handed_series_loader("SEGMENT_POWERS", "LAR_PROX", "RAR_PROX")
+
+# Trunk–Shoulder rotational / elevation / horizontal abduction energy flow
+get_trunk_shoulder_rot_energy_flow = make_handed_series_loader("JCS_STP_ROT", "RTA_RAR", "RTA_LAR")
+get_trunk_shoulder_elev_energy_flow = make_handed_series_loader("JCS_STP_ELEV", "RTA_RAR", "RTA_LAR")
+get_trunk_shoulder_horizabd_energy_flow = make_handed_series_loader("JCS_STP_HORIZABD", "RTA_RAR", "RTA_LAR")
+
+# Arm rotational / elevation / horizontal abduction energy flow
+get_arm_rot_energy_flow = make_handed_series_loader("JCS_STP_ROT", "RAR", "LAR")
+get_arm_elev_energy_flow = make_handed_series_loader("JCS_STP_ELEV", "RAR", "LAR")
+get_arm_horizabd_energy_flow = make_handed_series_loader("JCS_STP_HORIZABD", "RAR", "LAR")
+
+
+@st.cache_data(ttl=CACHE_TTL_SECONDS, show_spinner=False, hash_funcs=TAKE_ID_HASH_FUNCS)
 def get_energy_flow_from_segment(take_ids, segment_name, component="x"):
     """
     Generic energy-flow loader by segment name and component.
+    Returns { take_id: {"frame": ndarray, "value": ndarray} }.
     """
     if not take_ids or not segment_name:
         return {}
@@ -1666,33 +1367,38 @@ def get_energy_flow_from_segment(take_ids, segment_name, component="x"):
         "y": "ts.y_data",
         "z": "ts.z_data",
     }.get(component, "ts.x_data")
+    segment_id = get_reference_id_maps()["segment"].get(segment_name)
+    if segment_id is None:
+        return {}
 
-    conn = get_connection()
-    try:
-        with conn.cursor() as cur:
-            placeholders = ",".join(["%s"] * len(take_ids))
-            cur.execute(f"""
-                SELECT
-                    ts.take_id,
-                    ts.frame,
-                    {component_col}
-                FROM time_series_data ts
-                JOIN segments s ON ts.segment_id = s.segment_id
-                WHERE s.segment_name = %s
-                  AND ts.take_id IN ({placeholders})
-                  AND {component_col} IS NOT NULL
-                ORDER BY ts.take_id, ts.frame
-            """, (segment_name, *take_ids))
-
-            rows = cur.fetchall()
-            data = {}
-            for take_id, frame, x in rows:
-                data.setdefault(take_id, {"frame": [], "value": []})
-                data[take_id]["frame"].append(frame)
-                data[take_id]["value"].append(x)
-            return data
-    finally:
-        conn.close()
+    with pooled_cursor() as cur:
+        rows = copy_query_to_frame(cur, f"""
+            SELECT
+                ts.take_id::int8,
+                ts.frame::int4,
+                {component_col}::float8
+            FROM time_series_data ts
+            WHERE ts.segment_id = %s
+              AND ts.take_id = ANY(%s::bigint[])
+              AND {component_col} IS NOT NULL
+            ORDER BY ts.take_id, ts.frame
+        """, (segment_id, list(take_ids)), {"take_id": "int8", "frame": "int4", "value": "float8"})
+
+    if rows.empty:
+        return {}
+
+    frames = rows["frame"].to_numpy(dtype=np.int64)
+    values = rows["value"].to_numpy(dtype=np.float64)
+
+    # Rows arrive sorted by (take, frame), so each take is one contiguous slice
+    data = {}
+    for take_id, positions in rows.groupby("take_id", sort=False).indices.items():
+        start, stop = positions[0], positions[-1] + 1
+        data[int(take_id)] = {
+            "frame": frames[start:stop],
+            "value": values[start:stop],
+        }
+    return data
 
 NEW_TRUNK_PELVIS_ENERGY_METRIC_MAP = {
     "RPV_DIST_STP_FLEX": ("RPV_DIST", "JCS_STP_FLEX"),
@@ -1737,49 +1443,24 @@ def get_energy_yaxis_title(selected_metrics):
     return "Energy Flow (W)"
 
 
-@st.cache_data(ttl=300)
 def get_energy_flow_from_category_segment(take_ids, category_name, segment_name, component="x"):
     """
     Generic energy-flow loader by category, segment name, and component.
+    Returns { take_id: {"frame": ndarray, "value": ndarray} }.
     """
     if not take_ids or not category_name or not segment_name:
         return {}
-    component_col = {
-        "x": "ts.x_data",
-        "y": "ts.y_data",
-        "z": "ts.z_data",
-    }.get(component, "ts.x_data")
-
-    conn = get_connection()
-    try:
-        with conn.cursor() as cur:
-            placeholders = ",".join(["%s"] * len(take_ids))
-            cur.execute(f"""
-                SELECT
-                    ts.take_id,
-                    ts.frame,
-                    {component_col}
-                FROM time_series_data ts
-                JOIN categories c ON ts.category_id = c.category_id
-                JOIN segments s ON ts.segment_id = s.segment_id
-                WHERE c.category_name = %s
-                  AND s.segment_name = %s
-                  AND ts.take_id IN ({placeholders})
-                  AND {component_col} IS NOT NULL
-                ORDER BY ts.take_id, ts.frame
-            """, (category_name, segment_name, *take_ids))
-
-            rows = cur.fetchall()
-            data = {}
-            for take_id, frame, x in rows:
-                data.setdefault(take_id, {"frame": [], "value": []})
-                data[take_id]["frame"].append(frame)
-                data[take_id]["value"].append(x)
-            return data
-    finally:
-        conn.close()
+    component = component if component in TIME_SERIES_COMPONENTS else "x"
+
+    return load_time_series_component(
+        take_ids,
+        category_name,
+        segment_name,
+        component,
+        drop_null=True,
+        as_arrays=True,
+    )
 
-@st.cache_data(ttl=300)
 def get_hand_cg_velocity(take_ids, handedness):
     """
     Returns CG velocity (x_data) for the throwing hand based on handedness.
@@ -1791,38 +1472,57 @@ def get_hand_cg_velocity(take_ids, handedness):
 
     segment_name = "RHA" if handedness == "R" else "LHA"
 
-    conn = get_connection()
-    try:
-        with conn.cursor() as cur:
-            placeholders = ",".join(["%s"] * len(take_ids))
-            cur.execute(f"""
-                SELECT
-                    ts.take_id,
-                    ts.frame,
-                    ts.x_data
-                FROM time_series_data ts
-                JOIN categories c ON ts.category_id = c.category_id
-                JOIN segments s ON ts.segment_id = s.segment_id
-                WHERE c.category_name = 'KINETIC_KINEMATIC_CGVel'
-                  AND s.segment_name = %s
-                  AND ts.take_id IN ({placeholders})
-                ORDER BY ts.take_id, ts.frame
-            """, (segment_name, *take_ids))
-
-            rows = cur.fetchall()
-
-            data = {}
-            for take_id, frame, x in rows:
-                data.setdefault(take_id, {"frame": [], "x": []})
-                data[take_id]["frame"].append(frame)
-                data[take_id]["x"].append(x)
+    return load_time_series_component(
+        take_ids,
+        "KINETIC_KINEMATIC_CGVel",
+        segment_name,
+        "x",
+        value_key="x",
+    )
 
-            return data
-    finally:
-        conn.close()
+
+def get_kinematic_sequence_series(take_ids, handedness, frame_windows=None):
+    """
+    Loads every series the Kinematic Sequence needs for one handedness in a single query:
+    pelvis / torso angular velocity (z), elbow angular velocity (x),
+    shoulder IR angular velocity (z, keyed "x") and throwing-hand CG velocity (x).
+
+    frame_windows ({ take_id: (first_frame, last_frame) }) restricts the angular
+    velocity series to the plotted window. CG velocity is always loaded in full
+    because ball release is found from it.
+    """
+    if not take_ids or handedness not in ("R", "L"):
+        return {"pelvis": {}, "torso": {}, "elbow": {}, "shoulder_ir": {}, "cg": {}}
+
+    side = "RT" if handedness == "R" else "LT"
+    series_specs = {
+        "pelvis": (("ORIGINAL", "PELVIS_ANGULAR_VELOCITY"), "z", "z"),
+        "torso": (("ORIGINAL", "TORSO_ANGULAR_VELOCITY"), "z", "z"),
+        "elbow": (("ORIGINAL", f"{side}_ELBOW_ANGULAR_VELOCITY"), "x", "x"),
+        "shoulder_ir": (("ORIGINAL", f"{side}_SHOULDER_ANGULAR_VELOCITY"), "z", "x"),
+        "cg": (("KINETIC_KINEMATIC_CGVel", "RHA" if handedness == "R" else "LHA"), "x", "x"),
+    }
+    if frame_windows is None:
+        batch = get_time_series_batch(
+            take_ids,
+            tuple(series_key for series_key, _, _ in series_specs.values())
+        )
+    else:
+        cg_key = series_specs["cg"][0]
+        batch = {
+            **get_time_series_batch(
+                take_ids,
+                tuple(series_key for series_key, _, _ in series_specs.values() if series_key != cg_key),
+                frame_windows=frame_windows,
+            ),
+            **get_time_series_batch(take_ids, (cg_key,)),
+        }
+    return {
+        name: select_time_series_component(batch.get(series_key, {}), component, value_key=value_key)
+        for name, (series_key, component, value_key) in series_specs.items()
+    }
 
 
-@st.cache_data(ttl=300)
 def get_hand_speed(take_ids, handedness):
     """
     Returns hand speed magnitude from CG velocity components:
@@ -1834,44 +1534,23 @@ def get_hand_speed(take_ids, handedness):
         return {}
 
     segment_name = "RHA" if handedness == "R" else "LHA"
+    batch = get_time_series_batch(take_ids, (("KINETIC_KINEMATIC_CGVel", segment_name),))
 
-    conn = get_connection()
-    try:
-        with conn.cursor() as cur:
-            placeholders = ",".join(["%s"] * len(take_ids))
-            cur.execute(f"""
-                SELECT
-                    ts.take_id,
-                    ts.frame,
-                    ts.x_data,
-                    ts.y_data,
-                    ts.z_data
-                FROM time_series_data ts
-                JOIN categories c ON ts.category_id = c.category_id
-                JOIN segments s ON ts.segment_id = s.segment_id
-                WHERE c.category_name = 'KINETIC_KINEMATIC_CGVel'
-                  AND s.segment_name = %s
-                  AND ts.take_id IN ({placeholders})
-                ORDER BY ts.take_id, ts.frame
-            """, (segment_name, *take_ids))
-
-            rows = cur.fetchall()
-            data = {}
-            for take_id, frame, x, y, z in rows:
-                if x is None or y is None or z is None:
-                    continue
+    data = {}
+    for take_id, d in batch.get(("KINETIC_KINEMATIC_CGVel", segment_name), {}).items():
+        speed = np.sqrt(d["x"]**2 + d["y"]**2 + d["z"]**2)
+        present = ~np.isnan(speed)
+        if not present.any():
+            continue
 
-                speed = float(np.sqrt(x**2 + y**2 + z**2))
-                data.setdefault(take_id, {"frame": [], "value": []})
-                data[take_id]["frame"].append(frame)
-                data[take_id]["value"].append(speed)
+        data[take_id] = {
+            "frame": d["frame"][present].tolist(),
+            "value": speed[present].tolist(),
+        }
 
-            return data
-    finally:
-        conn.close()
+    return data
 
 
-@st.cache_data(ttl=300)
 def get_center_of_mass_velocity_x(take_ids):
     """
     Returns Center of Mass velocity in the x direction.
@@ -1882,38 +1561,9 @@ def get_center_of_mass_velocity_x(take_ids):
     if not take_ids:
         return {}
 
-    conn = get_connection()
-    try:
-        with conn.cursor() as cur:
-            placeholders = ",".join(["%s"] * len(take_ids))
-            cur.execute(f"""
-                SELECT
-                    ts.take_id,
-                    ts.frame,
-                    ts.x_data
-                FROM time_series_data ts
-                JOIN categories c ON ts.category_id = c.category_id
-                JOIN segments s ON ts.segment_id = s.segment_id
-                WHERE c.category_name = 'PROCESSED'
-                  AND s.segment_name = 'CenterOfMass_VELO'
-                  AND ts.take_id IN ({placeholders})
-                ORDER BY ts.take_id, ts.frame
-            """, tuple(take_ids))
-
-            rows = cur.fetchall()
-
-            data = {}
-            for take_id, frame, x in rows:
-                data.setdefault(take_id, {"frame": [], "value": []})
-                data[take_id]["frame"].append(frame)
-                data[take_id]["value"].append(x)
-
-            return data
-    finally:
-        conn.close()
+    return load_time_series_component(take_ids, "PROCESSED", "CenterOfMass_VELO", "x")
 
 
-@st.cache_data(ttl=300)
 def get_shoulder_er_angles(take_ids, handedness):
     """
     Returns shoulder joint angle z_data for MER detection.
@@ -1927,38 +1577,9 @@ def get_shoulder_er_angles(take_ids, handedness):
 
     segment_name = "RT_SHOULDER" if handedness == "R" else "LT_SHOULDER"
 
-    conn = get_connection()
-    try:
-        with conn.cursor() as cur:
-            placeholders = ",".join(["%s"] * len(take_ids))
-            cur.execute(f"""
-                SELECT
-                    ts.take_id,
-                    ts.frame,
-                    ts.z_data
-                FROM time_series_data ts
-                JOIN categories c ON ts.category_id = c.category_id
-                JOIN segments s ON ts.segment_id = s.segment_id
-                WHERE c.category_name = 'JOINT_ANGLES'
-                  AND s.segment_name = %s
-                  AND ts.take_id IN ({placeholders})
-                ORDER BY ts.take_id, ts.frame
-            """, (segment_name, *take_ids))
-
-            rows = cur.fetchall()
-
-            data = {}
-            for take_id, frame, z in rows:
-                data.setdefault(take_id, {"frame": [], "z": []})
-                data[take_id]["frame"].append(frame)
-                data[take_id]["z"].append(z)
-
-            return data
-    finally:
-        conn.close()
+    return load_time_series_component(take_ids, "JOINT_ANGLES", segment_name, "z", value_key="z")
 
 
-@st.cache_data(ttl=300)
 def get_forearm_pron_sup_angle(take_ids, handedness):
     """
     Forearm Pronation / Supination angle.
@@ -1974,38 +1595,35 @@ def get_forearm_pron_sup_angle(take_ids, handedness):
 
     segment_name = "RT_ELBOW_ANGLE" if handedness == "R" else "LT_ELBOW_ANGLE"
 
-    conn = get_connection()
-    try:
-        with conn.cursor() as cur:
-            placeholders = ",".join(["%s"] * len(take_ids))
-            cur.execute(f"""
-                SELECT
-                    ts.take_id,
-                    ts.frame,
-                    ts.z_data
-                FROM time_series_data ts
-                JOIN categories c ON ts.category_id = c.category_id
-                JOIN segments s   ON ts.segment_id  = s.segment_id
-                WHERE c.category_name = 'ORIGINAL'
-                  AND s.segment_name = %s
-                  AND ts.take_id IN ({placeholders})
-                  AND ts.z_data IS NOT NULL
-                ORDER BY ts.take_id, ts.frame
-            """, (segment_name, *take_ids))
-
-            rows = cur.fetchall()
-
-            data = {}
-            for take_id, frame, z in rows:
-                data.setdefault(take_id, {"frame": [], "value": []})
-                data[take_id]["frame"].append(frame)
-                data[take_id]["value"].append(z)
+    return load_time_series_component(take_ids, "ORIGINAL", segment_name, "z", drop_null=True)
+
+def resolve_series_ids(category_name, segment_name):
+    """
+    Returns the (category_id, segment_id) pair for a named series from the
+    cached id maps, or None when either name is unknown.
+    """
+    id_maps = get_reference_id_maps()
+    category_id = id_maps["category"].get(category_name)
+    segment_id = id_maps["segment"].get(segment_name)
+    if category_id is None or segment_id is None:
+        return None
+    return category_id, segment_id
+
+
+def take_frame_bounds(take_ids, *frame_maps):
+    """
+    Aligns per-take frame maps into parallel lists for unnest() in SQL,
+    keeping only takes that have a frame in every map.
+    Returns ([take_id, ...], [frames from map 1, ...], ...).
+    """
+    kept = [
+        take_id for take_id in take_ids
+        if all(frame_map.get(take_id) is not None for frame_map in frame_maps)
+    ]
+    return (kept, *[[int(frame_map[take_id]) for take_id in kept] for frame_map in frame_maps])
 
-            return data
-    finally:
-        conn.close()
 
-@st.cache_data(ttl=300)
+@st.cache_data(ttl=CACHE_TTL_SECONDS, show_spinner=False, hash_funcs=TAKE_ID_HASH_FUNCS)
 def get_peak_glove_knee_pre_br(take_ids, handedness, br_frames):
     """
     Peak glove-side knee height (Z position) prior to Ball Release.
@@ -2020,44 +1638,36 @@ def get_peak_glove_knee_pre_br(take_ids, handedness, br_frames):
 
     segment_name = "LSK" if handedness == "R" else "RSK"
 
-    conn = get_connection()
-    try:
-        with conn.cursor() as cur:
-            placeholders = ",".join(["%s"] * len(take_ids))
-            cur.execute(f"""
-                SELECT
-                    ts.take_id,
-                    ts.frame,
-                    ts.z_data
-                FROM time_series_data ts
-                JOIN categories c ON ts.category_id = c.category_id
-                JOIN segments s   ON ts.segment_id  = s.segment_id
-                WHERE c.category_name = 'KINETIC_KINEMATIC_ProxEndPos'
-                  AND s.segment_name = %s
-                  AND ts.take_id IN ({placeholders})
-                  AND ts.z_data IS NOT NULL
-                ORDER BY ts.take_id, ts.z_data DESC, ts.frame ASC
-            """, (segment_name, *take_ids))
-
-            rows = cur.fetchall()
-
-            out = {}
-            for take_id, frame, z in rows:
-                br_frame = br_frames.get(take_id)
-                if br_frame is None:
-                    continue
-                if frame < br_frame and take_id not in out:
-                    out[take_id] = int(frame)
+    bound_take_ids, bound_br_frames = take_frame_bounds(take_ids, br_frames)
+    if not bound_take_ids:
+        return {}
+
+    series_ids = resolve_series_ids("KINETIC_KINEMATIC_ProxEndPos", segment_name)
+    if series_ids is None:
+        return {}
+
+    with pooled_cursor() as cur:
+        execute_prepared(cur, "peak_glove_knee_pre_br", """
+            SELECT DISTINCT ON (ts.take_id)
+                ts.take_id,
+                ts.frame
+            FROM time_series_data ts
+            JOIN unnest($1::bigint[], $2::int[]) AS br(take_id, br_frame)
+              ON br.take_id = ts.take_id
+            WHERE ts.category_id = $3
+              AND ts.segment_id = $4
+              AND ts.frame < br.br_frame
+              AND ts.z_data IS NOT NULL
+            ORDER BY ts.take_id, ts.z_data DESC, ts.frame ASC
+        """, (bound_take_ids, bound_br_frames, *series_ids))
 
-            return out
-    finally:
-        conn.close()
+        return {take_id: int(frame) for take_id, frame in cur.fetchall()}
 
 
 # --------------------------------------------------
 # Foot Plant event helper
 # --------------------------------------------------
-@st.cache_data(ttl=300)
+@st.cache_data(ttl=CACHE_TTL_SECONDS, show_spinner=False, hash_funcs=TAKE_ID_HASH_FUNCS)
 def get_foot_plant_frame(
     take_ids,
     handedness,
@@ -2078,48 +1688,35 @@ def get_foot_plant_frame(
 
     segment_name = "LFT" if handedness == "R" else "RFT"
 
-    conn = get_connection()
-    try:
-        with conn.cursor() as cur:
-            placeholders = ",".join(["%s"] * len(take_ids))
-            cur.execute(f"""
-                SELECT
-                    ts.take_id,
-                    ts.frame,
-                    ts.z_data
-                FROM time_series_data ts
-                JOIN categories c ON ts.category_id = c.category_id
-                JOIN segments s   ON ts.segment_id  = s.segment_id
-                WHERE c.category_name = 'KINETIC_KINEMATIC_DistEndVel'
-                  AND s.segment_name = %s
-                  AND ts.take_id IN ({placeholders})
-                  AND ts.z_data IS NOT NULL
-                ORDER BY ts.take_id, ts.frame ASC
-            """, (segment_name, *take_ids))
-
-            rows = cur.fetchall()
-
-            out = {}
-            for take_id, frame, z in rows:
-                knee_frame = knee_peak_frames.get(take_id)
-                br_frame   = br_frames.get(take_id)
-
-                if knee_frame is None or br_frame is None:
-                    continue
-
-                # constrain search window: knee peak → ball release
-                if frame < knee_frame or frame > br_frame:
-                    continue
-
-                # last downward ankle velocity frame
-                if z < 0:
-                    out[take_id] = int(frame)
+    bound_take_ids, bound_knee_frames, bound_br_frames = take_frame_bounds(
+        take_ids, knee_peak_frames, br_frames
+    )
+    if not bound_take_ids:
+        return {}
 
-            return out
-    finally:
-        conn.close()
+    series_ids = resolve_series_ids("KINETIC_KINEMATIC_DistEndVel", segment_name)
+    if series_ids is None:
+        return {}
 
-@st.cache_data(ttl=300)
+    with pooled_cursor() as cur:
+        # last downward ankle velocity frame between knee peak and ball release
+        execute_prepared(cur, "foot_plant_last_negative_z", """
+            SELECT DISTINCT ON (ts.take_id)
+                ts.take_id,
+                ts.frame
+            FROM time_series_data ts
+            JOIN unnest($1::bigint[], $2::int[], $3::int[]) AS w(take_id, knee_frame, br_frame)
+              ON w.take_id = ts.take_id
+            WHERE ts.category_id = $4
+              AND ts.segment_id = $5
+              AND ts.frame BETWEEN w.knee_frame AND w.br_frame
+              AND ts.z_data < 0
+            ORDER BY ts.take_id, ts.frame DESC
+        """, (bound_take_ids, bound_knee_frames, bound_br_frames, *series_ids))
+
+        return {take_id: int(frame) for take_id, frame in cur.fetchall()}
+
+@st.cache_data(ttl=CACHE_TTL_SECONDS, show_spinner=False, hash_funcs=TAKE_ID_HASH_FUNCS)
 def get_peak_ankle_prox_x_velocity(
     take_ids,
     handedness
@@ -2137,37 +1734,26 @@ def get_peak_ankle_prox_x_velocity(
 
     segment_name = "LFT" if handedness == "R" else "RFT"
 
-    conn = get_connection()
-    try:
-        with conn.cursor() as cur:
-            placeholders = ",".join(["%s"] * len(take_ids))
-            cur.execute(f"""
-                SELECT
-                    ts.take_id,
-                    ts.frame,
-                    ts.x_data
-                FROM time_series_data ts
-                JOIN categories c ON ts.category_id = c.category_id
-                JOIN segments s   ON ts.segment_id  = s.segment_id
-                WHERE c.category_name = 'KINETIC_KINEMATIC_ProxEndVel'
-                  AND s.segment_name = %s
-                  AND ts.take_id IN ({placeholders})
-                  AND ts.x_data IS NOT NULL
-                ORDER BY ts.take_id, ts.x_data DESC
-            """, (segment_name, *take_ids))
-
-            rows = cur.fetchall()
-
-            out = {}
-            for take_id, frame, x in rows:
-                if take_id not in out:
-                    out[take_id] = int(frame)
-
-            return out
-    finally:
-        conn.close()
-
-@st.cache_data(ttl=300)
+    series_ids = resolve_series_ids("KINETIC_KINEMATIC_ProxEndVel", segment_name)
+    if series_ids is None:
+        return {}
+
+    with pooled_cursor() as cur:
+        execute_prepared(cur, "peak_ankle_prox_x_velocity", """
+            SELECT DISTINCT ON (ts.take_id)
+                ts.take_id,
+                ts.frame
+            FROM time_series_data ts
+            WHERE ts.category_id = $1
+              AND ts.segment_id = $2
+              AND ts.take_id = ANY($3::bigint[])
+              AND ts.x_data IS NOT NULL
+            ORDER BY ts.take_id, ts.x_data DESC, ts.frame ASC
+        """, (*series_ids, list(take_ids)))
+
+        return {take_id: int(frame) for take_id, frame in cur.fetchall()}
+
+@st.cache_data(ttl=CACHE_TTL_SECONDS, show_spinner=False, hash_funcs=TAKE_ID_HASH_FUNCS)
 def get_ankle_min_frame(
     take_ids,
     handedness,
@@ -2186,47 +1772,34 @@ def get_ankle_min_frame(
         return {}
 
     segment_name = "LFT" if handedness == "R" else "RFT"
+    series = load_time_series_component(
+        take_ids,
+        "KINETIC_KINEMATIC_DistEndVel",
+        segment_name,
+        "z",
+        drop_null=True,
+        as_arrays=True,
+    )
 
-    conn = get_connection()
-    try:
-        with conn.cursor() as cur:
-            placeholders = ",".join(["%s"] * len(take_ids))
-            cur.execute(f"""
-                SELECT
-                    ts.take_id,
-                    ts.frame,
-                    ts.z_data
-                FROM time_series_data ts
-                JOIN categories c ON ts.category_id = c.category_id
-                JOIN segments s   ON ts.segment_id  = s.segment_id
-                WHERE c.category_name = 'KINETIC_KINEMATIC_DistEndVel'
-                  AND s.segment_name = %s
-                  AND ts.take_id IN ({placeholders})
-                  AND ts.z_data IS NOT NULL
-                ORDER BY ts.take_id, ts.z_data ASC, ts.frame ASC
-            """, (segment_name, *take_ids))
-
-            rows = cur.fetchall()
-
-            out = {}
-            for take_id, frame, _z in rows:
-                px_frame = ankle_prox_x_peak_frames.get(take_id)
-                er_frame = shoulder_er_max_frames.get(take_id)
-
-                if px_frame is None or er_frame is None:
-                    continue
+    out = {}
+    for take_id, d in series.items():
+        px_frame = ankle_prox_x_peak_frames.get(take_id)
+        er_frame = shoulder_er_max_frames.get(take_id)
 
-                if frame < px_frame or frame > er_frame:
-                    continue
+        if px_frame is None or er_frame is None:
+            continue
+
+        frames = d["frame"]
+        in_window = np.flatnonzero((frames >= px_frame) & (frames <= er_frame))
+        if in_window.size == 0:
+            continue
 
-                if take_id not in out:
-                    out[take_id] = int(frame)
+        # argmin keeps the earliest frame when several share the minimum
+        out[take_id] = int(frames[in_window[np.argmin(d["value"][in_window])]])
 
-            return out
-    finally:
-        conn.close()
+    return out
 
-@st.cache_data(ttl=300)
+@st.cache_data(ttl=CACHE_TTL_SECONDS, show_spinner=False, hash_funcs=TAKE_ID_HASH_FUNCS)
 def get_foot_plant_frame_zero_cross(
     take_ids,
     handedness,
@@ -2253,48 +1826,35 @@ def get_foot_plant_frame_zero_cross(
 
     segment_name = "LFT" if handedness == "R" else "RFT"
 
-    conn = get_connection()
-    try:
-        with conn.cursor() as cur:
-            placeholders = ",".join(["%s"] * len(take_ids))
-            cur.execute(f"""
-                SELECT
-                    ts.take_id,
-                    ts.frame,
-                    ts.z_data
-                FROM time_series_data ts
-                JOIN categories c ON ts.category_id = c.category_id
-                JOIN segments s   ON ts.segment_id  = s.segment_id
-                WHERE c.category_name = 'KINETIC_KINEMATIC_DistEndVel'
-                  AND s.segment_name = %s
-                  AND ts.take_id IN ({placeholders})
-                  AND ts.z_data IS NOT NULL
-                ORDER BY ts.take_id, ts.frame ASC
-            """, (segment_name, *take_ids))
-
-            rows = cur.fetchall()
-
-            out = {}
-            for take_id, frame, z in rows:
-                ankle_min_frame = ankle_min_frames.get(take_id)
-                er_frame = shoulder_er_max_frames.get(take_id)
-
-                if ankle_min_frame is None or er_frame is None:
-                    continue
-
-                # refined biomechanical bounds
-                if frame < ankle_min_frame or frame > er_frame:
-                    continue
-
-                # zero-cross detection
-                if z >= -0.05 and take_id not in out:
-                    out[take_id] = int(frame - 1)
+    bound_take_ids, bound_ankle_min_frames, bound_er_frames = take_frame_bounds(
+        take_ids, ankle_min_frames, shoulder_er_max_frames
+    )
+    if not bound_take_ids:
+        return {}
 
-            return out
-    finally:
-        conn.close()
+    series_ids = resolve_series_ids("KINETIC_KINEMATIC_DistEndVel", segment_name)
+    if series_ids is None:
+        return {}
 
-@st.cache_data(ttl=300)
+    with pooled_cursor() as cur:
+        # first zero-cross frame within the refined biomechanical bounds
+        execute_prepared(cur, "foot_plant_zero_cross", """
+            SELECT DISTINCT ON (ts.take_id)
+                ts.take_id,
+                ts.frame
+            FROM time_series_data ts
+            JOIN unnest($1::bigint[], $2::int[], $3::int[]) AS w(take_id, ankle_min_frame, er_frame)
+              ON w.take_id = ts.take_id
+            WHERE ts.category_id = $4
+              AND ts.segment_id = $5
+              AND ts.frame BETWEEN w.ankle_min_frame AND w.er_frame
+              AND ts.z_data >= -0.05
+            ORDER BY ts.take_id, ts.frame ASC
+        """, (bound_take_ids, bound_ankle_min_frames, bound_er_frames, *series_ids))
+
+        return {take_id: int(frame - 1) for take_id, frame in cur.fetchall()}
+
+@st.cache_data(ttl=CACHE_TTL_SECONDS, show_spinner=False, hash_funcs=TAKE_ID_HASH_FUNCS)
 def get_lead_heel_contact_frame(
     take_ids,
     handedness,
@@ -2320,93 +1880,67 @@ def get_lead_heel_contact_frame(
         return {}
 
     heel_segment = "L_HEEL" if handedness == "R" else "R_HEEL"
+    series = load_time_series_component(
+        take_ids,
+        "LANDMARK_ORIGINAL",
+        heel_segment,
+        "z",
+        drop_null=True,
+        as_arrays=True,
+    )
 
-    conn = get_connection()
-    try:
-        with conn.cursor() as cur:
-            placeholders = ",".join(["%s"] * len(take_ids))
-            cur.execute(f"""
-                SELECT
-                    ts.take_id,
-                    ts.frame,
-                    ts.z_data
-                FROM time_series_data ts
-                JOIN categories c ON ts.category_id = c.category_id
-                JOIN segments s   ON ts.segment_id  = s.segment_id
-                WHERE c.category_name = 'LANDMARK_ORIGINAL'
-                  AND s.segment_name = %s
-                  AND ts.take_id IN ({placeholders})
-                  AND ts.z_data IS NOT NULL
-                ORDER BY ts.take_id, ts.frame ASC
-            """, (heel_segment, *take_ids))
-
-            rows = cur.fetchall()
-
-            rows_by_take = {}
-            for take_id, frame, z in rows:
-                rows_by_take.setdefault(take_id, []).append((int(frame), float(z)))
-
-            out = {}
-            for take_id, take_rows in rows_by_take.items():
-                start_frame = start_frames.get(take_id)
-                end_frame = end_frames.get(take_id)
-                anchor_frame = anchor_frames.get(take_id)
-
-                if start_frame is None or end_frame is None or start_frame > end_frame:
-                    continue
-                if anchor_frame is None:
-                    continue
+    out = {}
+    for take_id, d in series.items():
+        start_frame = start_frames.get(take_id)
+        end_frame = end_frames.get(take_id)
+        anchor_frame = anchor_frames.get(take_id)
 
-                full_window_rows = [
-                    (frame, z)
-                    for frame, z in take_rows
-                    if start_frame <= frame <= end_frame
-                ]
-                if not full_window_rows:
-                    continue
+        if start_frame is None or end_frame is None or start_frame > end_frame:
+            continue
+        if anchor_frame is None:
+            continue
 
-                heel_values = [z for _, z in full_window_rows]
-                heel_floor = min(heel_values)
-                heel_ceil = max(heel_values)
-                heel_range = heel_ceil - heel_floor
-                relative_threshold = (
-                    heel_floor
-                    if heel_range <= 1e-9 else
-                    heel_floor + contact_ratio * heel_range
-                )
-                absolute_threshold = heel_floor + absolute_floor_buffer
-                heel_threshold = min(relative_threshold, absolute_threshold)
-
-                search_start = max(start_frame, int(anchor_frame) - pre_anchor_frames)
-                search_end = min(end_frame, int(anchor_frame) + post_anchor_frames)
-                search_rows = [
-                    (frame, z)
-                    for frame, z in full_window_rows
-                    if search_start <= frame <= search_end
-                ]
-                if len(search_rows) < min_consecutive_frames:
-                    continue
+        frames = d["frame"]
+        heel_z = d["value"]
+        full_window = (frames >= start_frame) & (frames <= end_frame)
+        if not full_window.any():
+            continue
 
-                for i in range(0, len(search_rows) - min_consecutive_frames + 1):
-                    block = search_rows[i:i + min_consecutive_frames]
-                    block_values = [z for _, z in block]
-                    if not all(z <= heel_threshold for z in block_values):
-                        continue
+        heel_values = heel_z[full_window]
+        heel_floor = heel_values.min()
+        heel_ceil = heel_values.max()
+        heel_range = heel_ceil - heel_floor
+        relative_threshold = (
+            heel_floor
+            if heel_range <= 1e-9 else
+            heel_floor + contact_ratio * heel_range
+        )
+        absolute_threshold = heel_floor + absolute_floor_buffer
+        heel_threshold = min(relative_threshold, absolute_threshold)
+
+        search_start = max(start_frame, int(anchor_frame) - pre_anchor_frames)
+        search_end = min(end_frame, int(anchor_frame) + post_anchor_frames)
+        search_mask = full_window & (frames >= search_start) & (frames <= search_end)
+        search_frames = frames[search_mask]
+        search_values = heel_z[search_mask]
+        if len(search_values) < min_consecutive_frames:
+            continue
 
-                    # Contact should look settled, not like a single-frame downward spike.
-                    block_diffs = [
-                        block_values[j + 1] - block_values[j]
-                        for j in range(len(block_values) - 1)
-                    ]
-                    if any(diff < -flattening_tolerance for diff in block_diffs):
-                        continue
+        # A block qualifies when every frame is under the threshold and it looks
+        # settled, not like a single-frame downward spike.
+        block_ok = np.lib.stride_tricks.sliding_window_view(
+            search_values <= heel_threshold, min_consecutive_frames
+        ).all(axis=1)
+        if min_consecutive_frames > 1:
+            block_ok &= np.lib.stride_tricks.sliding_window_view(
+                np.diff(search_values) >= -flattening_tolerance, min_consecutive_frames - 1
+            ).all(axis=1)
 
-                    out[take_id] = int(block[0][0])
-                    break
+        first_block = np.flatnonzero(block_ok)
+        if first_block.size:
+            out[take_id] = int(search_frames[first_block[0]])
 
-            return out
-    finally:
-        conn.close()
+    return out
 
 # --------------------------------------------------
 # Sidebar
@@ -2518,7 +2052,8 @@ def build_pitcher_filters_for_group(selected_group_pitchers, group_index, show_g
         if multi_pitcher_group:
             st.sidebar.markdown(f"**{pitcher} Filters**")
 
-        session_dates = get_session_dates_for_pitcher(pitcher)
+        pitcher_id = get_athlete_id(pitcher)
+        session_dates = get_session_dates_for_pitcher(pitcher_id)
         if session_dates:
             session_dates_with_all = ["All Dates"] + session_dates
             session_dates_label = (
@@ -2550,7 +2085,7 @@ def build_pitcher_filters_for_group(selected_group_pitchers, group_index, show_g
         if not throw_types_i:
             throw_types_i = ["Mound"]
 
-        vel_min_i, vel_max_i = get_velocity_bounds(pitcher, selected_dates_i)
+        vel_min_i, vel_max_i = get_velocity_bounds(pitcher_id, selected_dates_i)
         if vel_min_i is not None and vel_max_i is not None:
             velocity_label = (
                 f"Group {group_index} Velocity Range{label_suffix} (mph)"
@@ -2595,34 +2130,26 @@ def get_filtered_takes_for_pitcher(pitcher, cfg):
     if velocity_min_i is None or velocity_max_i is None:
         return []
 
-    conn = get_connection()
-    try:
-        with conn.cursor() as cur:
-            if "All Dates" in selected_dates_i or not selected_dates_i:
-                cur.execute("""
-                    SELECT t.take_id, t.pitch_velo, t.take_date, a.athlete_name
-                    FROM takes t
-                    JOIN athletes a ON a.athlete_id = t.athlete_id
-                    WHERE a.athlete_name = %s
-                      AND t.throw_type = ANY(%s)
-                      AND t.pitch_velo BETWEEN %s AND %s
-                    ORDER BY a.athlete_name, t.take_date, t.take_id
-                """, (pitcher, throw_types_i, velocity_min_i, velocity_max_i))
-            else:
-                placeholders = ",".join(["%s"] * len(selected_dates_i))
-                cur.execute(f"""
-                    SELECT t.take_id, t.pitch_velo, t.take_date, a.athlete_name
-                    FROM takes t
-                    JOIN athletes a ON a.athlete_id = t.athlete_id
-                    WHERE a.athlete_name = %s
-                      AND t.throw_type = ANY(%s)
-                      AND t.take_date IN ({placeholders})
-                      AND t.pitch_velo BETWEEN %s AND %s
-                    ORDER BY a.athlete_name, t.take_date, t.take_id
-                """, (pitcher, throw_types_i, *selected_dates_i, velocity_min_i, velocity_max_i))
-            return cur.fetchall()
-    finally:
-        conn.close()
+    all_dates_i = "All Dates" in selected_dates_i or not selected_dates_i
+    with pooled_cursor() as cur:
+        execute_prepared(cur, "filtered_takes_for_pitcher", """
+            SELECT t.take_id, t.pitch_velo, t.take_date, a.athlete_name
+            FROM takes t
+            JOIN athletes a ON a.athlete_id = t.athlete_id
+            WHERE a.athlete_name = $1
+              AND t.throw_type = ANY($2::text[])
+              AND ($3::boolean OR t.take_date = ANY($4::date[]))
+              AND t.pitch_velo BETWEEN $5 AND $6
+            ORDER BY a.athlete_name, t.take_date, t.take_id
+        """, (
+            pitcher,
+            throw_types_i,
+            all_dates_i,
+            [] if all_dates_i else as_date_list(selected_dates_i),
+            velocity_min_i,
+            velocity_max_i,
+        ))
+        return cur.fetchall()
 
 def build_take_options_for_group(group_pitcher_filters):
     from collections import defaultdict
@@ -2703,20 +2230,15 @@ def build_take_exclusion_options(take_ids):
     if not take_ids:
         return [], {}
 
-    conn = get_connection()
-    try:
-        with conn.cursor() as cur:
-            placeholders = ",".join(["%s"] * len(take_ids))
-            cur.execute(f"""
-                SELECT t.take_id, t.pitch_velo, t.take_date, a.athlete_name
-                FROM takes t
-                JOIN athletes a ON a.athlete_id = t.athlete_id
-                WHERE t.take_id IN ({placeholders})
-                ORDER BY a.athlete_name, t.take_date, t.take_id
-            """, tuple(take_ids))
-            rows = cur.fetchall()
-    finally:
-        conn.close()
+    with pooled_cursor() as cur:
+        execute_prepared(cur, "take_labels_by_id", """
+            SELECT t.take_id, t.pitch_velo, t.take_date, a.athlete_name
+            FROM takes t
+            JOIN athletes a ON a.athlete_id = t.athlete_id
+            WHERE t.take_id = ANY($1::bigint[])
+            ORDER BY a.athlete_name, t.take_date, t.take_id
+        """, (list(take_ids),))
+        rows = cur.fetchall()
 
     from collections import defaultdict
 
@@ -2733,13 +2255,8 @@ def build_take_exclusion_options(take_ids):
             velo_label = f"{float(velo):.1f}" if velo is not None else "N/A"
             take_labels[tid] = f"{pitcher} | {date_label} - Pitch {i} ({velo_label} mph)"
 
-    take_options = [take_labels[tid] for tid in take_ids if tid in take_labels]
-    label_to_take_id = {
-        take_labels[tid]: tid
-        for tid in take_ids
-        if tid in take_labels
-    }
-    return take_options, label_to_take_id
+    label_pairs = [(take_labels[tid], tid) for tid in take_ids if tid in take_labels]
+    return [label for label, _ in label_pairs], dict(label_pairs)
 
 
 def render_control_group_exclude_takes(key, container=st.sidebar):
@@ -2973,51 +2490,197 @@ def render_group_selection_summary():
             f"Velocity Range (mph): {velocity_label}"
         )
 
-def aggregate_curves(curves_dict, stat="Median"):
+def aggregate_curves(curves_dict, stat="Median", as_arrays=False):
     """
     curves_dict: { take_id: { "frame": [...], "value": [...] } }
-    Returns aggregated_x, aggregated_y, iqr_low, iqr_high
+    Returns aggregated_x, aggregated_y, iqr_low, iqr_high as lists, or as
+    NumPy arrays with as_arrays=True.
     """
     if (
         len(curves_dict) == 1
         and any("q1" in d and "q3" in d for d in curves_dict.values())
     ):
         curve = next(iter(curves_dict.values()))
+        convert = np.asarray if as_arrays else list
         return (
-            list(curve.get("frame", [])),
-            list(curve.get("value", [])),
-            list(curve.get("q1", [])),
-            list(curve.get("q3", [])),
+            convert(curve.get("frame", [])),
+            convert(curve.get("value", [])),
+            convert(curve.get("q1", [])),
+            convert(curve.get("q3", [])),
         )
 
-    all_frames = sorted(set(
-        f for d in curves_dict.values() for f in d["frame"]
-    ))
+    curves = [d for d in curves_dict.values() if len(d["frame"])]
+    if not curves:
+        if as_arrays:
+            return (np.empty(0, dtype=np.int64),) + tuple(np.empty(0) for _ in range(3))
+        return [], [], [], []
+
+    frames = np.concatenate([np.asarray(d["frame"]) for d in curves])
+    values = np.concatenate([np.asarray(d["value"], dtype=np.float64) for d in curves])
+    order = np.argsort(frames, kind="stable")
+    frames = frames[order]
+    values = values[order]
+
+    all_frames, starts, counts = np.unique(frames, return_index=True, return_counts=True)
+
+    # One row per frame, padded with NaN, so every statistic is a single
+    # column-wise reduction instead of a per-frame scan of every take
+    grid = np.full((len(all_frames), counts.max()), np.nan)
+    grid[
+        np.repeat(np.arange(len(all_frames)), counts),
+        np.arange(len(frames)) - np.repeat(starts, counts),
+    ] = values
+
+    if stat == "Mean":
+        agg_y = np.nanmean(grid, axis=1)
+    else:
+        agg_y = np.nanmedian(grid, axis=1)
+    iqr_low, iqr_high = np.nanpercentile(grid, [25, 75], axis=1)
 
-    agg_y = []
-    iqr_low = []
-    iqr_high = []
+    if as_arrays:
+        return all_frames, agg_y, iqr_low, iqr_high
+    return all_frames.tolist(), agg_y.tolist(), iqr_low.tolist(), iqr_high.tolist()
 
-    for f in all_frames:
-        vals = [
-            d["value"][i]
-            for d in curves_dict.values()
-            for i, fr in enumerate(d["frame"])
-            if fr == f
-        ]
+@st.cache_data(ttl=CACHE_TTL_SECONDS, show_spinner=False, hash_funcs=TAKE_ID_HASH_FUNCS)
+def get_shared_event_frames(take_ids_by_handedness):
+    """
+    Detects the per-take events every tab shares: ball release, MER, peak knee
+    height and foot plant (clamped to MER).
 
-        if not vals:
-            continue
+    take_ids_by_handedness: { "R": TakeIds, "L": TakeIds } built with
+    take_id_key, so reruns over the same takes (slider moves, tab switches)
+    reuse the cached frames instead of re-deriving them.
+    Returns { "br_frames", "shoulder_er_max_frames", "knee_peak_frames", "foot_plant_frames" }
+    """
+    # The id tuples are passed through unchanged so every loader below hashes
+    # the same objects (see cache_keys.TakeIds)
+    take_ids_by_handedness = {
+        hand: ids for hand, ids in take_ids_by_handedness.items() if ids
+    }
+    active_hands = list(take_ids_by_handedness)
+    take_handedness = {
+        take_id: hand
+        for hand, ids in take_ids_by_handedness.items()
+        for take_id in ids
+    }
 
-        if stat == "Mean":
-            agg_y.append(np.mean(vals))
-        else:
-            agg_y.append(np.median(vals))
+    # Wave 1: series and events that only depend on the selected takes.
+    event_series = run_loaders_concurrently({
+        "cg": lambda: load_merged_by_handedness(get_hand_cg_velocity, take_ids_by_handedness),
+        "shoulder": lambda: load_merged_by_handedness(get_shoulder_er_angles, take_ids_by_handedness),
+        **{
+            ("ankle_prox_x_peak", hand): functools.partial(
+                get_peak_ankle_prox_x_velocity,
+                take_ids_by_handedness[hand],
+                hand,
+            )
+            for hand in active_hands
+        },
+    })
+    cg_data = event_series["cg"]
+    shoulder_data = event_series["shoulder"]
+
+    br_frames = {}
+    for take_id, d in cg_data.items():
+        br_frame = extreme_frame(d["frame"], d["x"])
+        if br_frame is not None:
+            br_frames[take_id] = br_frame
+
+    shoulder_er_max_frames = {}
+    for take_id, d in shoulder_data.items():
+        # RHP external rotation peaks negative, LHP positive
+        er_frame = extreme_frame(d["frame"], d["z"], largest=take_handedness[take_id] != "R")
+        if er_frame is not None:
+            shoulder_er_max_frames[take_id] = er_frame
+
+    def load_foot_plant_events(ids, hand, hand_ankle_prox_x_peak_frames):
+        hand_ankle_min_frames = get_ankle_min_frame(
+            ids,
+            hand,
+            hand_ankle_prox_x_peak_frames,
+            shoulder_er_max_frames
+        )
+        ankle_zero_cross_frames = get_foot_plant_frame_zero_cross(
+            ids,
+            hand,
+            hand_ankle_min_frames,
+            shoulder_er_max_frames
+        )
+        heel_anchor_frames = {
+            take_id: ankle_zero_cross_frames.get(take_id, hand_ankle_min_frames.get(take_id))
+            for take_id in ids
+        }
+        hand_heel_contact_frames = get_lead_heel_contact_frame(
+            ids,
+            hand,
+            hand_ankle_prox_x_peak_frames,
+            shoulder_er_max_frames,
+            heel_anchor_frames
+        )
+        return hand_ankle_min_frames, ankle_zero_cross_frames, hand_heel_contact_frames
+
+    # Wave 2: events anchored on ball release / MER, one chain per handedness.
+    anchored_events = run_loaders_concurrently({
+        **{
+            ("knee", hand): functools.partial(
+                get_peak_glove_knee_pre_br,
+                take_ids_by_handedness[hand],
+                hand,
+                br_frames,
+            )
+            for hand in active_hands
+        },
+        **{
+            ("foot_plant", hand): functools.partial(
+                load_foot_plant_events,
+                take_ids_by_handedness[hand],
+                hand,
+                event_series[("ankle_prox_x_peak", hand)],
+            )
+            for hand in active_hands
+        },
+    })
+
+    knee_peak_frames = {}
+    foot_plant_frames = {}
+    for hand in active_hands:
+        ids = take_ids_by_handedness[hand]
+        knee_peak_frames.update(anchored_events[("knee", hand)])
+        hand_ankle_prox_x_peak_frames = event_series[("ankle_prox_x_peak", hand)]
+        hand_ankle_min_frames, ankle_zero_cross_frames, heel_contact_frames = (
+            anchored_events[("foot_plant", hand)]
+        )
+
+        for take_id in ids:
+            ankle_fp_frame = ankle_zero_cross_frames.get(take_id)
+            heel_fp_frame = heel_contact_frames.get(take_id)
+            ankle_min_frame = hand_ankle_min_frames.get(take_id)
+            prox_peak_frame = hand_ankle_prox_x_peak_frames.get(take_id)
+
+            if ankle_fp_frame is not None and heel_fp_frame is not None:
+                foot_plant_frames[take_id] = int(max(ankle_fp_frame, heel_fp_frame))
+            elif ankle_fp_frame is not None:
+                foot_plant_frames[take_id] = int(ankle_fp_frame)
+            elif heel_fp_frame is not None:
+                foot_plant_frames[take_id] = int(heel_fp_frame)
+            elif ankle_min_frame is not None:
+                foot_plant_frames[take_id] = int(ankle_min_frame)
+            elif prox_peak_frame is not None:
+                foot_plant_frames[take_id] = int(prox_peak_frame)
+
+    for take_id, fp_frame in foot_plant_frames.items():
+        if take_id in shoulder_er_max_frames:
+            er_frame = shoulder_er_max_frames[take_id]
+            if fp_frame > er_frame:
+                foot_plant_frames[take_id] = er_frame
 
-        iqr_low.append(np.percentile(vals, 25))
-        iqr_high.append(np.percentile(vals, 75))
+    return {
+        "br_frames": br_frames,
+        "shoulder_er_max_frames": shoulder_er_max_frames,
+        "knee_peak_frames": knee_peak_frames,
+        "foot_plant_frames": foot_plant_frames,
+    }
 
-    return all_frames, agg_y, iqr_low, iqr_high
 
 def build_shared_dashboard_state():
     pitcher_handedness = {
@@ -3027,48 +2690,45 @@ def build_shared_dashboard_state():
 
     shared_take_ids = []
     shared_take_pitcher_map = {}
+    shared_take_rows = {}
     primary_take_ids = []
     control_take_ids = []
 
-    conn = get_connection()
-    try:
-        with conn.cursor() as cur:
-            for pitcher, cfg in pitcher_filters.items():
-                selected_dates_i = cfg["selected_dates"]
-                throw_types_i = cfg["throw_types"]
-                velocity_min_i = cfg["velocity_min"]
-                velocity_max_i = cfg["velocity_max"]
+    with pooled_cursor() as cur:
+        for pitcher, cfg in pitcher_filters.items():
+            selected_dates_i = cfg["selected_dates"]
+            throw_types_i = cfg["throw_types"]
+            velocity_min_i = cfg["velocity_min"]
+            velocity_max_i = cfg["velocity_max"]
 
-                if velocity_min_i is None or velocity_max_i is None:
-                    continue
+            if velocity_min_i is None or velocity_max_i is None:
+                continue
 
-                if "All Dates" in selected_dates_i or not selected_dates_i:
-                    cur.execute("""
-                        SELECT t.take_id
-                        FROM takes t
-                        JOIN athletes a ON a.athlete_id = t.athlete_id
-                        WHERE a.athlete_name = %s
-                          AND t.throw_type = ANY(%s)
-                          AND t.pitch_velo BETWEEN %s AND %s
-                    """, (pitcher, throw_types_i, velocity_min_i, velocity_max_i))
-                else:
-                    placeholders = ",".join(["%s"] * len(selected_dates_i))
-                    cur.execute(f"""
-                        SELECT t.take_id
-                        FROM takes t
-                        JOIN athletes a ON a.athlete_id = t.athlete_id
-                        WHERE a.athlete_name = %s
-                          AND t.throw_type = ANY(%s)
-                          AND t.take_date IN ({placeholders})
-                          AND t.pitch_velo BETWEEN %s AND %s
-                    """, (pitcher, throw_types_i, *selected_dates_i, velocity_min_i, velocity_max_i))
-
-                for (take_id,) in cur.fetchall():
-                    if take_id not in shared_take_pitcher_map:
-                        shared_take_pitcher_map[take_id] = pitcher
-                        shared_take_ids.append(take_id)
-    finally:
-        conn.close()
+            all_dates_i = "All Dates" in selected_dates_i or not selected_dates_i
+            # Velocity and date come back with the ids, so the take labels
+            # below need no second round-trip
+            execute_prepared(cur, "shared_takes_by_filter", """
+                SELECT t.take_id, t.pitch_velo, t.take_date
+                FROM takes t
+                JOIN athletes a ON a.athlete_id = t.athlete_id
+                WHERE a.athlete_name = $1
+                  AND t.throw_type = ANY($2::text[])
+                  AND ($3::boolean OR t.take_date = ANY($4::date[]))
+                  AND t.pitch_velo BETWEEN $5 AND $6
+            """, (
+                pitcher,
+                throw_types_i,
+                all_dates_i,
+                [] if all_dates_i else as_date_list(selected_dates_i),
+                velocity_min_i,
+                velocity_max_i,
+            ))
+
+            for take_id, velo, take_date in cur.fetchall():
+                if take_id not in shared_take_pitcher_map:
+                    shared_take_pitcher_map[take_id] = pitcher
+                    shared_take_rows[take_id] = (velo, take_date)
+                    shared_take_ids.append(take_id)
 
     if group_mode_enabled:
         if selected_take_ids_union:
@@ -3110,20 +2770,15 @@ def build_shared_dashboard_state():
         if not control_take_ids or not combined_take_ids:
             return
 
-        conn = get_connection()
-        try:
-            with conn.cursor() as cur:
-                placeholders = ",".join(["%s"] * len(combined_take_ids))
-                cur.execute(f"""
-                    SELECT t.take_id, t.pitch_velo, t.take_date, a.athlete_name, a.handedness
-                    FROM takes t
-                    JOIN athletes a ON a.athlete_id = t.athlete_id
-                    WHERE t.take_id IN ({placeholders})
-                    ORDER BY a.athlete_name, t.take_date, t.take_id
-                """, tuple(combined_take_ids))
-                combined_rows = cur.fetchall()
-        finally:
-            conn.close()
+        with pooled_cursor() as cur:
+            execute_prepared(cur, "take_labels_with_handedness_by_id", """
+                SELECT t.take_id, t.pitch_velo, t.take_date, a.athlete_name, a.handedness
+                FROM takes t
+                JOIN athletes a ON a.athlete_id = t.athlete_id
+                WHERE t.take_id = ANY($1::bigint[])
+                ORDER BY a.athlete_name, t.take_date, t.take_id
+            """, (list(combined_take_ids),))
+            combined_rows = cur.fetchall()
 
         from collections import defaultdict
 
@@ -3150,26 +2805,15 @@ def build_shared_dashboard_state():
                 shared_take_order[tid] = i
 
     if shared_take_ids:
-        conn = get_connection()
-        try:
-            with conn.cursor() as cur:
-                placeholders = ",".join(["%s"] * len(shared_take_ids))
-                cur.execute(f"""
-                    SELECT t.take_id, t.pitch_velo, t.take_date, a.athlete_name
-                    FROM takes t
-                    JOIN athletes a ON a.athlete_id = t.athlete_id
-                    WHERE t.take_id IN ({placeholders})
-                    ORDER BY a.athlete_name, t.take_date, t.take_id
-                """, tuple(shared_take_ids))
-                rows = cur.fetchall()
-        finally:
-            conn.close()
-
         from collections import defaultdict
 
         date_groups = defaultdict(list)
-        for tid, velo, date, pitcher in rows:
-            date_groups[(pitcher, date)].append((tid, velo))
+        for tid in sorted(
+            shared_take_ids,
+            key=lambda tid: (shared_take_pitcher_map[tid], shared_take_rows[tid][1], tid)
+        ):
+            velo, date = shared_take_rows[tid]
+            date_groups[(shared_take_pitcher_map[tid], date)].append((tid, velo))
 
         for (pitcher, date), items in date_groups.items():
             for i, (tid, velo) in enumerate(items, start=1):
@@ -3179,28 +2823,25 @@ def build_shared_dashboard_state():
                 shared_take_pitcher_name_map[tid] = pitcher
 
         if not group_mode_enabled:
-            take_options = [
+            # Format each label once and derive both the options and the lookup from it
+            label_pairs = [
                 (
                     f"{shared_take_pitcher_name_map[tid]} | {shared_take_date_map[tid]} - "
-                    f"Pitch {shared_take_order[tid]} ({shared_take_velocity[tid]:.1f} mph)"
+                    f"Pitch {shared_take_order[tid]} ({shared_take_velocity[tid]:.1f} mph)",
+                    tid,
                 )
                 for tid in shared_take_ids
             ]
-
-            label_to_take_id = {
-                (
-                    f"{shared_take_pitcher_name_map[tid]} | {shared_take_date_map[tid]} - "
-                    f"Pitch {shared_take_order[tid]} ({shared_take_velocity[tid]:.1f} mph)"
-                ): tid
-                for tid in shared_take_ids
-            }
+            take_options = [label for label, _ in label_pairs]
+            label_to_take_id = dict(label_pairs)
+            previously_excluded = set(st.session_state["excluded_take_ids"])
 
             excluded_labels = st.sidebar.multiselect(
                 "Exclude Takes",
                 options=take_options,
                 default=[
-                    label for label, tid in label_to_take_id.items()
-                    if tid in st.session_state["excluded_take_ids"]
+                    label for label, tid in label_pairs
+                    if tid in previously_excluded
                 ],
                 key="exclude_takes"
             )
@@ -3399,13 +3040,11 @@ def build_shared_dashboard_state():
         hand = shared_take_handedness.get(tid)
         if hand in ("R", "L"):
             shared_take_ids_by_handedness[hand].append(tid)
-
-    def load_by_handedness(loader_fn):
-        merged = {}
-        for hand, ids in shared_take_ids_by_handedness.items():
-            if ids:
-                merged.update(loader_fn(ids, hand))
-        return merged
+    # Sorted tuples are the cache keys every loader below receives
+    shared_take_ids_by_handedness = {
+        hand: take_id_key(ids)
+        for hand, ids in shared_take_ids_by_handedness.items()
+    }
 
     shared_br_frames = {}
     shared_shoulder_er_max_frames = {}
@@ -3417,92 +3056,11 @@ def build_shared_dashboard_state():
     shared_window_start = -100
 
     if shared_take_ids:
-        cg_data = load_by_handedness(get_hand_cg_velocity)
-        shoulder_data = load_by_handedness(get_shoulder_er_angles)
-
-        for take_id in shared_take_ids:
-            if take_id in cg_data:
-                cg_frames = cg_data[take_id]["frame"]
-                cg_vals = cg_data[take_id]["x"]
-                valid = [(i, v) for i, v in enumerate(cg_vals) if v is not None]
-                if valid:
-                    idx, _ = max(valid, key=lambda x: x[1])
-                    shared_br_frames[take_id] = cg_frames[idx]
-
-        for take_id, d in shoulder_data.items():
-            frames = d["frame"]
-            values = d["z"]
-            valid = [(f, v) for f, v in zip(frames, values) if v is not None]
-            if not valid:
-                continue
-
-            hand = shared_take_handedness.get(take_id)
-            if hand == "R":
-                er_frame, _ = min(valid, key=lambda x: x[1])
-            else:
-                er_frame, _ = max(valid, key=lambda x: x[1])
-            shared_shoulder_er_max_frames[take_id] = er_frame
-
-        ankle_prox_x_peak_frames = {}
-        ankle_min_frames = {}
-        heel_contact_frames = {}
-        for hand, ids in shared_take_ids_by_handedness.items():
-            if not ids:
-                continue
-            shared_knee_peak_frames.update(
-                get_peak_glove_knee_pre_br(ids, hand, shared_br_frames)
-            )
-            hand_ankle_prox_x_peak_frames = get_peak_ankle_prox_x_velocity(ids, hand)
-            ankle_prox_x_peak_frames.update(hand_ankle_prox_x_peak_frames)
-            hand_ankle_min_frames = get_ankle_min_frame(
-                ids,
-                hand,
-                hand_ankle_prox_x_peak_frames,
-                shared_shoulder_er_max_frames
-            )
-            ankle_min_frames.update(hand_ankle_min_frames)
-            ankle_zero_cross_frames = get_foot_plant_frame_zero_cross(
-                ids,
-                hand,
-                hand_ankle_min_frames,
-                shared_shoulder_er_max_frames
-            )
-            heel_anchor_frames = {
-                take_id: ankle_zero_cross_frames.get(take_id, hand_ankle_min_frames.get(take_id))
-                for take_id in ids
-            }
-            heel_contact_frames.update(
-                get_lead_heel_contact_frame(
-                    ids,
-                    hand,
-                    hand_ankle_prox_x_peak_frames,
-                    shared_shoulder_er_max_frames,
-                    heel_anchor_frames
-                )
-            )
-
-            for take_id in ids:
-                ankle_fp_frame = ankle_zero_cross_frames.get(take_id)
-                heel_fp_frame = heel_contact_frames.get(take_id)
-                ankle_min_frame = hand_ankle_min_frames.get(take_id)
-                prox_peak_frame = hand_ankle_prox_x_peak_frames.get(take_id)
-
-                if ankle_fp_frame is not None and heel_fp_frame is not None:
-                    shared_foot_plant_zero_cross_frames[take_id] = int(max(ankle_fp_frame, heel_fp_frame))
-                elif ankle_fp_frame is not None:
-                    shared_foot_plant_zero_cross_frames[take_id] = int(ankle_fp_frame)
-                elif heel_fp_frame is not None:
-                    shared_foot_plant_zero_cross_frames[take_id] = int(heel_fp_frame)
-                elif ankle_min_frame is not None:
-                    shared_foot_plant_zero_cross_frames[take_id] = int(ankle_min_frame)
-                elif prox_peak_frame is not None:
-                    shared_foot_plant_zero_cross_frames[take_id] = int(prox_peak_frame)
-
-        for take_id, fp_frame in shared_foot_plant_zero_cross_frames.items():
-            if take_id in shared_shoulder_er_max_frames:
-                er_frame = shared_shoulder_er_max_frames[take_id]
-                if fp_frame > er_frame:
-                    shared_foot_plant_zero_cross_frames[take_id] = er_frame
+        event_frames = get_shared_event_frames(shared_take_ids_by_handedness)
+        shared_br_frames = event_frames["br_frames"]
+        shared_shoulder_er_max_frames = event_frames["shoulder_er_max_frames"]
+        shared_knee_peak_frames = event_frames["knee_peak_frames"]
+        shared_foot_plant_zero_cross_frames = event_frames["foot_plant_frames"]
 
         for take_id, fp_frame in shared_foot_plant_zero_cross_frames.items():
             if take_id in shared_br_frames:
@@ -3542,39 +3100,35 @@ def build_shared_dashboard_state():
 
 
 
-@st.cache_data(ttl=300, show_spinner=False)
+@st.cache_data(ttl=CACHE_TTL_SECONDS, show_spinner=False)
 def get_reference_velocity_bounds(pitcher_names, handedness_filter):
     """
     Returns lightweight mound-throw velocity bounds without loading time-series
     data or calculating arm slot.
     """
-    conn = get_connection()
-    try:
-        with conn.cursor() as cur:
-            params = []
-            clauses = ["t.pitch_velo IS NOT NULL", "t.throw_type = 'Mound'"]
-            if pitcher_names:
-                clauses.append("a.athlete_name = ANY(%s)")
-                params.append(list(pitcher_names))
-            if handedness_filter in ("R", "L"):
-                clauses.append("a.handedness = %s")
-                params.append(handedness_filter)
-            cur.execute(
-                f"""
-                SELECT MIN(t.pitch_velo), MAX(t.pitch_velo)
-                FROM takes t
-                JOIN athletes a ON a.athlete_id = t.athlete_id
-                WHERE {" AND ".join(clauses)}
-                """,
-                tuple(params),
-            )
-            row = cur.fetchone()
-            return row if row else (None, None)
-    finally:
-        conn.close()
+    with pooled_cursor() as cur:
+        params = []
+        clauses = ["t.pitch_velo IS NOT NULL", "t.throw_type = 'Mound'"]
+        if pitcher_names:
+            clauses.append("a.athlete_name = ANY(%s)")
+            params.append(list(pitcher_names))
+        if handedness_filter in ("R", "L"):
+            clauses.append("a.handedness = %s")
+            params.append(handedness_filter)
+        cur.execute(
+            f"""
+            SELECT MIN(t.pitch_velo), MAX(t.pitch_velo)
+            FROM takes t
+            JOIN athletes a ON a.athlete_id = t.athlete_id
+            WHERE {" AND ".join(clauses)}
+            """,
+            tuple(params),
+        )
+        row = cur.fetchone()
+        return row if row else (None, None)
 
 
-@st.cache_data(ttl=300, show_spinner=False)
+@st.cache_data(ttl=CACHE_TTL_SECONDS, show_spinner=False)
 def get_report_reference_take_metadata():
     """
     Lightweight take metadata for Report tab filters.
@@ -3584,53 +3138,49 @@ def get_report_reference_take_metadata():
     when that table exists.
     """
     ensure_report_filter_indexes()
-    conn = get_connection()
-    try:
-        with conn.cursor() as cur:
-            cur.execute("SELECT to_regclass('public.take_biomech_metadata')")
-            metadata_table_exists = cur.fetchone()[0] is not None
-            arm_slot_select = (
-                "bm.arm_slot_deg, bm.arm_slot_bucket"
-                if metadata_table_exists else
-                "NULL::double precision AS arm_slot_deg, NULL::text AS arm_slot_bucket"
-            )
-            arm_slot_join = (
-                "LEFT JOIN take_biomech_metadata bm ON bm.take_id = t.take_id"
-                if metadata_table_exists else
-                ""
-            )
-            cur.execute(f"""
-                SELECT
-                    t.take_id,
-                    t.pitch_velo,
-                    t.take_date,
-                    COALESCE(t.throw_type, '') AS throw_type,
-                    a.athlete_name,
-                    a.handedness,
-                    {arm_slot_select}
-                FROM takes t
-                JOIN athletes a ON a.athlete_id = t.athlete_id
-                {arm_slot_join}
-                WHERE t.pitch_velo IS NOT NULL
-                  AND a.handedness IN ('R', 'L')
-                ORDER BY a.athlete_name, t.take_date, t.take_id
-            """)
-            return [
-                {
-                    "take_id": row[0],
-                    "pitch_velo": float(row[1]) if row[1] is not None else None,
-                    "take_date": row[2],
-                    "take_date_label": row[2].strftime("%Y-%m-%d") if row[2] else "",
-                    "throw_type": row[3],
-                    "athlete_name": row[4],
-                    "handedness": row[5],
-                    "arm_slot_deg": float(row[6]) if row[6] is not None else None,
-                    "arm_slot_bucket": row[7],
-                }
-                for row in cur.fetchall()
-            ]
-    finally:
-        conn.close()
+    with pooled_cursor() as cur:
+        cur.execute("SELECT to_regclass('public.take_biomech_metadata')")
+        metadata_table_exists = cur.fetchone()[0] is not None
+        arm_slot_select = (
+            "bm.arm_slot_deg, bm.arm_slot_bucket"
+            if metadata_table_exists else
+            "NULL::double precision AS arm_slot_deg, NULL::text AS arm_slot_bucket"
+        )
+        arm_slot_join = (
+            "LEFT JOIN take_biomech_metadata bm ON bm.take_id = t.take_id"
+            if metadata_table_exists else
+            ""
+        )
+        cur.execute(f"""
+            SELECT
+                t.take_id,
+                t.pitch_velo,
+                t.take_date,
+                COALESCE(t.throw_type, '') AS throw_type,
+                a.athlete_name,
+                a.handedness,
+                {arm_slot_select}
+            FROM takes t
+            JOIN athletes a ON a.athlete_id = t.athlete_id
+            {arm_slot_join}
+            WHERE t.pitch_velo IS NOT NULL
+              AND a.handedness IN ('R', 'L')
+            ORDER BY a.athlete_name, t.take_date, t.take_id
+        """)
+        return [
+            {
+                "take_id": row[0],
+                "pitch_velo": float(row[1]) if row[1] is not None else None,
+                "take_date": row[2],
+                "take_date_label": row[2].strftime("%Y-%m-%d") if row[2] else "",
+                "throw_type": row[3],
+                "athlete_name": row[4],
+                "handedness": row[5],
+                "arm_slot_deg": float(row[6]) if row[6] is not None else None,
+                "arm_slot_bucket": row[7],
+            }
+            for row in cur.fetchall()
+        ]
 
 
 def filter_reference_metadata(
@@ -3742,8 +3292,7 @@ def build_take_options_from_metadata(metadata_rows):
 
 
 def ensure_report_filter_indexes():
-    conn = get_connection()
-    try:
+    with pooled_connection() as conn:
         try:
             with conn:
                 with conn.cursor() as cur:
@@ -3769,8 +3318,6 @@ def ensure_report_filter_indexes():
                         )
         except Exception:
             conn.rollback()
-    finally:
-        conn.close()
 
 
 def format_report_velocity_range(velocity_range):
@@ -3788,7 +3335,6 @@ def format_report_list_label(values, all_label="All", max_items=4):
     return f"{', '.join(values[:max_items])} + {len(values) - max_items} more"
 
 
-@st.cache_data(ttl=300, show_spinner=False)
 def get_pelvis_angular_velocity_x(take_ids, handedness=None):
     """
     Returns pelvis angular velocity x_data over frames for given take_ids.
@@ -3796,34 +3342,9 @@ def get_pelvis_angular_velocity_x(take_ids, handedness=None):
     if not take_ids:
         return {}
 
-    conn = get_connection()
-    try:
-        with conn.cursor() as cur:
-            placeholders = ",".join(["%s"] * len(take_ids))
-            cur.execute(f"""
-                SELECT
-                    ts.take_id,
-                    ts.frame,
-                    ts.x_data
-                FROM time_series_data ts
-                JOIN categories c ON ts.category_id = c.category_id
-                JOIN segments s ON ts.segment_id = s.segment_id
-                WHERE c.category_name = 'ORIGINAL'
-                  AND s.segment_name = 'PELVIS_ANGULAR_VELOCITY'
-                  AND ts.take_id IN ({placeholders})
-                ORDER BY ts.take_id, ts.frame
-            """, tuple(take_ids))
-            data = {}
-            for take_id, frame, x in cur.fetchall():
-                data.setdefault(take_id, {"frame": [], "value": []})
-                data[take_id]["frame"].append(frame)
-                data[take_id]["value"].append(x)
-            return data
-    finally:
-        conn.close()
+    return load_time_series_component(take_ids, "ORIGINAL", "PELVIS_ANGULAR_VELOCITY", "x")
 
 
-@st.cache_data(ttl=300, show_spinner=False)
 def get_pelvis_angular_velocity_y(take_ids, handedness=None):
     """
     Returns pelvis angular velocity y_data over frames for given take_ids.
@@ -3831,34 +3352,9 @@ def get_pelvis_angular_velocity_y(take_ids, handedness=None):
     if not take_ids:
         return {}
 
-    conn = get_connection()
-    try:
-        with conn.cursor() as cur:
-            placeholders = ",".join(["%s"] * len(take_ids))
-            cur.execute(f"""
-                SELECT
-                    ts.take_id,
-                    ts.frame,
-                    ts.y_data
-                FROM time_series_data ts
-                JOIN categories c ON ts.category_id = c.category_id
-                JOIN segments s ON ts.segment_id = s.segment_id
-                WHERE c.category_name = 'ORIGINAL'
-                  AND s.segment_name = 'PELVIS_ANGULAR_VELOCITY'
-                  AND ts.take_id IN ({placeholders})
-                ORDER BY ts.take_id, ts.frame
-            """, tuple(take_ids))
-            data = {}
-            for take_id, frame, y in cur.fetchall():
-                data.setdefault(take_id, {"frame": [], "value": []})
-                data[take_id]["frame"].append(frame)
-                data[take_id]["value"].append(y)
-            return data
-    finally:
-        conn.close()
+    return load_time_series_component(take_ids, "ORIGINAL", "PELVIS_ANGULAR_VELOCITY", "y")
 
 
-@st.cache_data(ttl=300, show_spinner=False)
 def get_pelvis_angular_velocity_z(take_ids, handedness=None):
     """
     Returns pelvis angular velocity z_data over frames for given take_ids.
@@ -3866,74 +3362,19 @@ def get_pelvis_angular_velocity_z(take_ids, handedness=None):
     if not take_ids:
         return {}
 
-    conn = get_connection()
-    try:
-        with conn.cursor() as cur:
-            placeholders = ",".join(["%s"] * len(take_ids))
-            cur.execute(f"""
-                SELECT
-                    ts.take_id,
-                    ts.frame,
-                    ts.z_data
-                FROM time_series_data ts
-                JOIN categories c ON ts.category_id = c.category_id
-                JOIN segments s ON ts.segment_id = s.segment_id
-                WHERE c.category_name = 'ORIGINAL'
-                  AND s.segment_name = 'PELVIS_ANGULAR_VELOCITY'
-                  AND ts.take_id IN ({placeholders})
-                ORDER BY ts.take_id, ts.frame
-            """, tuple(take_ids))
-            data = {}
-            for take_id, frame, z in cur.fetchall():
-                data.setdefault(take_id, {"frame": [], "value": []})
-                data[take_id]["frame"].append(frame)
-                data[take_id]["value"].append(z)
-            return data
-    finally:
-        conn.close()
+    return load_time_series_component(take_ids, "ORIGINAL", "PELVIS_ANGULAR_VELOCITY", "z")
 
 
-@st.cache_data(ttl=300, show_spinner=False)
 def get_torso_angular_velocity_component(take_ids, component, handedness=None):
     """
     Returns one torso angular velocity component over frames for given take_ids.
     """
     if not take_ids:
         return {}
-    component_columns = {
-        "x": "x_data",
-        "y": "y_data",
-        "z": "z_data",
-    }
-    column = component_columns.get(component)
-    if column is None:
+    if component not in TIME_SERIES_COMPONENTS:
         return {}
 
-    conn = get_connection()
-    try:
-        with conn.cursor() as cur:
-            placeholders = ",".join(["%s"] * len(take_ids))
-            cur.execute(f"""
-                SELECT
-                    ts.take_id,
-                    ts.frame,
-                    ts.{column}
-                FROM time_series_data ts
-                JOIN categories c ON ts.category_id = c.category_id
-                JOIN segments s ON ts.segment_id = s.segment_id
-                WHERE c.category_name = 'ORIGINAL'
-                  AND s.segment_name = 'TORSO_ANGULAR_VELOCITY'
-                  AND ts.take_id IN ({placeholders})
-                ORDER BY ts.take_id, ts.frame
-            """, tuple(take_ids))
-            data = {}
-            for take_id, frame, value in cur.fetchall():
-                data.setdefault(take_id, {"frame": [], "value": []})
-                data[take_id]["frame"].append(frame)
-                data[take_id]["value"].append(value)
-            return data
-    finally:
-        conn.close()
+    return load_time_series_component(take_ids, "ORIGINAL", "TORSO_ANGULAR_VELOCITY", component)
 
 
 def get_torso_angular_velocity_x(take_ids, handedness=None):
@@ -3948,7 +3389,6 @@ def get_torso_angular_velocity_z(take_ids, handedness=None):
     return get_torso_angular_velocity_component(take_ids, "z", handedness)
 
 
-@st.cache_data(ttl=300, show_spinner=False)
 def get_torso_pelvis_angular_velocity_component(take_ids, component, handedness=None):
     """
     Returns torso-pelvis angular velocity component data.
@@ -3957,74 +3397,19 @@ def get_torso_pelvis_angular_velocity_component(take_ids, component, handedness=
     """
     if not take_ids:
         return {}
-    component_columns = {
-        "x": "x_data",
-        "y": "y_data",
-        "z": "z_data",
-    }
-    column = component_columns.get(component)
-    if column is None:
+    if component not in TIME_SERIES_COMPONENTS:
         return {}
 
-    conn = get_connection()
-    try:
-        with conn.cursor() as cur:
-            placeholders = ",".join(["%s"] * len(take_ids))
-            cur.execute(f"""
-                SELECT
-                    ts.take_id,
-                    ts.frame,
-                    ts.{column}
-                FROM time_series_data ts
-                JOIN categories c ON ts.category_id = c.category_id
-                JOIN segments s ON ts.segment_id = s.segment_id
-                WHERE c.category_name = 'ORIGINAL'
-                  AND s.segment_name = 'TORSO_PELVIS_ANGULAR_VELOCITY'
-                  AND ts.take_id IN ({placeholders})
-                ORDER BY ts.take_id, ts.frame
-            """, tuple(take_ids))
-
-            data = {}
-            for take_id, frame, value in cur.fetchall():
-                data.setdefault(take_id, {"frame": [], "value": []})
-                data[take_id]["frame"].append(frame)
-                data[take_id]["value"].append(value)
-            return data
-    finally:
-        conn.close()
+    return load_time_series_component(take_ids, "ORIGINAL", "TORSO_PELVIS_ANGULAR_VELOCITY", component)
 
 
-@st.cache_data(ttl=300, show_spinner=False)
 def get_pelvis_angle_components(take_ids):
     """
     Returns pelvis angle components from ORIGINAL / PELVIS_ANGLE.
     """
     if not take_ids:
         return {}
-    conn = get_connection()
-    try:
-        with conn.cursor() as cur:
-            placeholders = ",".join(["%s"] * len(take_ids))
-            cur.execute(f"""
-                SELECT ts.take_id, ts.frame, ts.x_data, ts.y_data, ts.z_data
-                FROM time_series_data ts
-                JOIN categories c ON ts.category_id = c.category_id
-                JOIN segments s ON ts.segment_id = s.segment_id
-                WHERE c.category_name = 'ORIGINAL'
-                  AND s.segment_name = 'PELVIS_ANGLE'
-                  AND ts.take_id IN ({placeholders})
-                ORDER BY ts.take_id, ts.frame
-            """, tuple(take_ids))
-            data = {}
-            for take_id, frame, x, y, z in cur.fetchall():
-                data.setdefault(take_id, {"frame": [], "x": [], "y": [], "z": []})
-                data[take_id]["frame"].append(frame)
-                data[take_id]["x"].append(x)
-                data[take_id]["y"].append(y)
-                data[take_id]["z"].append(z)
-            return data
-    finally:
-        conn.close()
+    return load_time_series_xyz(take_ids, "ORIGINAL", "PELVIS_ANGLE")
 
 
 def get_pelvis_angle_component(take_ids, handedness, component):
@@ -4035,7 +3420,6 @@ def get_pelvis_angle_component(take_ids, handedness, component):
     }
 
 
-@st.cache_data(ttl=300, show_spinner=False)
 def get_joint_angle_rotation_component(take_ids, segment_name):
     """
     Returns JOINT_ANGLES z_data for report rotation convention.
@@ -4047,32 +3431,7 @@ def get_joint_angle_rotation_component(take_ids, segment_name):
     if not take_ids or segment_name not in {"PELVIS", "TORSO"}:
         return {}
 
-    conn = get_connection()
-    try:
-        with conn.cursor() as cur:
-            placeholders = ",".join(["%s"] * len(take_ids))
-            cur.execute(f"""
-                SELECT
-                    ts.take_id,
-                    ts.frame,
-                    ts.z_data
-                FROM time_series_data ts
-                JOIN categories c ON c.category_id = ts.category_id
-                JOIN segments s ON s.segment_id = ts.segment_id
-                WHERE c.category_name = 'JOINT_ANGLES'
-                  AND s.segment_name = %s
-                  AND ts.take_id IN ({placeholders})
-                  AND ts.z_data IS NOT NULL
-                ORDER BY ts.take_id, ts.frame
-            """, (segment_name, *take_ids))
-            data = {}
-            for take_id, frame, z in cur.fetchall():
-                data.setdefault(take_id, {"frame": [], "value": []})
-                data[take_id]["frame"].append(frame)
-                data[take_id]["value"].append(z)
-            return data
-    finally:
-        conn.close()
+    return load_time_series_component(take_ids, "JOINT_ANGLES", segment_name, "z", drop_null=True)
 
 
 def normalize_report_rotation_values(values, handedness):
@@ -4082,7 +3441,6 @@ def normalize_report_rotation_values(values, handedness):
     ]
 
 
-@st.cache_data(ttl=300, show_spinner=False)
 def get_hip_angle_components(take_ids, segment_name):
     """
     Returns hip angle components from ORIGINAL / LT_HIP_ANGLE or RT_HIP_ANGLE.
@@ -4092,30 +3450,7 @@ def get_hip_angle_components(take_ids, segment_name):
     if segment_name not in {"LT_HIP_ANGLE", "RT_HIP_ANGLE"}:
         return {}
 
-    conn = get_connection()
-    try:
-        with conn.cursor() as cur:
-            placeholders = ",".join(["%s"] * len(take_ids))
-            cur.execute(f"""
-                SELECT ts.take_id, ts.frame, ts.x_data, ts.y_data, ts.z_data
-                FROM time_series_data ts
-                JOIN categories c ON ts.category_id = c.category_id
-                JOIN segments s ON ts.segment_id = s.segment_id
-                WHERE c.category_name = 'ORIGINAL'
-                  AND s.segment_name = %s
-                  AND ts.take_id IN ({placeholders})
-                ORDER BY ts.take_id, ts.frame
-            """, (segment_name, *tuple(take_ids)))
-            data = {}
-            for take_id, frame, x, y, z in cur.fetchall():
-                data.setdefault(take_id, {"frame": [], "x": [], "y": [], "z": []})
-                data[take_id]["frame"].append(frame)
-                data[take_id]["x"].append(x)
-                data[take_id]["y"].append(y)
-                data[take_id]["z"].append(z)
-            return data
-    finally:
-        conn.close()
+    return load_time_series_xyz(take_ids, "ORIGINAL", segment_name)
 
 
 def get_hip_segment_prefix(handedness, hip_role):
@@ -4155,7 +3490,6 @@ def get_hip_angle_component(take_ids, handedness, hip_role, component):
     }
 
 
-@st.cache_data(ttl=300, show_spinner=False)
 def get_hip_angular_velocity_components(take_ids, segment_name):
     """
     Returns hip angular velocity components from ORIGINAL / LT_HIP_ANGULAR_VELOCITY or RT_HIP_ANGULAR_VELOCITY.
@@ -4165,30 +3499,7 @@ def get_hip_angular_velocity_components(take_ids, segment_name):
     if segment_name not in {"LT_HIP_ANGULAR_VELOCITY", "RT_HIP_ANGULAR_VELOCITY"}:
         return {}
 
-    conn = get_connection()
-    try:
-        with conn.cursor() as cur:
-            placeholders = ",".join(["%s"] * len(take_ids))
-            cur.execute(f"""
-                SELECT ts.take_id, ts.frame, ts.x_data, ts.y_data, ts.z_data
-                FROM time_series_data ts
-                JOIN categories c ON ts.category_id = c.category_id
-                JOIN segments s ON ts.segment_id = s.segment_id
-                WHERE c.category_name = 'ORIGINAL'
-                  AND s.segment_name = %s
-                  AND ts.take_id IN ({placeholders})
-                ORDER BY ts.take_id, ts.frame
-            """, (segment_name, *tuple(take_ids)))
-            data = {}
-            for take_id, frame, x, y, z in cur.fetchall():
-                data.setdefault(take_id, {"frame": [], "x": [], "y": [], "z": []})
-                data[take_id]["frame"].append(frame)
-                data[take_id]["x"].append(x)
-                data[take_id]["y"].append(y)
-                data[take_id]["z"].append(z)
-            return data
-    finally:
-        conn.close()
+    return load_time_series_xyz(take_ids, "ORIGINAL", segment_name)
 
 
 def get_hip_angular_velocity_component(take_ids, handedness, hip_role, component):
@@ -4200,7 +3511,6 @@ def get_hip_angular_velocity_component(take_ids, handedness, hip_role, component
     }
 
 
-@st.cache_data(ttl=300, show_spinner=False)
 def get_lower_extremity_angle_components(take_ids, segment_name):
     """
     Returns knee or ankle angle components from ORIGINAL.
@@ -4210,30 +3520,7 @@ def get_lower_extremity_angle_components(take_ids, segment_name):
     if segment_name not in {"LT_KNEE_ANGLE", "RT_KNEE_ANGLE", "LT_ANKLE_ANGLE", "RT_ANKLE_ANGLE"}:
         return {}
 
-    conn = get_connection()
-    try:
-        with conn.cursor() as cur:
-            placeholders = ",".join(["%s"] * len(take_ids))
-            cur.execute(f"""
-                SELECT ts.take_id, ts.frame, ts.x_data, ts.y_data, ts.z_data
-                FROM time_series_data ts
-                JOIN categories c ON ts.category_id = c.category_id
-                JOIN segments s ON ts.segment_id = s.segment_id
-                WHERE c.category_name = 'ORIGINAL'
-                  AND s.segment_name = %s
-                  AND ts.take_id IN ({placeholders})
-                ORDER BY ts.take_id, ts.frame
-            """, (segment_name, *tuple(take_ids)))
-            data = {}
-            for take_id, frame, x, y, z in cur.fetchall():
-                data.setdefault(take_id, {"frame": [], "x": [], "y": [], "z": []})
-                data[take_id]["frame"].append(frame)
-                data[take_id]["x"].append(x)
-                data[take_id]["y"].append(y)
-                data[take_id]["z"].append(z)
-            return data
-    finally:
-        conn.close()
+    return load_time_series_xyz(take_ids, "ORIGINAL", segment_name)
 
 
 def get_lower_extremity_angle_component(take_ids, handedness, leg_role, joint, component):
@@ -4250,7 +3537,6 @@ def normalize_identity(value, handedness=None):
     return value
 
 
-@st.cache_data(ttl=300, show_spinner=False)
 def get_lower_extremity_angular_velocity_components(take_ids, segment_name):
     """
     Returns knee or ankle angular velocity components from ORIGINAL.
@@ -4265,30 +3551,7 @@ def get_lower_extremity_angular_velocity_components(take_ids, segment_name):
     }:
         return {}
 
-    conn = get_connection()
-    try:
-        with conn.cursor() as cur:
-            placeholders = ",".join(["%s"] * len(take_ids))
-            cur.execute(f"""
-                SELECT ts.take_id, ts.frame, ts.x_data, ts.y_data, ts.z_data
-                FROM time_series_data ts
-                JOIN categories c ON ts.category_id = c.category_id
-                JOIN segments s ON ts.segment_id = s.segment_id
-                WHERE c.category_name = 'ORIGINAL'
-                  AND s.segment_name = %s
-                  AND ts.take_id IN ({placeholders})
-                ORDER BY ts.take_id, ts.frame
-            """, (segment_name, *tuple(take_ids)))
-            data = {}
-            for take_id, frame, x, y, z in cur.fetchall():
-                data.setdefault(take_id, {"frame": [], "x": [], "y": [], "z": []})
-                data[take_id]["frame"].append(frame)
-                data[take_id]["x"].append(x)
-                data[take_id]["y"].append(y)
-                data[take_id]["z"].append(z)
-            return data
-    finally:
-        conn.close()
+    return load_time_series_xyz(take_ids, "ORIGINAL", segment_name)
 
 
 def get_lower_extremity_angular_velocity_component(take_ids, handedness, leg_role, joint, component):
@@ -4301,40 +3564,15 @@ def get_lower_extremity_angular_velocity_component(take_ids, handedness, leg_rol
     }
 
 
-@st.cache_data(ttl=300, show_spinner=False)
 def get_torso_pelvis_angle_components(take_ids):
     """
     Returns torso-pelvis angle components from ORIGINAL / TORSO_PELVIS_ANGLE.
     """
     if not take_ids:
         return {}
-    conn = get_connection()
-    try:
-        with conn.cursor() as cur:
-            placeholders = ",".join(["%s"] * len(take_ids))
-            cur.execute(f"""
-                SELECT ts.take_id, ts.frame, ts.x_data, ts.y_data, ts.z_data
-                FROM time_series_data ts
-                JOIN categories c ON ts.category_id = c.category_id
-                JOIN segments s ON ts.segment_id = s.segment_id
-                WHERE c.category_name = 'ORIGINAL'
-                  AND s.segment_name = 'TORSO_PELVIS_ANGLE'
-                  AND ts.take_id IN ({placeholders})
-                ORDER BY ts.take_id, ts.frame
-            """, tuple(take_ids))
-            data = {}
-            for take_id, frame, x, y, z in cur.fetchall():
-                data.setdefault(take_id, {"frame": [], "x": [], "y": [], "z": []})
-                data[take_id]["frame"].append(frame)
-                data[take_id]["x"].append(x)
-                data[take_id]["y"].append(y)
-                data[take_id]["z"].append(z)
-            return data
-    finally:
-        conn.close()
+    return load_time_series_xyz(take_ids, "ORIGINAL", "TORSO_PELVIS_ANGLE")
 
 
-@st.cache_data(ttl=300, show_spinner=False)
 def get_hand_cg_velocity_components(take_ids, handedness):
     """
     Returns throwing-hand center-of-gravity velocity components.
@@ -4346,36 +3584,7 @@ def get_hand_cg_velocity_components(take_ids, handedness):
 
     segment_name = "RHA" if handedness == "R" else "LHA"
 
-    conn = get_connection()
-    try:
-        with conn.cursor() as cur:
-            placeholders = ",".join(["%s"] * len(take_ids))
-            cur.execute(f"""
-                SELECT
-                    ts.take_id,
-                    ts.frame,
-                    ts.x_data,
-                    ts.y_data,
-                    ts.z_data
-                FROM time_series_data ts
-                JOIN categories c ON ts.category_id = c.category_id
-                JOIN segments s ON ts.segment_id = s.segment_id
-                WHERE c.category_name = 'KINETIC_KINEMATIC_CGVel'
-                  AND s.segment_name = %s
-                  AND ts.take_id IN ({placeholders})
-                ORDER BY ts.take_id, ts.frame
-            """, (segment_name, *take_ids))
-
-            data = {}
-            for take_id, frame, x, y, z in cur.fetchall():
-                data.setdefault(take_id, {"frame": [], "x": [], "y": [], "z": []})
-                data[take_id]["frame"].append(frame)
-                data[take_id]["x"].append(x)
-                data[take_id]["y"].append(y)
-                data[take_id]["z"].append(z)
-            return data
-    finally:
-        conn.close()
+    return load_time_series_xyz(take_ids, "KINETIC_KINEMATIC_CGVel", segment_name)
 
 
 def get_hand_cg_velocity_component(take_ids, handedness, component):
@@ -4386,7 +3595,6 @@ def get_hand_cg_velocity_component(take_ids, handedness, component):
     }
 
 
-@st.cache_data(ttl=300, show_spinner=False)
 def get_center_of_mass_velocity_component(take_ids, component, handedness=None):
     """
     Returns Center of Mass velocity component data.
@@ -4396,42 +3604,10 @@ def get_center_of_mass_velocity_component(take_ids, component, handedness=None):
     """
     if not take_ids:
         return {}
-    component_columns = {
-        "x": "x_data",
-        "y": "y_data",
-        "z": "z_data",
-    }
-    column = component_columns.get(component)
-    if column is None:
+    if component not in TIME_SERIES_COMPONENTS:
         return {}
 
-    conn = get_connection()
-    try:
-        with conn.cursor() as cur:
-            placeholders = ",".join(["%s"] * len(take_ids))
-            cur.execute(f"""
-                SELECT
-                    ts.take_id,
-                    ts.frame,
-                    ts.{column}
-                FROM time_series_data ts
-                JOIN categories c ON ts.category_id = c.category_id
-                JOIN segments s ON ts.segment_id = s.segment_id
-                WHERE c.category_name = 'PROCESSED'
-                  AND s.segment_name = 'CenterOfMass_VELO'
-                  AND ts.take_id IN ({placeholders})
-                ORDER BY ts.take_id, ts.frame
-            """, tuple(take_ids))
-
-            data = {}
-            for take_id, frame, value in cur.fetchall():
-                data.setdefault(take_id, {"frame": [], "value": []})
-                data[take_id]["frame"].append(frame)
-                data[take_id]["value"].append(value)
-
-            return data
-    finally:
-        conn.close()
+    return load_time_series_component(take_ids, "PROCESSED", "CenterOfMass_VELO", component)
 
 
 st.title("Terra Sports Biomechanics Dashboard")
@@ -4548,6 +3724,12 @@ knee_peak_frames = shared_state["knee_peak_frames"]
 fp_event_frames = shared_state["fp_event_frames"]
 knee_event_frames = shared_state["knee_event_frames"]
 mer_event_frames = shared_state["mer_event_frames"]
+# Event medians are shared by every tab; compute them once per rerun
+fp_median_frame = int(np.median(fp_event_frames)) if fp_event_frames else None
+knee_median_frame = int(np.median(knee_event_frames)) if knee_event_frames else None
+mer_median_frame = int(np.median(mer_event_frames)) if mer_event_frames else None
+fp_median_ms = rel_frame_to_ms(fp_median_frame) if fp_median_frame is not None else None
+mer_median_ms = rel_frame_to_ms(mer_median_frame) if mer_median_frame is not None else None
 window_start = shared_state["window_start"]
 comparison_grouping_enabled = group_mode_enabled or bool(control_take_ids)
 
@@ -4644,28 +3826,37 @@ with tab_kinematic:
     if not take_ids:
         st.info("No takes found for this selection.")
     else:
-        def load_by_handedness(loader_fn):
-            merged = {}
-            for hand, ids in take_ids_by_handedness.items():
-                if ids:
-                    merged.update(loader_fn(ids, hand))
-            return merged
-
-        data = get_pelvis_angular_velocity(take_ids)
-        cg_data = load_by_handedness(get_hand_cg_velocity)
-        torso_data = get_torso_angular_velocity(take_ids)
-        elbow_data = load_by_handedness(get_elbow_angular_velocity)
-        shoulder_ir_data = load_by_handedness(get_shoulder_ir_velocity)
+        data = {}
+        cg_data = {}
+        torso_data = {}
+        elbow_data = {}
+        shoulder_ir_data = {}
         pre_fp_frames = ms_to_rel_frame(100)
         post_br_frames = ms_to_rel_frame(150)
         kinematic_window_start = (
-            int(np.median(fp_event_frames)) - pre_fp_frames
+            fp_median_frame - pre_fp_frames
             if fp_event_frames else -pre_fp_frames
         )
         kinematic_window_end = post_br_frames
         window_start_ms = rel_frame_to_ms(kinematic_window_start)
         window_end_ms = rel_frame_to_ms(kinematic_window_end)
 
+        # Only read the plotted window around each take's ball release
+        kinematic_frame_windows = {
+            take_id: (br_frame + kinematic_window_start, br_frame + kinematic_window_end)
+            for take_id, br_frame in br_frames.items()
+        }
+        for hand, ids in take_ids_by_handedness.items():
+            if not ids:
+                continue
+            ks_series = get_kinematic_sequence_series(ids, hand, kinematic_frame_windows)
+            data.update(ks_series["pelvis"])
+            cg_data.update(ks_series["cg"])
+            torso_data.update(ks_series["torso"])
+            elbow_data.update(ks_series["elbow"])
+            shoulder_ir_data.update(ks_series["shoulder_ir"])
+        data = {take_id: data[take_id] for take_id in sorted(data)}
+
         fig = go.Figure()
         grouped_pelvis = {}
         grouped_torso = {}
@@ -4682,67 +3873,48 @@ with tab_kinematic:
 
         # Track legend entries to avoid duplicates (for condensed legend)
         legend_keys_added = set()
+        # Traces are collected as plain trace dicts and handed to Plotly in one
+        # add_traces call, so each trace is validated once, on insertion,
+        # rather than as a go.Scatter and again by a per-trace add_trace.
+        ks_traces = []
+        # Individual Throws curves keyed by (legendgroup, color, dash)
+        individual_polylines = {}
 
         for take_id, d in data.items():
+            take_date = take_date_map[take_id]
+            take_dash = date_dash_map[take_date]
             frames = d["frame"]
             values = d["z"]
             take_hand = take_handedness.get(take_id)
             take_group_label = take_group_map.get(take_id, "")
             control_group_take = is_control_group_label(take_group_label)
-            hover_pitcher_name = "" if control_group_take else take_pitcher_map.get(take_id, "")
-
-            # -----------------------------
-            # Ball Release Detection (CGVel)
-            # -----------------------------
-            if take_id not in cg_data:
-                continue
-
-            cg_frames = cg_data[take_id]["frame"]
-            cg_values = cg_data[take_id]["x"]
-
-            valid_cg = [(i, v) for i, v in enumerate(cg_values) if v is not None]
-            if not valid_cg:
-                continue
-
-            br_idx, _ = max(valid_cg, key=lambda x: x[1])
-            br_frame = cg_frames[br_idx]
+            pitcher_name = take_pitcher_map.get(take_id, "")
+            hover_pitcher_name = "" if control_group_take else pitcher_name
 
             # -----------------------------
-            # Peak Glove-Side Knee Height
+            # Ball Release Detection (CGVel)
             # -----------------------------
-            knee_rel_frame = None
-            if take_id in knee_peak_frames:
-                knee_rel_frame = knee_peak_frames[take_id] - br_frame
+            if take_id not in cg_data:
+                continue
 
-            # MER defined as max shoulder external rotation prior to ball release
-            # -----------------------------
-            mer_rel_frame = None
-            if take_id in shoulder_er_max_frames:
-                mer_rel_frame = shoulder_er_max_frames[take_id] - br_frame
+            br_frame = extreme_frame(cg_data[take_id]["frame"], cg_data[take_id]["x"])
+            if br_frame is None:
+                continue
 
             # -----------------------------
             # Normalize time to Ball Release
             # -----------------------------
-            norm_frames = []
-            norm_values = []
-
-            for f, v in zip(frames, values):
-                if v is None:
-                    continue
-
-                rel_frame = f - br_frame
-
-                # Keep frames from 150 before median FP through +150 after BR
-                if (
-                    rel_frame >= kinematic_window_start
-                    and rel_frame <= kinematic_window_end
-                ):
-                    norm_frames.append(rel_frame_to_ms(rel_frame))
-                    # Handedness normalization for Pelvis AV (Kinematic Sequence only)
-                    if take_hand == "L":
-                        norm_values.append(-v)
-                    else:
-                        norm_values.append(v)
+            # Keep frames from 150 before median FP through +150 after BR
+            # Handedness normalization for Pelvis AV (Kinematic Sequence only)
+            # The four angular series share one frame axis per take, so the
+            # release-relative times and window mask are computed once here.
+            ks_window = release_window(frames, br_frame, kinematic_window_start, kinematic_window_end)
+            norm_frames, norm_values = normalize_to_release(
+                frames, values, br_frame,
+                sign=-1.0 if take_hand == "L" else 1.0,
+                as_arrays=True,
+                window=ks_window,
+            )
 
             grouped_pelvis[take_id] = {
                 "frame": norm_frames,
@@ -4756,87 +3928,53 @@ with tab_kinematic:
                 torso_frames = torso_data[take_id]["frame"]
                 torso_values = torso_data[take_id]["z"]
 
-                norm_torso_frames = []
-                norm_torso_values = []
-
-                for f, v in zip(torso_frames, torso_values):
-                    if v is None:
-                        continue
-
-                    rel_frame = f - br_frame
-                    if (
-                        rel_frame >= kinematic_window_start
-                        and rel_frame <= kinematic_window_end
-                    ):
-                        norm_torso_frames.append(rel_frame_to_ms(rel_frame))
-                        # Handedness normalization for Torso AV (Kinematic Sequence only)
-                        if take_hand == "L":
-                            norm_torso_values.append(-v)
-                        else:
-                            norm_torso_values.append(v)
+                # Handedness normalization for Torso AV (Kinematic Sequence only)
+                norm_torso_frames, norm_torso_values = normalize_to_release(
+                    torso_frames, torso_values, br_frame, kinematic_window_start, kinematic_window_end,
+                    sign=-1.0 if take_hand == "L" else 1.0,
+                    as_arrays=True,
+                    window=ks_window if same_frame_axis(frames, torso_frames) else None,
+                )
 
                 grouped_torso[take_id] = {
                     "frame": norm_torso_frames,
                     "value": norm_torso_values
                 }
 
-                if norm_torso_frames and display_mode == "Individual Throws":
-                    legendgroup = "Control_Group_Torso" if control_group_take else f"Torso_{take_date_map[take_id]}"
-                    pitcher_name = take_pitcher_map.get(take_id, "")
-                    trace_name = (
-                        f"Control Group | Torso – Pitch {take_order[take_id]} ({take_velocity[take_id]:.1f} MPH)"
-                    ) if control_group_take else (
-                        f"{take_group_label} | Torso – {take_date_map[take_id]} | "
-                        f"Pitch {take_order[take_id]} ({take_velocity[take_id]:.1f} MPH)"
-                    ) if comparison_grouping_enabled else None
-                    # Actual data trace (no legend)
-                    fig.add_trace(
-                        go.Scatter(
-                            x=norm_torso_frames,
-                            y=norm_torso_values,
-                            mode="lines",
-                            line=dict(
-                                color="orange",
-                                dash=date_dash_map[take_date_map[take_id]]
-                            ),
-                            customdata=[[ "Torso", take_date_map[take_id], take_order[take_id], take_velocity[take_id], hover_pitcher_name ]] * len(norm_torso_frames),
-                            hovertemplate=(
-                                "%{customdata[0]} – %{customdata[1]} | "
-                                "Pitch %{customdata[2]} (%{customdata[3]:.1f} MPH)"
-                                + (" | %{customdata[4]}" if multi_pitcher_mode else "")
-                                + "<br>Angular Velocity: %{y:.1f}°/s"
-                                + "<br>Time: %{x:.0f} ms rel BR"
-                                + "<extra></extra>"
-                            ),
-                            name=trace_name,
-                            showlegend=False,
-                            legendgroup=legendgroup,
-                            legendgrouptitle_text=None
-                        )
+                if len(norm_torso_frames) and display_mode == "Individual Throws":
+                    legendgroup = "Control_Group_Torso" if control_group_take else f"Torso_{take_date}"
+                    # Data curve, merged with same-styled takes (no legend)
+                    append_polyline(
+                        individual_polylines,
+                        (legendgroup, "orange", take_dash),
+                        norm_torso_frames,
+                        norm_torso_values,
+                        [ "Torso", take_date, take_order[take_id], take_velocity[take_id], hover_pitcher_name ],
                     )
                     # Legend-only trace (once per Torso + Date)
                     legend_key = ("Control Group", "Torso") if control_group_take else None
                     if control_group_take and legend_key not in legend_keys_added:
-                        fig.add_trace(
-                            go.Scatter(
+                        ks_traces.append(
+                            dict(
+                                type="scatter",
                                 x=[None],
                                 y=[None],
                                 mode="lines",
                                 line=dict(
                                     color="orange",
-                                    dash=date_dash_map[take_date_map[take_id]],
+                                    dash=take_dash,
                                     width=4
                                 ),
                                 name=(
                                     f"Control Group | Torso AV"
                                     if (comparison_grouping_enabled and control_group_take) else
-                                    f"{take_group_label} | Torso AV | {take_date_map[take_id]} | {pitcher_name}"
+                                    f"{take_group_label} | Torso AV | {take_date} | {pitcher_name}"
                                     if (comparison_grouping_enabled and multi_pitcher_mode) else
-                                    f"{take_group_label} | Torso AV | {take_date_map[take_id]}"
+                                    f"{take_group_label} | Torso AV | {take_date}"
                                     if comparison_grouping_enabled else
-                                    f"Torso AV | {take_date_map[take_id]} | {pitcher_name}"
+                                    f"Torso AV | {take_date} | {pitcher_name}"
                                     if multi_pitcher_mode else
-                                    f"Torso AV | {take_date_map[take_id]}"
+                                    f"Torso AV | {take_date}"
                                 ),
                                 showlegend=True,
                                 legendgroup=legendgroup,
@@ -4852,83 +3990,53 @@ with tab_kinematic:
                 elbow_frames = elbow_data[take_id]["frame"]
                 elbow_values = elbow_data[take_id]["x"]
 
-                norm_elbow_frames = []
-                norm_elbow_values = []
-
-                for f, v in zip(elbow_frames, elbow_values):
-                    if v is None:
-                        continue
-
-                    rel_frame = f - br_frame
-                    if (
-                        rel_frame >= kinematic_window_start
-                        and rel_frame <= kinematic_window_end
-                    ):
-                        norm_elbow_frames.append(rel_frame_to_ms(rel_frame))
-                        # Flip sign so elbow extension is positive on the plot
-                        norm_elbow_values.append(-v)
+                # Flip sign so elbow extension is positive on the plot
+                norm_elbow_frames, norm_elbow_values = normalize_to_release(
+                    elbow_frames, elbow_values, br_frame, kinematic_window_start, kinematic_window_end,
+                    sign=-1.0,
+                    as_arrays=True,
+                    window=ks_window if same_frame_axis(frames, elbow_frames) else None,
+                )
 
                 grouped_elbow[take_id] = {
                     "frame": norm_elbow_frames,
                     "value": norm_elbow_values
                 }
 
-                if norm_elbow_frames and display_mode == "Individual Throws":
-                    legendgroup = "Control_Group_Elbow" if control_group_take else f"Elbow_{take_date_map[take_id]}"
-                    pitcher_name = take_pitcher_map.get(take_id, "")
-                    # Actual data trace (no legend)
-                    fig.add_trace(
-                        go.Scatter(
-                            x=norm_elbow_frames,
-                            y=norm_elbow_values,
-                            mode="lines",
-                            line=dict(
-                                color="green",
-                                dash=date_dash_map[take_date_map[take_id]]
-                            ),
-                            customdata=[[ "Elbow", take_date_map[take_id], take_order[take_id], take_velocity[take_id], hover_pitcher_name ]] * len(norm_elbow_frames),
-                            hovertemplate=(
-                                "%{customdata[0]} – %{customdata[1]} | "
-                                "Pitch %{customdata[2]} (%{customdata[3]:.1f} MPH)"
-                                + (" | %{customdata[4]}" if multi_pitcher_mode else "")
-                                + "<br>Angular Velocity: %{y:.1f}°/s"
-                                + "<br>Time: %{x:.0f} ms rel BR"
-                                + "<extra></extra>"
-                            ),
-                            name=(
-                                f"Control Group | Elbow – Pitch {take_order[take_id]} ({take_velocity[take_id]:.1f} MPH)"
-                            ) if control_group_take else (
-                                f"{take_group_label} | Elbow – {take_date_map[take_id]} | "
-                                f"Pitch {take_order[take_id]} ({take_velocity[take_id]:.1f} MPH)"
-                            ) if comparison_grouping_enabled else None,
-                            showlegend=False,
-                            legendgroup=legendgroup,
-                            legendgrouptitle_text=None
-                        )
+                if len(norm_elbow_frames) and display_mode == "Individual Throws":
+                    legendgroup = "Control_Group_Elbow" if control_group_take else f"Elbow_{take_date}"
+                    # Data curve, merged with same-styled takes (no legend)
+                    append_polyline(
+                        individual_polylines,
+                        (legendgroup, "green", take_dash),
+                        norm_elbow_frames,
+                        norm_elbow_values,
+                        [ "Elbow", take_date, take_order[take_id], take_velocity[take_id], hover_pitcher_name ],
                     )
                     # Legend-only trace (once per Elbow + Date)
                     legend_key = ("Control Group", "Elbow") if control_group_take else None
                     if control_group_take and legend_key not in legend_keys_added:
-                        fig.add_trace(
-                            go.Scatter(
+                        ks_traces.append(
+                            dict(
+                                type="scatter",
                                 x=[None],
                                 y=[None],
                                 mode="lines",
                                 line=dict(
                                     color="green",
-                                    dash=date_dash_map[take_date_map[take_id]],
+                                    dash=take_dash,
                                     width=4
                                 ),
                                 name=(
                                     f"Control Group | Elbow AV"
                                     if (comparison_grouping_enabled and control_group_take) else
-                                    f"{take_group_label} | Elbow AV | {take_date_map[take_id]} | {pitcher_name}"
+                                    f"{take_group_label} | Elbow AV | {take_date} | {pitcher_name}"
                                     if (comparison_grouping_enabled and multi_pitcher_mode) else
-                                    f"{take_group_label} | Elbow AV | {take_date_map[take_id]}"
+                                    f"{take_group_label} | Elbow AV | {take_date}"
                                     if comparison_grouping_enabled else
-                                    f"Elbow AV | {take_date_map[take_id]} | {pitcher_name}"
+                                    f"Elbow AV | {take_date} | {pitcher_name}"
                                     if multi_pitcher_mode else
-                                    f"Elbow AV | {take_date_map[take_id]}"
+                                    f"Elbow AV | {take_date}"
                                 ),
                                 showlegend=True,
                                 legendgroup=legendgroup,
@@ -4944,86 +4052,53 @@ with tab_kinematic:
                 sh_frames = shoulder_ir_data[take_id]["frame"]
                 sh_values = shoulder_ir_data[take_id]["x"]
 
-                norm_sh_frames = []
-                norm_sh_values = []
-
-                for f, v in zip(sh_frames, sh_values):
-                    if v is None:
-                        continue
-
-                    rel_frame = f - br_frame
-                    if (
-                        rel_frame >= kinematic_window_start
-                        and rel_frame <= kinematic_window_end
-                    ):
-                        norm_sh_frames.append(rel_frame_to_ms(rel_frame))
-                        # Normalize so IR velocity is positive for both handedness
-                        if take_hand == "L":
-                            norm_sh_values.append(-v)
-                        else:
-                            norm_sh_values.append(v)
+                # Normalize so IR velocity is positive for both handedness
+                norm_sh_frames, norm_sh_values = normalize_to_release(
+                    sh_frames, sh_values, br_frame, kinematic_window_start, kinematic_window_end,
+                    sign=-1.0 if take_hand == "L" else 1.0,
+                    as_arrays=True,
+                    window=ks_window if same_frame_axis(frames, sh_frames) else None,
+                )
 
                 grouped_shoulder_ir[take_id] = {
                     "frame": norm_sh_frames,
                     "value": norm_sh_values
                 }
 
-                if norm_sh_frames and display_mode == "Individual Throws":
-                    legendgroup = "Control_Group_Shoulder_IR" if control_group_take else f"Shoulder IR_{take_date_map[take_id]}"
-                    pitcher_name = take_pitcher_map.get(take_id, "")
-                    # Actual data trace (no legend)
-                    fig.add_trace(
-                        go.Scatter(
-                            x=norm_sh_frames,
-                            y=norm_sh_values,
-                            mode="lines",
-                            line=dict(
-                                color="red",
-                                dash=date_dash_map[take_date_map[take_id]]
-                            ),
-                            customdata=[[ "Shoulder", take_date_map[take_id], take_order[take_id], take_velocity[take_id], hover_pitcher_name ]] * len(norm_sh_frames),
-                            hovertemplate=(
-                                "%{customdata[0]} – %{customdata[1]} | "
-                                "Pitch %{customdata[2]} (%{customdata[3]:.1f} MPH)"
-                                + (" | %{customdata[4]}" if multi_pitcher_mode else "")
-                                + "<br>Angular Velocity: %{y:.1f}°/s"
-                                + "<br>Time: %{x:.0f} ms rel BR"
-                                + "<extra></extra>"
-                            ),
-                            name=(
-                                f"Control Group | Shoulder – Pitch {take_order[take_id]} ({take_velocity[take_id]:.1f} MPH)"
-                            ) if control_group_take else (
-                                f"{take_group_label} | Shoulder – {take_date_map[take_id]} | "
-                                f"Pitch {take_order[take_id]} ({take_velocity[take_id]:.1f} MPH)"
-                            ) if comparison_grouping_enabled else None,
-                            showlegend=False,
-                            legendgroup=legendgroup,
-                            legendgrouptitle_text=None
-                        )
+                if len(norm_sh_frames) and display_mode == "Individual Throws":
+                    legendgroup = "Control_Group_Shoulder_IR" if control_group_take else f"Shoulder IR_{take_date}"
+                    # Data curve, merged with same-styled takes (no legend)
+                    append_polyline(
+                        individual_polylines,
+                        (legendgroup, "red", take_dash),
+                        norm_sh_frames,
+                        norm_sh_values,
+                        [ "Shoulder", take_date, take_order[take_id], take_velocity[take_id], hover_pitcher_name ],
                     )
                     # Legend-only trace (once per Shoulder IR + Date)
                     legend_key = ("Control Group", "Shoulder IR") if control_group_take else None
                     if control_group_take and legend_key not in legend_keys_added:
-                        fig.add_trace(
-                            go.Scatter(
+                        ks_traces.append(
+                            dict(
+                                type="scatter",
                                 x=[None],
                                 y=[None],
                                 mode="lines",
                                 line=dict(
                                     color="red",
-                                    dash=date_dash_map[take_date_map[take_id]],
+                                    dash=take_dash,
                                     width=4
                                 ),
                                 name=(
                                     f"Control Group | Shoulder IR AV"
                                     if (comparison_grouping_enabled and control_group_take) else
-                                    f"{take_group_label} | Shoulder IR AV | {take_date_map[take_id]} | {pitcher_name}"
+                                    f"{take_group_label} | Shoulder IR AV | {take_date} | {pitcher_name}"
                                     if (comparison_grouping_enabled and multi_pitcher_mode) else
-                                    f"{take_group_label} | Shoulder IR AV | {take_date_map[take_id]}"
+                                    f"{take_group_label} | Shoulder IR AV | {take_date}"
                                     if comparison_grouping_enabled else
-                                    f"Shoulder IR AV | {take_date_map[take_id]} | {pitcher_name}"
+                                    f"Shoulder IR AV | {take_date} | {pitcher_name}"
                                     if multi_pitcher_mode else
-                                    f"Shoulder IR AV | {take_date_map[take_id]}"
+                                    f"Shoulder IR AV | {take_date}"
                                 ),
                                 showlegend=True,
                                 legendgroup=legendgroup,
@@ -5031,65 +4106,43 @@ with tab_kinematic:
                             )
                         )
                         legend_keys_added.add(legend_key)
-            if not norm_frames:
+            if not len(norm_frames):
                 continue
 
             if display_mode == "Individual Throws":
-                legendgroup = "Control_Group_Pelvis" if control_group_take else f"Pelvis_{take_date_map[take_id]}"
-                pitcher_name = take_pitcher_map.get(take_id, "")
-                # Actual data trace (no legend)
-                fig.add_trace(
-                    go.Scatter(
-                        x=norm_frames,
-                        y=norm_values,
-                        mode="lines",
-                        line=dict(
-                            color="blue",
-                            dash=date_dash_map[take_date_map[take_id]]
-                        ),
-                        customdata=[[ "Pelvis", take_date_map[take_id], take_order[take_id], take_velocity[take_id], hover_pitcher_name ]] * len(norm_frames),
-                        hovertemplate=(
-                            "%{customdata[0]} – %{customdata[1]} | "
-                            "Pitch %{customdata[2]} (%{customdata[3]:.1f} MPH)"
-                            + (" | %{customdata[4]}" if multi_pitcher_mode else "")
-                            + "<br>Angular Velocity: %{y:.1f}°/s"
-                            + "<br>Time: %{x:.0f} ms rel BR"
-                            + "<extra></extra>"
-                        ),
-                        name=(
-                            f"Control Group | Pelvis – Pitch {take_order[take_id]} ({take_velocity[take_id]:.1f} MPH)"
-                        ) if control_group_take else (
-                            f"{take_group_label} | Pelvis – {take_date_map[take_id]} | "
-                            f"Pitch {take_order[take_id]} ({take_velocity[take_id]:.1f} MPH)"
-                        ) if comparison_grouping_enabled else None,
-                        showlegend=False,
-                        legendgroup=legendgroup,
-                        legendgrouptitle_text=None
-                    )
+                legendgroup = "Control_Group_Pelvis" if control_group_take else f"Pelvis_{take_date}"
+                # Data curve, merged with same-styled takes (no legend)
+                append_polyline(
+                    individual_polylines,
+                    (legendgroup, "blue", take_dash),
+                    norm_frames,
+                    norm_values,
+                    [ "Pelvis", take_date, take_order[take_id], take_velocity[take_id], hover_pitcher_name ],
                 )
                 # Legend-only trace (once per Pelvis + Date)
                 legend_key = ("Control Group", "Pelvis") if control_group_take else None
                 if control_group_take and legend_key not in legend_keys_added:
-                    fig.add_trace(
-                        go.Scatter(
+                    ks_traces.append(
+                        dict(
+                            type="scatter",
                             x=[None],
                             y=[None],
                             mode="lines",
                             line=dict(
                                 color="blue",
-                                dash=date_dash_map[take_date_map[take_id]],
+                                dash=take_dash,
                                 width=4
                             ),
                         name=(
                             f"Control Group | Pelvis AV"
                             if (comparison_grouping_enabled and control_group_take) else
-                            f"{take_group_label} | Pelvis AV | {take_date_map[take_id]} | {pitcher_name}"
+                            f"{take_group_label} | Pelvis AV | {take_date} | {pitcher_name}"
                             if (comparison_grouping_enabled and multi_pitcher_mode) else
-                            f"{take_group_label} | Pelvis AV | {take_date_map[take_id]}"
+                            f"{take_group_label} | Pelvis AV | {take_date}"
                             if comparison_grouping_enabled else
-                            f"Pelvis AV | {take_date_map[take_id]} | {pitcher_name}"
+                            f"Pelvis AV | {take_date} | {pitcher_name}"
                             if multi_pitcher_mode else
-                            f"Pelvis AV | {take_date_map[take_id]}"
+                            f"Pelvis AV | {take_date}"
                         ),
                             showlegend=True,
                             legendgroup=legendgroup,
@@ -5098,6 +4151,30 @@ with tab_kinematic:
                     )
                     legend_keys_added.add(legend_key)
 
+        # One trace per segment + date style instead of one per take
+        for (legendgroup, color, dash), polyline in individual_polylines.items():
+            ks_traces.append(
+                dict(
+                    type="scatter",
+                    x=np.concatenate(polyline["x"]),
+                    y=np.concatenate(polyline["y"]),
+                    mode="lines",
+                    line=dict(color=color, dash=dash),
+                    customdata=polyline["customdata"],
+                    hovertemplate=(
+                        "%{customdata[0]} – %{customdata[1]} | "
+                        "Pitch %{customdata[2]} (%{customdata[3]:.1f} MPH)"
+                        + (" | %{customdata[4]}" if multi_pitcher_mode else "")
+                        + "<br>Angular Velocity: %{y:.1f}°/s"
+                        + "<br>Time: %{x:.0f} ms rel BR"
+                        + "<extra></extra>"
+                    ),
+                    showlegend=False,
+                    legendgroup=legendgroup,
+                    legendgrouptitle_text=None
+                )
+            )
+
         # --- Store peak summary for table ---
         kinematic_peak_rows = []
 
@@ -5115,6 +4192,21 @@ with tab_kinematic:
             peak_marker_traces = []
             peak_marker_annotations = []
 
+            # Group takes by date once; every segment reuses the grouping
+            from collections import defaultdict
+            take_ids_by_date_key = defaultdict(list)
+            for take_id in data:
+                date = take_date_map[take_id]
+                pitcher_name = take_pitcher_map.get(take_id, "")
+                group_label = take_group_map.get(take_id, "")
+                if comparison_grouping_enabled and is_control_group_label(group_label):
+                    date_key = group_label
+                elif comparison_grouping_enabled:
+                    date_key = group_label if group_mode_aggregate_across_pitchers else ((group_label, pitcher_name, date) if multi_pitcher_mode else (group_label, date))
+                else:
+                    date_key = (pitcher_name, date) if multi_pitcher_mode else date
+                take_ids_by_date_key[date_key].append(take_id)
+
             for label, curves in [
                 ("Pelvis", grouped_pelvis),
                 ("Torso", grouped_torso),
@@ -5124,20 +4216,11 @@ with tab_kinematic:
                 if not curves:
                     continue
 
-                # Group curves by date
-                from collections import defaultdict
-                curves_by_date = defaultdict(dict)
-                for take_id, d in curves.items():
-                    date = take_date_map[take_id]
-                    pitcher_name = take_pitcher_map.get(take_id, "")
-                    group_label = take_group_map.get(take_id, "")
-                    if comparison_grouping_enabled and is_control_group_label(group_label):
-                        date_key = group_label
-                    elif comparison_grouping_enabled:
-                        date_key = group_label if group_mode_aggregate_across_pitchers else ((group_label, pitcher_name, date) if multi_pitcher_mode else (group_label, date))
-                    else:
-                        date_key = (pitcher_name, date) if multi_pitcher_mode else date
-                    curves_by_date[date_key][take_id] = d
+                curves_by_date = {}
+                for date_key, date_take_ids in take_ids_by_date_key.items():
+                    curves_date = {take_id: curves[take_id] for take_id in date_take_ids if take_id in curves}
+                    if curves_date:
+                        curves_by_date[date_key] = curves_date
                 for date_key, curves_date in curves_by_date.items():
                     if comparison_grouping_enabled and date_key == "Control Group":
                         group_label = "Control Group"
@@ -5156,7 +4239,7 @@ with tab_kinematic:
                         date = date_key
                         pitcher_name = ""
                         group_label = ""
-                    x_date, y_date, q1_date, q3_date = aggregate_curves(curves_date, "Mean")
+                    x_date, y_date, q1_date, q3_date = aggregate_curves(curves_date, "Mean", as_arrays=True)
                     avg_velocity = (
                         float(np.mean([
                             take_velocity[tid]
@@ -5171,15 +4254,16 @@ with tab_kinematic:
                     color = color_map[label]
                     # Smoothing
                     if len(y_date) >= 11:
-                        y_date = savgol_filter(y_date, window_length=7, polyorder=3)
+                        y_date = savgol_smooth(y_date, window_length=7, polyorder=3)
                     dash = date_dash_map.get(date, "solid")
                     legendgroup = f"{label}_{date}_{pitcher_name}" if show_group_pitcher_breakout else f"{label}_{date}"
                     # --- IQR band (draw first so the line color stays visually true on top) ---
                     if show_ks_signal_iqr_band:
-                        fig.add_trace(
-                            go.Scatter(
-                                x=x_date + x_date[::-1],
-                                y=q3_date + q1_date[::-1],
+                        ks_traces.append(
+                            dict(
+                                type="scatter",
+                                x=np.concatenate([x_date, x_date[::-1]]),
+                                y=np.concatenate([q3_date, q1_date[::-1]]),
                                 fill="toself",
                                 fillcolor=to_rgba(color, alpha=0.30),
                                 line=dict(width=0),
@@ -5189,8 +4273,9 @@ with tab_kinematic:
                             )
                         )
                     # --- Grouped curve (no legend, but legendgroup set) ---
-                    fig.add_trace(
-                        go.Scatter(
+                    ks_traces.append(
+                        dict(
+                            type="scatter",
                             x=x_date,
                             y=y_date,
                             mode="lines",
@@ -5216,8 +4301,9 @@ with tab_kinematic:
                     # --- Legend-only trace (once per Segment + Date, legendgroup set) ---
                     legend_key = (label, date, pitcher_name) if show_group_pitcher_breakout else (label, date)
                     if legend_key not in legend_keys_added:
-                        fig.add_trace(
-                            go.Scatter(
+                        ks_traces.append(
+                            dict(
+                                type="scatter",
                                 x=[None],
                                 y=[None],
                                 mode="lines",
@@ -5244,22 +4330,19 @@ with tab_kinematic:
                     if len(y_date) > 0:
                         # Restrict pelvis & torso peak search to FP → BR
                         if label in ["Pelvis", "Torso"] and fp_event_frames:
-                            fp_rel = rel_frame_to_ms(int(np.median(fp_event_frames)))
-                            valid_idxs = [
-                                i for i, xf in enumerate(x_date)
-                                if fp_rel <= xf <= 0
-                            ]
-                            if not valid_idxs:
+                            fp_rel = fp_median_ms
+                            valid_idxs = np.flatnonzero((x_date >= fp_rel) & (x_date <= 0))
+                            if not valid_idxs.size:
                                 continue
-                            max_idx = max(valid_idxs, key=lambda i: y_date[i])
+                            max_idx = int(valid_idxs[np.argmax(y_date[valid_idxs])])
                         else:
                             # Elbow / Shoulder IR use full window
                             max_idx = int(np.argmax(y_date))
-                        max_x = x_date[max_idx]
-                        max_y = y_date[max_idx]
+                        max_x = int(x_date[max_idx])
+                        max_y = float(y_date[max_idx])
                         reference_time_ms_grouped = None
                         if label == "Pelvis" and fp_event_frames:
-                            fp_rel = rel_frame_to_ms(int(np.median(fp_event_frames)))
+                            fp_rel = fp_median_ms
                             reference_time_ms_grouped = max_x - fp_rel
                         elif label == "Torso":
                             pelvis_peak_time = grouped_peak_time_reference.get((date_key, "Pelvis"))
@@ -5276,8 +4359,8 @@ with tab_kinematic:
 
                         grouped_peak_time_reference[(date_key, label)] = max_x
 
-                        local_y_min = min(y_date) if len(y_date) > 0 else max_y
-                        local_y_max = max(y_date) if len(y_date) > 0 else max_y
+                        local_y_min = float(y_date.min())
+                        local_y_max = float(y_date.max())
                         local_y_span = max(local_y_max - local_y_min, 1)
                         peak_marker_y = max_y + max(0.07 * local_y_span, 55)
 
@@ -5301,7 +4384,8 @@ with tab_kinematic:
                             "Peak Time from Reference (ms)": reference_time_ms_grouped
                         })
                         peak_marker_traces.append(
-                            go.Scatter(
+                            dict(
+                                type="scatter",
                                 x=[max_x],
                                 y=[max_y],
                                 mode="markers",
@@ -5348,76 +4432,26 @@ with tab_kinematic:
                                 ay=-40,
                             )
                         )
-            for peak_marker_trace in peak_marker_traces:
-                fig.add_trace(peak_marker_trace)
-            for peak_marker_annotation in peak_marker_annotations:
-                fig.add_annotation(**peak_marker_annotation)
+            ks_traces.extend(peak_marker_traces)
+            fig.update_layout(annotations=[*fig.layout.annotations, *peak_marker_annotations])
 
+        fig.add_traces(ks_traces)
+
+        event_markers = []
         # Median Refined Foot Plant (zero-cross) event
         if fp_event_frames:
             add_event_iqr_band(fig, fp_event_frames, "green", show_ks_fp_iqr_band)
-            median_fp_frame = rel_frame_to_ms(int(np.median(fp_event_frames)))
-
-            fig.add_vline(
-                x=median_fp_frame,
-                line_width=3,
-                line_dash="dash",
-                line_color="green",
-                opacity=0.9
-            )
-            fig.add_annotation(
-                x=median_fp_frame,
-                y=1.055,
-                xref="x",
-                yref="paper",
-                text="FP",
-                showarrow=False,
-                font=dict(color="green", size=14),
-                align="center"
-            )
+            event_markers.append((fp_median_ms, "green", "FP"))
 
         # Median Max Shoulder ER event
         if mer_event_frames:
             add_event_iqr_band(fig, mer_event_frames, "red", show_ks_fp_iqr_band)
-            median_mer_frame = rel_frame_to_ms(int(np.median(mer_event_frames)))
-
-            fig.add_vline(
-                x=median_mer_frame,
-                line_width=3,
-                line_dash="dash",
-                line_color="red",
-                opacity=0.9
-            )
-            fig.add_annotation(
-                x=median_mer_frame,
-                y=1.055,
-                xref="x",
-                yref="paper",
-                text="MER",
-                showarrow=False,
-                font=dict(color="red", size=14),
-                align="center"
-            )
+            event_markers.append((mer_median_ms, "red", "MER"))
 
         # Normalized Ball Release reference line
         add_event_iqr_band(fig, [0] * max(len(take_ids), 1), "blue", show_ks_fp_iqr_band)
-        fig.add_vline(
-            x=0,
-            line_width=3,
-            line_dash="dash",
-            line_color="blue",
-            opacity=0.9
-        )
-        fig.add_annotation(
-            x=0,
-            y=1.055,
-            xref="x",
-            yref="paper",
-            text="BR",
-            showarrow=False,
-            font=dict(color="blue", size=14),
-            align="center"
-        )
+        event_markers.append((0, "blue", "BR"))
+        add_event_markers(fig, event_markers, label_y=1.055, font_size=14, line_opacity=0.9)
 
         grouped_visible_y_vals = []
         yaxis_range = None
@@ -5434,14 +4468,15 @@ with tab_kinematic:
                 if trace_y is None:
                     continue
 
-                grouped_visible_y_vals.extend(
-                    v for v in trace_y
-                    if v is not None and np.isfinite(v)
-                )
+                grouped_visible_y_vals.append(np.asarray(trace_y, dtype=np.float64))
 
             if grouped_visible_y_vals:
-                y_min = min(grouped_visible_y_vals)
-                y_max = max(grouped_visible_y_vals)
+                grouped_visible_y_vals = np.concatenate(grouped_visible_y_vals)
+                grouped_visible_y_vals = grouped_visible_y_vals[np.isfinite(grouped_visible_y_vals)]
+
+            if len(grouped_visible_y_vals):
+                y_min = float(grouped_visible_y_vals.min())
+                y_max = float(grouped_visible_y_vals.max())
                 y_span = max(y_max - y_min, 1)
                 yaxis_range = [y_min - (0.10 * y_span), y_max + (0.22 * y_span)]
 
@@ -5482,7 +4517,22 @@ with tab_kinematic:
         # --- Kinematic Sequence Peak Summary Table (Individual Throws) ---
         if display_mode == "Individual Throws":
 
-            individual_rows = []
+            # Column-oriented so pandas builds each column in one pass
+            individual_columns = {
+                **({"Group": []} if comparison_grouping_enabled else {}),
+                **({"Pitcher": []} if multi_pitcher_mode else {}),
+                "Session Date": [],
+                "Pitch": [],
+                "Velocity (mph)": [],
+                "Pelvis Rotation Peak (°/s)": [],
+                "Pelvis Rotation Time from FP (ms)": [],
+                "Torso Rotation Peak (°/s)": [],
+                "Torso Rotation Time from Peak Pelvis (ms)": [],
+                "Elbow Extension Peak (°/s)": [],
+                "Elbow Extension Time from Peak Torso (ms)": [],
+                "Shoulder Internal Rotation Peak (°/s)": [],
+                "Shoulder Internal Rotation Time from Peak Elbow (ms)": [],
+            }
 
             for take_id in take_ids:
                 if take_id not in br_frames:
@@ -5497,15 +4547,12 @@ with tab_kinematic:
 
                     vals = curves[take_id]["value"]
                     frames = curves[take_id]["frame"]
-                    if not vals:
+                    if not len(vals):
                         return None, None
 
-                    if invert:
-                        idx = int(np.argmax(vals))
-                    else:
-                        idx = int(np.argmax(vals))
+                    idx = int(np.argmax(vals))
 
-                    return vals[idx], frames[idx]
+                    return float(vals[idx]), int(frames[idx])
 
                 pelvis_peak, pelvis_frame = peak_and_frame(grouped_pelvis)
                 # Pelvis peak timing from Foot Plant (zero-cross), in ms (250 Hz)
@@ -5532,28 +4579,30 @@ with tab_kinematic:
                     if shoulder_frame is not None and elbow_frame is not None else None
                 )
 
-                individual_rows.append({
-                    **({"Group": take_group_map.get(take_id, "")} if comparison_grouping_enabled else {}),
-                    **({"Pitcher": take_pitcher_map.get(take_id)} if multi_pitcher_mode else {}),
-                    "Session Date": take_date_map[take_id],
-                    "Pitch": take_order[take_id],
-                    "Velocity (mph)": take_velocity[take_id],
-                    "Pelvis Rotation Peak (°/s)": pelvis_peak,
-                    "Pelvis Rotation Time from FP (ms)": pelvis_time_ms,
-                    "Torso Rotation Peak (°/s)": torso_peak,
-                    "Torso Rotation Time from Peak Pelvis (ms)": torso_time_from_pelvis_ms,
-                    "Elbow Extension Peak (°/s)": elbow_peak,
-                    "Elbow Extension Time from Peak Torso (ms)": elbow_time_from_torso_ms,
-                    "Shoulder Internal Rotation Peak (°/s)": shoulder_peak,
-                    "Shoulder Internal Rotation Time from Peak Elbow (ms)": shoulder_time_from_elbow_ms
-                })
-
-            if individual_rows:
+                if comparison_grouping_enabled:
+                    individual_columns["Group"].append(take_group_map.get(take_id, ""))
+                if multi_pitcher_mode:
+                    individual_columns["Pitcher"].append(take_pitcher_map.get(take_id))
+                individual_columns["Session Date"].append(take_date_map[take_id])
+                individual_columns["Pitch"].append(take_order[take_id])
+                individual_columns["Velocity (mph)"].append(take_velocity[take_id])
+                individual_columns["Pelvis Rotation Peak (°/s)"].append(pelvis_peak)
+                individual_columns["Pelvis Rotation Time from FP (ms)"].append(pelvis_time_ms)
+                individual_columns["Torso Rotation Peak (°/s)"].append(torso_peak)
+                individual_columns["Torso Rotation Time from Peak Pelvis (ms)"].append(torso_time_from_pelvis_ms)
+                individual_columns["Elbow Extension Peak (°/s)"].append(elbow_peak)
+                individual_columns["Elbow Extension Time from Peak Torso (ms)"].append(elbow_time_from_torso_ms)
+                individual_columns["Shoulder Internal Rotation Peak (°/s)"].append(shoulder_peak)
+                individual_columns["Shoulder Internal Rotation Time from Peak Elbow (ms)"].append(
+                    shoulder_time_from_elbow_ms
+                )
+
+            if individual_columns["Session Date"]:
                 import pandas as pd
 
                 st.markdown("### Kinematic Sequence - Individual Throws")
 
-                df_individual = pd.DataFrame(individual_rows)
+                df_individual = pd.DataFrame(individual_columns)
 
                 # Sort logically: date → pitch order
                 sort_cols = ["Session Date", "Pitch"]
@@ -5625,15 +4674,10 @@ with tab_kinematic:
                         for header in headers
                     ]
 
-                def fmt(val, decimals=2):
-                    if val is None or (isinstance(val, float) and np.isnan(val)):
-                        return ""
-                    return f"{val:.{decimals}f}"
-
                 styled_individual = (
                     df_individual_display
                     .style
-                    .format(lambda x: fmt(x, 1) if isinstance(x, (int, float, np.floating)) else x)
+                    .format("{:.1f}", na_rep="")
                     .apply_index(style_segment_headers, axis="columns", level=0)
                     .set_table_styles([
                         {"selector": "th", "props": [("text-align", "center")]},
@@ -5753,10 +4797,12 @@ with tab_kinematic:
                     formatted_index.append(tuple(idx_list) if isinstance(idx, tuple) else idx_list[0])
                 df_display.index = pd.MultiIndex.from_tuples(formatted_index, names=df_display.index.names)
             for col in df_display.columns:
-                if col[1] == "Peak (°/s)":
-                    df_display[col] = df_display[col].map(lambda x: "" if x is None or pd.isna(x) else f"{x:.0f}")
-                elif "Time" in col[1]:
-                    df_display[col] = df_display[col].map(lambda x: "" if x is None or pd.isna(x) else f"{x:.0f}")
+                if col[1] == "Peak (°/s)" or "Time" in col[1]:
+                    df_display[col] = (
+                        pd.to_numeric(df_display[col], errors="coerce")
+                        .map("{:.0f}".format, na_action="ignore")
+                        .fillna("")
+                    )
 
             styled = (
                 df_display
@@ -6232,11 +5278,7 @@ with tab_joint:
     joint_data = {}
 
     def load_joint_by_handedness(loader_fn):
-        merged = {}
-        for hand, ids in take_ids_by_handedness.items():
-            if ids:
-                merged.update(loader_fn(ids, hand))
-        return merged
+        return load_merged_by_handedness(loader_fn, take_ids_by_handedness)
 
     # --- Pelvis / Trunk rotational velocity (z_data) ---
     if "Pelvis Rotational Velocity" in selected_kinematics:
@@ -6323,13 +5365,33 @@ with tab_joint:
 
     # --- Helper for extracting value at a specific time (ms) ---
     def value_at_time_ms(times_ms, values, target_time_ms):
-        if target_time_ms in times_ms:
-            return values[times_ms.index(target_time_ms)]
-        return None
+        return values_at_times(times_ms, values, [target_time_ms])[0]
 
     import pandas as pd
-    summary_rows = []
-    compare_energy_summary_rows = []
+    summary_columns = {
+        **({"Group": []} if comparison_grouping_enabled else {}),
+        **({"Pitcher": []} if show_group_pitcher_breakout else {}),
+        "Kinematic": [],
+        "Session Date": [],
+        "Average Velocity": [],
+        "Max": [],
+        "Peak Knee Height": [],
+        "Foot Plant": [],
+        "Ball Release": [],
+        "Max External Rotation": [],
+        **({"Standard Deviation": []} if display_mode == "Grouped" else {}),
+    }
+    compare_energy_summary_columns = {
+        **({"Pitcher": []} if multi_pitcher_mode else {}),
+        "Metric": [],
+        "Session Date": [],
+        "Average Velocity": [],
+        "Peak": [],
+        "Foot Plant": [],
+        "Ball Release": [],
+        "Max External Rotation": [],
+        **({"Standard Deviation": []} if compare_energy_display_mode == "Grouped" else {}),
+    }
 
     fig = go.Figure()
 
@@ -6362,10 +5424,10 @@ with tab_joint:
     mound_only_selected = mound_only_sidebar
     median_pkh_frame = None
     if mound_only_selected and knee_event_frames:
-        median_pkh_frame = int(np.median(knee_event_frames))
+        median_pkh_frame = knee_median_frame
 
     if joint_window_mode == "Foot Plant to Ball Release View":
-        median_fp_frame = int(np.median(fp_event_frames)) if fp_event_frames else None
+        median_fp_frame = fp_median_frame
         joint_window_start = (median_fp_frame - 25) if median_fp_frame is not None else window_start
         joint_window_end = 25
     else:
@@ -6384,7 +5446,7 @@ with tab_joint:
     if median_pkh_frame is not None:
         summary_knee_frame = median_pkh_frame
     elif knee_event_frames:
-        summary_knee_frame = int(np.median(knee_event_frames))
+        summary_knee_frame = knee_median_frame
 
     # Reuse take_order and take_velocity from Kinematic Sequence section if available
     peak_positive_kinematics = {
@@ -6407,12 +5469,44 @@ with tab_joint:
         "Pelvis Rotation",
         "Hip-Shoulder Separation",
     }
+    # Per-take lookups are the same for every kinematic; resolve them once
+    joint_take_context = {}
+    for take_id in take_ids:
+        if take_id not in br_frames:
+            continue
+        date = take_date_map[take_id]
+        group_label = take_group_map.get(take_id, "Ungrouped")
+        pitcher_name = take_pitcher_map.get(take_id, "")
+        control_group_take = is_control_group_label(group_label)
+        if comparison_grouping_enabled and control_group_take:
+            date_key = group_label
+        elif comparison_grouping_enabled:
+            date_key = group_label if group_mode_aggregate_across_pitchers else ((group_label, pitcher_name, date) if multi_pitcher_mode else (group_label, date))
+        else:
+            date_key = (pitcher_name, date) if multi_pitcher_mode else date
+        joint_take_context[take_id] = (
+            br_frames[take_id],
+            take_handedness.get(take_id),
+            date,
+            date_key,
+            group_label,
+            pitcher_name,
+            control_group_take,
+        )
+
     for kinematic, data_dict in joint_data.items():
         grouped[kinematic] = {}
-
-        for take_id in take_ids:
-            if take_id not in data_dict or take_id not in br_frames:
+        # Individual Throws curves keyed by (color, dash)
+        individual_polylines = {}
+        # Orientation rules depend only on the kinematic and the take's hand
+        peak_positive = kinematic in peak_positive_kinematics
+        mirror_right_hand = "Velocity" not in kinematic and kinematic in right_hand_mirror_kinematics
+        mirror_left_hand = kinematic in left_hand_mirror_kinematics
+
+        for take_id, take_context in joint_take_context.items():
+            if take_id not in data_dict:
                 continue
+            br, take_hand, date, date_key, group_label, pitcher_name, control_group_take = take_context
 
             # --- Support both "value" (angles) and "z" (rotational velocities) dicts ---
             if "value" in data_dict[take_id]:
@@ -6426,52 +5520,34 @@ with tab_joint:
                 frames = data_dict[take_id]["frame"]
             else:
                 continue
-            br = br_frames[take_id]
             sign_flip = 1.0
-            if kinematic in peak_positive_kinematics:
-                valid_vals = [v for v in values if v is not None]
-                if valid_vals:
-                    dominant_peak = max(valid_vals, key=lambda x: abs(x))
+            if peak_positive:
+                peak_values = np.asarray(values, dtype=np.float64)
+                if peak_values.size and not np.isnan(peak_values).all():
+                    dominant_peak = peak_values[np.nanargmax(np.abs(peak_values))]
                     if dominant_peak < 0:
                         sign_flip = -1.0
 
-            norm_f, norm_v = [], []
-            for f, v in zip(frames, values):
-                if v is None:
-                    continue
-
-                rel = f - br
-                if joint_window_start <= rel <= joint_window_end:
-                    norm_f.append(rel_frame_to_ms(rel))
+            # --- Handedness normalization ---
+            handedness_factor = 1.0
 
-                    # --- Handedness normalization ---
-                    take_hand = take_handedness.get(take_id)
-                    handedness_factor = 1.0
+            # Keep selected angle directions aligned to a shared orientation.
+            if mirror_right_hand and take_hand == "R":
+                handedness_factor = -1.0
 
-                    # Keep selected angle directions aligned to a shared orientation.
-                    if "Velocity" not in kinematic and take_hand == "R" and kinematic in right_hand_mirror_kinematics:
-                        handedness_factor = -1.0
+            # Mirror left-handed trunk tilt curves to right-handed orientation.
+            if mirror_left_hand and take_hand == "L":
+                handedness_factor = -1.0
 
-                    # Mirror left-handed trunk tilt curves to right-handed orientation.
-                    if take_hand == "L" and kinematic in left_hand_mirror_kinematics:
-                        handedness_factor = -1.0
-
-                    norm_v.append(sign_flip * handedness_factor * v)
+            norm_f, norm_v = normalize_to_release(
+                frames, values, br, joint_window_start, joint_window_end,
+                sign=sign_flip * handedness_factor,
+            )
 
             grouped[kinematic][take_id] = {"frame": norm_f, "value": norm_v}
 
             # --- Store by date for grouped plotting ---
-            date = take_date_map[take_id]
-            group_label = take_group_map.get(take_id, "Ungrouped")
-            pitcher_name = take_pitcher_map.get(take_id, "")
-            control_group_take = is_control_group_label(group_label)
             hover_pitcher_name = "" if control_group_take else pitcher_name
-            if comparison_grouping_enabled and control_group_take:
-                date_key = group_label
-            elif comparison_grouping_enabled:
-                date_key = group_label if group_mode_aggregate_across_pitchers else ((group_label, pitcher_name, date) if multi_pitcher_mode else (group_label, date))
-            else:
-                date_key = (pitcher_name, date) if multi_pitcher_mode else date
             grouped_by_date.setdefault(date_key, {}).setdefault(kinematic, {})[take_id] = {
                 "frame": norm_f,
                 "value": norm_v
@@ -6485,45 +5561,33 @@ with tab_joint:
             if display_mode == "Individual Throws":
                 if collapse_control_group_in_comparison and control_group_take:
                     continue
-                # Use kinematic color and date-based dash for individual throws
-                fig.add_trace(
-                    go.Scatter(
-                        x=norm_f,
-                        y=norm_v,
-                        mode="lines",
-                        customdata=[[hover_pitcher_name]] * len(norm_f),
-                        hovertemplate=(
-                            "<b>%{fullData.name}</b><br>"
-                            f"{kinematic}: %{{y:.1f}}{get_kinematic_unit(kinematic)}<br>"
-                            "Time: %{x:.1f} ms"
-                            + ("<br>Pitcher: %{customdata[0]}" if show_group_pitcher_breakout else "")
-                            + "<extra></extra>"
-                        ),
-                        line=dict(
-                            color=trace_color,
-                            dash=date_dash_map[take_date_map[take_id]]
-                        ),
-                        name=(
-                            f"Control Group | {kinematic} – Pitch {take_order[take_id]} ({take_velocity[take_id]:.1f} mph)"
-                            if (comparison_grouping_enabled and control_group_take) else
-                            (
-                                f"{group_label} | {kinematic} – {take_date_map[take_id]} | "
-                                f"Pitch {take_order[take_id]} ({take_velocity[take_id]:.1f} mph) | {pitcher_name}"
-                            ) if (show_group_pitcher_breakout and comparison_grouping_enabled) else
-                            (
-                                f"{group_label} | {kinematic} – {take_date_map[take_id]} | "
-                                f"Pitch {take_order[take_id]} ({take_velocity[take_id]:.1f} mph)"
-                            ) if comparison_grouping_enabled else
-                            (
-                            f"{kinematic} – {take_date_map[take_id]} | Pitch {take_order[take_id]} "
-                            f"({take_velocity[take_id]:.1f} mph) | {pitcher_name}"
-                            if show_group_pitcher_breakout else
-                            f"{kinematic} – {take_date_map[take_id]} | Pitch {take_order[take_id]} ({take_velocity[take_id]:.1f} mph)"
-                            )
-                        ),
-                        showlegend=False
+                # Use kinematic color and date-based dash for individual throws;
+                # same-styled takes share one trace, hover names come from customdata
+                take_trace_name = (
+                    f"Control Group | {kinematic} – Pitch {take_order[take_id]} ({take_velocity[take_id]:.1f} mph)"
+                    if (comparison_grouping_enabled and control_group_take) else
+                    (
+                        f"{group_label} | {kinematic} – {date} | "
+                        f"Pitch {take_order[take_id]} ({take_velocity[take_id]:.1f} mph) | {pitcher_name}"
+                    ) if (show_group_pitcher_breakout and comparison_grouping_enabled) else
+                    (
+                        f"{group_label} | {kinematic} – {date} | "
+                        f"Pitch {take_order[take_id]} ({take_velocity[take_id]:.1f} mph)"
+                    ) if comparison_grouping_enabled else
+                    (
+                    f"{kinematic} – {date} | Pitch {take_order[take_id]} "
+                    f"({take_velocity[take_id]:.1f} mph) | {pitcher_name}"
+                    if show_group_pitcher_breakout else
+                    f"{kinematic} – {date} | Pitch {take_order[take_id]} ({take_velocity[take_id]:.1f} mph)"
                     )
                 )
+                append_polyline(
+                    individual_polylines,
+                    (trace_color, date_dash_map[date]),
+                    norm_f,
+                    norm_v,
+                    [hover_pitcher_name, take_trace_name],
+                )
                 # Add one legend-only trace per (kinematic, date) (shows color + dash)
                 legend_key = (kinematic, date_key)
                 if control_group_take and legend_key not in legend_keys_added:
@@ -6553,15 +5617,35 @@ with tab_joint:
                     )
                     legend_keys_added.add(legend_key)
 
+        # One trace per color + dash style instead of one per take
+        for (color, dash), polyline in individual_polylines.items():
+            fig.add_trace(
+                go.Scattergl(
+                    x=np.concatenate(polyline["x"]),
+                    y=np.concatenate(polyline["y"]),
+                    mode="lines",
+                    customdata=polyline["customdata"],
+                    hovertemplate=(
+                        "<b>%{customdata[1]}</b><br>"
+                        f"{kinematic}: %{{y:.1f}}{get_kinematic_unit(kinematic)}<br>"
+                        "Time: %{x:.1f} ms"
+                        + ("<br>Pitcher: %{customdata[0]}" if show_group_pitcher_breakout else "")
+                        + "<extra></extra>"
+                    ),
+                    line=dict(color=color, dash=dash),
+                    showlegend=False
+                )
+            )
+
     if display_mode == "Individual Throws" and collapse_control_group_in_comparison:
         control_group_curves = grouped_by_date.get("Control Group", {})
         for kinematic, curves in control_group_curves.items():
             if not curves:
                 continue
 
-            x, y, q1, q3 = aggregate_curves(curves, "Mean")
+            x, y, q1, q3 = aggregate_curves(curves, "Mean", as_arrays=True)
             if len(y) >= 11:
-                y = savgol_filter(y, window_length=11, polyorder=3)
+                y = savgol_smooth(y, window_length=11, polyorder=3)
 
             color = (
                 group_color_map.get("Control Group", joint_color_map.get(kinematic, "#444"))
@@ -6572,9 +5656,9 @@ with tab_joint:
 
             if show_joint_signal_iqr_band:
                 fig.add_trace(
-                    go.Scatter(
-                        x=x + x[::-1],
-                        y=q3 + q1[::-1],
+                    go.Scattergl(
+                        x=np.concatenate([x, x[::-1]]),
+                        y=np.concatenate([q3, q1[::-1]]),
                         fill="toself",
                         fillcolor=to_rgba(color, 0.35),
                         line=dict(width=0),
@@ -6585,7 +5669,7 @@ with tab_joint:
                 )
 
             fig.add_trace(
-                go.Scatter(
+                go.Scattergl(
                     x=x,
                     y=y,
                     mode="lines",
@@ -6613,39 +5697,38 @@ with tab_joint:
                 max_val = np.max(values)
                 # sd_val = np.std(values)  # removed as not used below
 
-                br_val = value_at_time_ms(frames, values, 0)
-
-                fp_val = None
-                if fp_event_frames:
-                    median_fp = rel_frame_to_ms(int(np.median(fp_event_frames)))
-                    fp_val = value_at_time_ms(frames, values, median_fp)
+                median_fp = fp_median_ms
 
                 # value at MER (same frame used in plot)
-                mer_val = None
+                mer_time_ms = None
                 if take_id in shoulder_er_max_frames:
                     mer_frame_rel = shoulder_er_max_frames[take_id] - br_frames[take_id]
-                    mer_val = value_at_time_ms(frames, values, rel_frame_to_ms(mer_frame_rel))
+                    mer_time_ms = rel_frame_to_ms(mer_frame_rel)
 
                 # value at per-take PKH frame (fallback to summary knee frame)
-                pkh_val = None
+                pkh_time_ms = None
                 if take_id in knee_peak_frames:
                     pkh_frame_rel = knee_peak_frames[take_id] - br_frames[take_id]
-                    pkh_val = value_at_time_ms(frames, values, rel_frame_to_ms(pkh_frame_rel))
+                    pkh_time_ms = rel_frame_to_ms(pkh_frame_rel)
                 elif summary_knee_frame is not None:
-                    pkh_val = value_at_time_ms(frames, values, rel_frame_to_ms(summary_knee_frame))
-
-                summary_rows.append({
-                    **({"Group": take_group_map.get(take_id, "")} if comparison_grouping_enabled else {}),
-                    **({"Pitcher": take_pitcher_map.get(take_id)} if show_group_pitcher_breakout else {}),
-                    "Kinematic": kinematic + (" (°/s)" if "Velocity" in kinematic else ""),
-                    "Session Date": take_date_map[take_id],
-                    "Average Velocity": take_velocity[take_id],
-                    "Max": max_val,
-                    "Peak Knee Height": pkh_val,
-                    "Foot Plant": fp_val,
-                    "Ball Release": br_val,
-                    "Max External Rotation": mer_val
-                })
+                    pkh_time_ms = rel_frame_to_ms(summary_knee_frame)
+
+                br_val, fp_val, mer_val, pkh_val = values_at_times(
+                    frames, values, [0, median_fp, mer_time_ms, pkh_time_ms]
+                )
+
+                if comparison_grouping_enabled:
+                    summary_columns["Group"].append(take_group_map.get(take_id, ""))
+                if show_group_pitcher_breakout:
+                    summary_columns["Pitcher"].append(take_pitcher_map.get(take_id))
+                summary_columns["Kinematic"].append(kinematic + (" (°/s)" if "Velocity" in kinematic else ""))
+                summary_columns["Session Date"].append(take_date_map[take_id])
+                summary_columns["Average Velocity"].append(take_velocity[take_id])
+                summary_columns["Max"].append(max_val)
+                summary_columns["Peak Knee Height"].append(pkh_val)
+                summary_columns["Foot Plant"].append(fp_val)
+                summary_columns["Ball Release"].append(br_val)
+                summary_columns["Max External Rotation"].append(mer_val)
 
     # --- Grouped plot (mean + IQR per date) ---
     if display_mode == "Grouped":
@@ -6671,12 +5754,12 @@ with tab_joint:
                 if not curves:
                     continue
 
-                x, y, q1, q3 = aggregate_curves(curves, "Mean")
+                x, y, q1, q3 = aggregate_curves(curves, "Mean", as_arrays=True)
                 avg_velocity = np.mean([take_velocity[tid] for tid in curves.keys()])
 
                 # Smooth grouped curve ONLY
                 if len(y) >= 11:
-                    y = savgol_filter(y, window_length=11, polyorder=3)
+                    y = savgol_smooth(y, window_length=11, polyorder=3)
 
                 color = (
                     group_color_map.get(group_label, joint_color_map.get(kinematic, "#444"))
@@ -6688,9 +5771,9 @@ with tab_joint:
                 # IQR band (draw first so the line color stays visually true on top)
                 if show_joint_signal_iqr_band:
                     fig.add_trace(
-                        go.Scatter(
-                            x=x + x[::-1],
-                            y=q3 + q1[::-1],
+                        go.Scattergl(
+                            x=np.concatenate([x, x[::-1]]),
+                            y=np.concatenate([q3, q1[::-1]]),
                             fill="toself",
                             fillcolor=to_rgba(color, 0.35),
                             line=dict(width=0),
@@ -6700,7 +5783,7 @@ with tab_joint:
                     )
 
                 fig.add_trace(
-                    go.Scatter(
+                    go.Scattergl(
                         x=x,
                         y=y,
                         mode="lines",
@@ -6725,145 +5808,59 @@ with tab_joint:
                 )
 
                 max_val = np.max(y)
-                br_val = value_at_time_ms(x, y, 0)
-
-                fp_val = None
-                if fp_event_frames:
-                    median_fp = rel_frame_to_ms(int(np.median(fp_event_frames)))
-                    fp_val = value_at_time_ms(x, y, median_fp)
+                median_fp = fp_median_ms
 
                 max_vals = [np.max(d["value"]) for d in curves.values() if d["value"]]
                 sd_val = np.std(max_vals)
 
                 # value at MER from grouped mean curve
-                mer_val = None
-                if mer_event_frames:
-                    median_mer = rel_frame_to_ms(int(np.median(mer_event_frames)))
-                    mer_val = value_at_time_ms(x, y, median_mer)
+                median_mer = mer_median_ms
 
                 # value at summary PKH frame from grouped mean curve
-                pkh_val = None
+                pkh_time_ms = None
                 if summary_knee_frame is not None:
-                    pkh_val = value_at_time_ms(x, y, rel_frame_to_ms(summary_knee_frame))
-
-                summary_rows.append({
-                    **({"Group": group_label} if comparison_grouping_enabled else {}),
-                    **({"Pitcher": pitcher_name} if show_group_pitcher_breakout else {}),
-                    "Kinematic": kinematic + (" (°/s)" if "Velocity" in kinematic else ""),
-                    "Session Date": date,
-                    "Average Velocity": np.mean([take_velocity[tid] for tid in curves.keys()]),
-                    "Max": max_val,
-                    "Peak Knee Height": pkh_val,
-                    "Foot Plant": fp_val,
-                    "Ball Release": br_val,
-                    "Max External Rotation": mer_val,
-                    "Standard Deviation": sd_val
-                })
+                    pkh_time_ms = rel_frame_to_ms(summary_knee_frame)
+
+                br_val, fp_val, mer_val, pkh_val = values_at_times(
+                    x, y, [0, median_fp, median_mer, pkh_time_ms]
+                )
+
+                if comparison_grouping_enabled:
+                    summary_columns["Group"].append(group_label)
+                if show_group_pitcher_breakout:
+                    summary_columns["Pitcher"].append(pitcher_name)
+                summary_columns["Kinematic"].append(kinematic + (" (°/s)" if "Velocity" in kinematic else ""))
+                summary_columns["Session Date"].append(date)
+                summary_columns["Average Velocity"].append(np.mean([take_velocity[tid] for tid in curves.keys()]))
+                summary_columns["Max"].append(max_val)
+                summary_columns["Peak Knee Height"].append(pkh_val)
+                summary_columns["Foot Plant"].append(fp_val)
+                summary_columns["Ball Release"].append(br_val)
+                summary_columns["Max External Rotation"].append(mer_val)
+                summary_columns["Standard Deviation"].append(sd_val)
 
     # --- Event lines and annotations (match Kinematic Sequence styling) ---
+    event_markers = []
     if median_pkh_frame is not None:
         add_event_iqr_band(fig, knee_event_frames, "gold", show_joint_fp_iqr_band)
-        median_pkh_time_ms = rel_frame_to_ms(median_pkh_frame)
-        fig.add_vline(
-            x=median_pkh_time_ms,
-            line_width=3,
-            line_dash="dash",
-            line_color="gold",
-            opacity=0.9
-        )
-        fig.add_annotation(
-            x=median_pkh_time_ms,
-            y=1.055,
-            xref="x",
-            yref="paper",
-            text="PKH",
-            showarrow=False,
-            font=dict(color="gold", size=14),
-            align="center"
-        )
+        event_markers.append((rel_frame_to_ms(median_pkh_frame), "gold", "PKH"))
     elif knee_event_frames:
         # Non-mound fallback: keep a single knee marker when PKH is not enabled.
         add_event_iqr_band(fig, knee_event_frames, "gold", show_joint_fp_iqr_band)
-        median_knee_frame = rel_frame_to_ms(int(np.median(knee_event_frames)))
-        fig.add_vline(
-            x=median_knee_frame,
-            line_width=3,
-            line_dash="dash",
-            line_color="gold",
-            opacity=0.9
-        )
-        fig.add_annotation(
-            x=median_knee_frame,
-            y=1.055,
-            xref="x",
-            yref="paper",
-            text="Knee",
-            showarrow=False,
-            font=dict(color="gold", size=14),
-            align="center"
-        )
+        event_markers.append((rel_frame_to_ms(knee_median_frame), "gold", "Knee"))
 
     if fp_event_frames:
         add_event_iqr_band(fig, fp_event_frames, "green", show_joint_fp_iqr_band)
-        median_fp_frame = rel_frame_to_ms(int(np.median(fp_event_frames)))
-        fig.add_vline(
-            x=median_fp_frame,
-            line_width=3,
-            line_dash="dash",
-            line_color="green",
-            opacity=0.9
-        )
-        fig.add_annotation(
-            x=median_fp_frame,
-            y=1.055,
-            xref="x",
-            yref="paper",
-            text="FP",
-            showarrow=False,
-            font=dict(color="green", size=14),
-            align="center"
-        )
+        event_markers.append((fp_median_ms, "green", "FP"))
 
     if mer_event_frames:
         add_event_iqr_band(fig, mer_event_frames, "red", show_joint_fp_iqr_band)
-        median_mer_frame = rel_frame_to_ms(int(np.median(mer_event_frames)))
-        fig.add_vline(
-            x=median_mer_frame,
-            line_width=3,
-            line_dash="dash",
-            line_color="red",
-            opacity=0.9
-        )
-        fig.add_annotation(
-            x=median_mer_frame,
-            y=1.055,
-            xref="x",
-            yref="paper",
-            text="MER",
-            showarrow=False,
-            font=dict(color="red", size=14),
-            align="center"
-        )
+        event_markers.append((mer_median_ms, "red", "MER"))
 
     # Ball Release reference
     add_event_iqr_band(fig, [0] * max(len(take_ids), 1), "blue", show_joint_fp_iqr_band)
-    fig.add_vline(
-        x=0,
-        line_width=3,
-        line_dash="dash",
-        line_color="blue",
-        opacity=0.9
-    )
-    fig.add_annotation(
-        x=0,
-        y=1.055,
-        xref="x",
-        yref="paper",
-        text="BR",
-        showarrow=False,
-        font=dict(color="blue", size=14),
-        align="center"
-    )
+    event_markers.append((0, "blue", "BR"))
+    add_event_markers(fig, event_markers, label_y=1.055, font_size=14, line_opacity=0.9)
 
     fig.update_layout(
         xaxis_title="Time Relative to Ball Release (ms)",
@@ -6919,11 +5916,7 @@ with tab_joint:
                 compare_energy_data_by_metric = {}
 
                 def load_compare_energy_by_handedness(loader_fn):
-                    merged = {}
-                    for hand, ids in take_ids_by_handedness.items():
-                        if ids:
-                            merged.update(loader_fn(ids, hand))
-                    return merged
+                    return load_merged_by_handedness(loader_fn, take_ids_by_handedness)
 
                 for metric in compare_energy_metrics:
                     if metric == "Trunk-Shoulder Energy Flow (RTA_DIST_L | RTA_DIST_R)":
@@ -6993,10 +5986,10 @@ with tab_joint:
                     energy_legend_keys = set()
                     compare_energy_median_pkh_frame = None
                     if mound_only_sidebar and knee_event_frames:
-                        compare_energy_median_pkh_frame = int(np.median(knee_event_frames))
+                        compare_energy_median_pkh_frame = knee_median_frame
 
                     if compare_energy_window_mode == "Foot Plant to Ball Release View":
-                        compare_energy_median_fp_frame = int(np.median(fp_event_frames)) if fp_event_frames else None
+                        compare_energy_median_fp_frame = fp_median_frame
                         energy_window_start = (
                             compare_energy_median_fp_frame - 25
                             if compare_energy_median_fp_frame is not None else
@@ -7024,12 +6017,10 @@ with tab_joint:
                             values = d["value"]
                             br = br_frames[take_id]
 
-                            norm_f, norm_v = [], []
-                            for f, v in zip(frames, values):
-                                rel = f - br
-                                if energy_window_start <= rel <= energy_window_end:
-                                    norm_f.append(rel_frame_to_ms(rel))
-                                    norm_v.append(v)
+                            norm_f, norm_v = normalize_to_release(
+                                frames, values, br, energy_window_start, energy_window_end,
+                                as_arrays=True,
+                            )
 
                             date = take_date_map[take_id]
                             pitcher_name = take_pitcher_map.get(take_id, "")
@@ -7045,39 +6036,37 @@ with tab_joint:
                             }
 
                             peak_val = None
-                            if norm_v:
-                                peak_idx = int(np.argmax(np.abs(np.array(norm_v, dtype=float))))
-                                peak_val = norm_v[peak_idx]
+                            if len(norm_v):
+                                peak_val = float(norm_v[np.argmax(np.abs(norm_v))])
 
                             br_val = value_at_time_ms(norm_f, norm_v, 0)
                             fp_val = None
                             if fp_event_frames:
-                                median_fp = rel_frame_to_ms(int(np.median(fp_event_frames)))
+                                median_fp = fp_median_ms
                                 fp_val = value_at_time_ms(norm_f, norm_v, median_fp)
 
                             mer_val = None
                             if mer_event_frames:
-                                median_mer = rel_frame_to_ms(int(np.median(mer_event_frames)))
+                                median_mer = mer_median_ms
                                 mer_val = value_at_time_ms(norm_f, norm_v, median_mer)
 
                             if compare_energy_display_mode == "Individual Throws":
-                                compare_energy_summary_rows.append({
-                                    **({"Pitcher": pitcher_name} if multi_pitcher_mode else {}),
-                                    "Metric": metric,
-                                    "Session Date": date,
-                                    "Average Velocity": take_velocity[take_id],
-                                    "Peak": peak_val,
-                                    "Foot Plant": fp_val,
-                                    "Ball Release": br_val,
-                                    "Max External Rotation": mer_val,
-                                })
+                                if multi_pitcher_mode:
+                                    compare_energy_summary_columns["Pitcher"].append(pitcher_name)
+                                compare_energy_summary_columns["Metric"].append(metric)
+                                compare_energy_summary_columns["Session Date"].append(date)
+                                compare_energy_summary_columns["Average Velocity"].append(take_velocity[take_id])
+                                compare_energy_summary_columns["Peak"].append(peak_val)
+                                compare_energy_summary_columns["Foot Plant"].append(fp_val)
+                                compare_energy_summary_columns["Ball Release"].append(br_val)
+                                compare_energy_summary_columns["Max External Rotation"].append(mer_val)
 
                             if compare_energy_display_mode == "Individual Throws":
                                 if collapse_control_group_energy and control_group_take:
                                     continue
                                 legendgroup = f"{metric}_{pitcher_name}_{date}" if multi_pitcher_mode else f"{metric}_{date}"
                                 energy_fig.add_trace(
-                                    go.Scatter(
+                                    go.Scattergl(
                                         x=norm_f,
                                         y=norm_v,
                                         mode="lines",
@@ -7123,14 +6112,14 @@ with tab_joint:
                         if compare_energy_display_mode == "Individual Throws" and collapse_control_group_energy:
                             control_curves = grouped_by_date.get("Control Group", {})
                             if control_curves:
-                                x, y, q1, q3 = aggregate_curves(control_curves, "Mean")
+                                x, y, q1, q3 = aggregate_curves(control_curves, "Mean", as_arrays=True)
                                 legendgroup = f"{metric}_Control_Group"
 
                                 if show_compare_energy_signal_iqr_band:
                                     energy_fig.add_trace(
-                                        go.Scatter(
-                                            x=x + x[::-1],
-                                            y=q3 + q1[::-1],
+                                        go.Scattergl(
+                                            x=np.concatenate([x, x[::-1]]),
+                                            y=np.concatenate([q3, q1[::-1]]),
                                             fill="toself",
                                             fillcolor=to_rgba(metric_color, alpha=0.35),
                                             line=dict(width=0),
@@ -7141,7 +6130,7 @@ with tab_joint:
                                     )
 
                                 energy_fig.add_trace(
-                                    go.Scatter(
+                                    go.Scattergl(
                                         x=x,
                                         y=y,
                                         mode="lines",
@@ -7169,7 +6158,7 @@ with tab_joint:
                                 else:
                                     date = date_key
                                     pitcher_name = ""
-                                x, y, q1, q3 = aggregate_curves(curves, "Mean")
+                                x, y, q1, q3 = aggregate_curves(curves, "Mean", as_arrays=True)
                                 dash_style = date_dash_map.get(date, "solid")
                                 legendgroup = (
                                     f"{metric}_Control_Group"
@@ -7178,45 +6167,42 @@ with tab_joint:
                                 )
 
                                 peak_val = None
-                                if y:
-                                    peak_idx = int(np.argmax(np.abs(np.array(y, dtype=float))))
-                                    peak_val = y[peak_idx]
+                                if len(y):
+                                    peak_val = float(y[np.argmax(np.abs(y))])
 
                                 br_val = value_at_time_ms(x, y, 0)
                                 fp_val = None
                                 if fp_event_frames:
-                                    median_fp = rel_frame_to_ms(int(np.median(fp_event_frames)))
+                                    median_fp = fp_median_ms
                                     fp_val = value_at_time_ms(x, y, median_fp)
 
                                 mer_val = None
                                 if mer_event_frames:
-                                    median_mer = rel_frame_to_ms(int(np.median(mer_event_frames)))
+                                    median_mer = mer_median_ms
                                     mer_val = value_at_time_ms(x, y, median_mer)
 
                                 peak_vals = []
                                 for curve in curves.values():
-                                    if curve["value"]:
-                                        curve_arr = np.array(curve["value"], dtype=float)
-                                        peak_vals.append(float(curve_arr[np.argmax(np.abs(curve_arr))]))
-
-                                compare_energy_summary_rows.append({
-                                    **({"Pitcher": pitcher_name} if multi_pitcher_mode else {}),
-                                    "Metric": metric,
-                                    "Session Date": date,
-                                    "Average Velocity": np.mean([take_velocity[tid] for tid in curves.keys()]),
-                                    "Peak": peak_val,
-                                    "Foot Plant": fp_val,
-                                    "Ball Release": br_val,
-                                    "Max External Rotation": mer_val,
-                                    "Standard Deviation": (np.std(peak_vals) if peak_vals else None),
-                                })
+                                    if len(curve["value"]):
+                                        peak_vals.append(float(curve["value"][np.argmax(np.abs(curve["value"]))]))
+
+                                if multi_pitcher_mode:
+                                    compare_energy_summary_columns["Pitcher"].append(pitcher_name)
+                                compare_energy_summary_columns["Metric"].append(metric)
+                                compare_energy_summary_columns["Session Date"].append(date)
+                                compare_energy_summary_columns["Average Velocity"].append(np.mean([take_velocity[tid] for tid in curves.keys()]))
+                                compare_energy_summary_columns["Peak"].append(peak_val)
+                                compare_energy_summary_columns["Foot Plant"].append(fp_val)
+                                compare_energy_summary_columns["Ball Release"].append(br_val)
+                                compare_energy_summary_columns["Max External Rotation"].append(mer_val)
+                                compare_energy_summary_columns["Standard Deviation"].append(np.std(peak_vals) if peak_vals else None)
                                 avg_velocity = np.mean([take_velocity[tid] for tid in curves.keys()])
 
                                 if show_compare_energy_signal_iqr_band:
                                     energy_fig.add_trace(
-                                        go.Scatter(
-                                            x=x + x[::-1],
-                                            y=q3 + q1[::-1],
+                                        go.Scattergl(
+                                            x=np.concatenate([x, x[::-1]]),
+                                            y=np.concatenate([q3, q1[::-1]]),
                                             fill="toself",
                                             fillcolor=to_rgba(metric_color, alpha=0.35),
                                             line=dict(width=0),
@@ -7226,7 +6212,7 @@ with tab_joint:
                                         )
                                     )
                                 energy_fig.add_trace(
-                                    go.Scatter(
+                                    go.Scattergl(
                                         x=x,
                                         y=y,
                                         mode="lines",
@@ -7261,75 +6247,23 @@ with tab_joint:
                                     )
                     )
 
+                    event_markers = []
                     if compare_energy_median_pkh_frame is not None:
                         add_event_iqr_band(energy_fig, knee_event_frames, "gold", show_compare_energy_fp_iqr_band)
-                        median_pkh = rel_frame_to_ms(compare_energy_median_pkh_frame)
-                        energy_fig.add_vline(x=median_pkh, line_width=3, line_dash="dash", line_color="gold")
-                        energy_fig.add_annotation(
-                            x=median_pkh,
-                            y=1.06,
-                            xref="x",
-                            yref="paper",
-                            text="PKH",
-                            showarrow=False,
-                            font=dict(color="gold", size=13, family="Arial"),
-                            align="center"
-                        )
+                        event_markers.append((rel_frame_to_ms(compare_energy_median_pkh_frame), "gold", "PKH"))
                     elif knee_event_frames:
                         add_event_iqr_band(energy_fig, knee_event_frames, "gold", show_compare_energy_fp_iqr_band)
-                        median_knee = rel_frame_to_ms(int(np.median(knee_event_frames)))
-                        energy_fig.add_vline(x=median_knee, line_width=3, line_dash="dash", line_color="gold")
-                        energy_fig.add_annotation(
-                            x=median_knee,
-                            y=1.06,
-                            xref="x",
-                            yref="paper",
-                            text="Knee",
-                            showarrow=False,
-                            font=dict(color="gold", size=13, family="Arial"),
-                            align="center"
-                        )
+                        event_markers.append((rel_frame_to_ms(knee_median_frame), "gold", "Knee"))
 
                     if fp_event_frames:
                         add_event_iqr_band(energy_fig, fp_event_frames, "green", show_compare_energy_fp_iqr_band)
-                        median_fp = rel_frame_to_ms(int(np.median(fp_event_frames)))
-                        energy_fig.add_vline(x=median_fp, line_width=3, line_dash="dash", line_color="green")
-                        energy_fig.add_annotation(
-                            x=median_fp,
-                            y=1.06,
-                            xref="x",
-                            yref="paper",
-                            text="FP",
-                            showarrow=False,
-                            font=dict(color="green", size=13, family="Arial"),
-                            align="center"
-                        )
+                        event_markers.append((fp_median_ms, "green", "FP"))
                     if mer_event_frames:
                         add_event_iqr_band(energy_fig, mer_event_frames, "red", show_compare_energy_fp_iqr_band)
-                        median_mer = rel_frame_to_ms(int(np.median(mer_event_frames)))
-                        energy_fig.add_vline(x=median_mer, line_width=3, line_dash="dash", line_color="red")
-                        energy_fig.add_annotation(
-                            x=median_mer,
-                            y=1.06,
-                            xref="x",
-                            yref="paper",
-                            text="MER",
-                            showarrow=False,
-                            font=dict(color="red", size=13, family="Arial"),
-                            align="center"
-                        )
+                        event_markers.append((mer_median_ms, "red", "MER"))
                     add_event_iqr_band(energy_fig, [0] * max(len(take_ids), 1), "blue", show_compare_energy_fp_iqr_band)
-                    energy_fig.add_vline(x=0, line_width=3, line_dash="dash", line_color="blue")
-                    energy_fig.add_annotation(
-                        x=0,
-                        y=1.06,
-                        xref="x",
-                        yref="paper",
-                        text="BR",
-                        showarrow=False,
-                        font=dict(color="blue", size=13, family="Arial"),
-                        align="center"
-                    )
+                    event_markers.append((0, "blue", "BR"))
+                    add_event_markers(energy_fig, event_markers, label_y=1.06, font_size=13, font_family="Arial")
 
                     energy_fig.update_layout(
                         xaxis_title="Time Relative to Ball Release (ms)",
@@ -7360,18 +6294,18 @@ with tab_joint:
     has_compare_energy_summary = (
         joint_view_mode == "Comparison"
         and bool(compare_energy_metrics)
-        and bool(compare_energy_summary_rows)
+        and bool(compare_energy_summary_columns["Metric"])
     )
     combined_summary_mode = (
         not show_single_kinematics_empty_state
-        and bool(summary_rows)
+        and bool(summary_columns["Kinematic"])
         and has_compare_energy_summary
     )
     rendered_summary_heading = False
-    if not show_single_kinematics_empty_state and summary_rows:
+    if not show_single_kinematics_empty_state and summary_columns["Kinematic"]:
         st.markdown("### Summary" if combined_summary_mode else "### Kinematics Summary")
         rendered_summary_heading = True
-        df_summary = pd.DataFrame(summary_rows)
+        df_summary = pd.DataFrame(summary_columns)
         # Reorder columns explicitly
         base_columns = [
             "Kinematic",
@@ -7397,20 +6331,6 @@ with tab_joint:
 
         df_summary = df_summary[column_order]
 
-        import numpy as np
-        def fmt(val, decimals=2):
-            if val is None or (isinstance(val, float) and np.isnan(val)):
-                return ""
-            return f"{val:.{decimals}f}"
-
-        def normalize_kinematic_name(display_name):
-            return display_name.replace(" (°/s)", "")
-
-        def format_with_unit(val, unit, decimals=2, prefix=""):
-            if val is None or (isinstance(val, float) and np.isnan(val)):
-                return ""
-            return f"{prefix}{val:.{decimals}f} {unit}".strip()
-
         measurement_columns = [
             "Max",
             "Peak Knee Height",
@@ -7421,23 +6341,15 @@ with tab_joint:
         if joint_window_mode == "Foot Plant to Ball Release View":
             measurement_columns.remove("Peak Knee Height")
 
-        for idx, row in df_summary.iterrows():
-            kinematic_name = normalize_kinematic_name(row["Kinematic"])
-            kinematic_unit = get_kinematic_unit(kinematic_name)
-
-            if "Average Velocity" in df_summary.columns:
-                df_summary.at[idx, "Average Velocity"] = fmt(row["Average Velocity"], 1)
-
-            for col in measurement_columns:
-                if col in df_summary.columns:
-                    df_summary.at[idx, col] = format_with_unit(
-                        row[col], kinematic_unit, decimals=2
-                    )
-
-            if display_mode == "Grouped" and "Standard Deviation" in df_summary.columns:
-                df_summary.at[idx, "Standard Deviation"] = format_with_unit(
-                    row["Standard Deviation"], kinematic_unit, decimals=2, prefix="±"
-                )
+        # Units follow each row's kinematic, so format whole columns at once
+        kinematic_units = df_summary["Kinematic"].str.replace(" (°/s)", "", regex=False).map(get_kinematic_unit)
+        df_summary["Average Velocity"] = format_number_column(df_summary["Average Velocity"], 1)
+        for col in measurement_columns:
+            df_summary[col] = format_number_column(df_summary[col], 2, unit=kinematic_units)
+        if display_mode == "Grouped":
+            df_summary["Standard Deviation"] = format_number_column(
+                df_summary["Standard Deviation"], 2, unit=kinematic_units, prefix="±"
+            )
 
         styled_summary = (
             df_summary
@@ -7476,12 +6388,7 @@ with tab_joint:
         if not rendered_summary_heading:
             st.markdown("### Energy Flow Summary")
             rendered_summary_heading = True
-        df_energy_summary = pd.DataFrame(compare_energy_summary_rows)
-
-        def fmt_energy(val, decimals=2):
-            if val is None or (isinstance(val, float) and np.isnan(val)):
-                return ""
-            return f"{val:.{decimals}f}"
+        df_energy_summary = pd.DataFrame(compare_energy_summary_columns)
 
         energy_base_columns = [
             "Metric",
@@ -7501,16 +6408,12 @@ with tab_joint:
 
         df_energy_summary = df_energy_summary[energy_column_order]
 
-        for idx, row in df_energy_summary.iterrows():
-            if "Average Velocity" in df_energy_summary.columns:
-                df_energy_summary.at[idx, "Average Velocity"] = fmt_energy(row["Average Velocity"], 1)
-            for col in ["Peak", "Foot Plant", "Ball Release", "Max External Rotation"]:
-                if col in df_energy_summary.columns:
-                    df_energy_summary.at[idx, col] = fmt_energy(row[col], 1)
-            if compare_energy_display_mode == "Grouped" and "Standard Deviation" in df_energy_summary.columns:
-                df_energy_summary.at[idx, "Standard Deviation"] = (
-                    f"±{row['Standard Deviation']:.1f}" if row["Standard Deviation"] is not None and not (isinstance(row["Standard Deviation"], float) and np.isnan(row["Standard Deviation"])) else ""
-                )
+        for col in ["Average Velocity", "Peak", "Foot Plant", "Ball Release", "Max External Rotation"]:
+            df_energy_summary[col] = format_number_column(df_energy_summary[col], 1)
+        if "Standard Deviation" in df_energy_summary.columns:
+            df_energy_summary["Standard Deviation"] = format_number_column(
+                df_energy_summary["Standard Deviation"], 1, prefix="±"
+            )
 
         styled_energy_summary = (
             df_energy_summary
@@ -7603,114 +6506,107 @@ def compute_peak_segment_power(energy_data, br_frames, fp_event_frames):
             continue
 
         br = br_frames[take_id]
-        frames = np.array(d["frame"], dtype=int)
-        values = np.array(d["value"], dtype=float)
+        frames = np.asarray(d["frame"], dtype=np.int64)
+        values = np.asarray(d["value"], dtype=np.float64)
 
-        rel = frames - br
+        # STRICT biomechanical window: Foot Plant → Ball Release.
+        # Frames are sorted, so the window is a contiguous slice (a view).
+        start = np.searchsorted(frames, br + median_fp_rel, side="left")
+        stop = np.searchsorted(frames, br, side="right")
 
-        # STRICT biomechanical window: Foot Plant → Ball Release
-        mask = (rel >= median_fp_rel) & (rel <= 0)
-
-        if not np.any(mask):
+        if start >= stop:
             continue
 
-        peak_map[take_id] = float(np.nanmin(values[mask]))
+        peak_map[take_id] = float(np.nanmin(values[start:stop]))
 
     return peak_map
 
 
 # --------------------------------------------------
 # Report Tab
-# --------------------------------------------------
-
-
-def get_report_take_rows(athlete_name, session_dates, throw_types=None, velocity_range=None, excluded_take_ids=None):
-    throw_types = throw_types or ["Mound"]
-    excluded_take_ids = excluded_take_ids or []
-    conn = get_connection()
-    try:
-        with conn.cursor() as cur:
-            params = [athlete_name, throw_types]
-            date_clause = ""
-            velocity_clause = ""
-            exclusion_clause = ""
-            if session_dates:
-                date_placeholders = ",".join(["%s"] * len(session_dates))
-                date_clause = f"AND t.take_date IN ({date_placeholders})"
-                params.extend(session_dates)
-            if velocity_range and velocity_range[0] is not None and velocity_range[1] is not None:
-                velocity_clause = "AND t.pitch_velo BETWEEN %s AND %s"
-                params.extend(velocity_range)
-            if excluded_take_ids:
-                exclusion_clause = "AND NOT (t.take_id = ANY(%s))"
-                params.append(excluded_take_ids)
-            cur.execute(
-                f"""
-                SELECT
-                    t.take_id,
-                    t.pitch_velo,
-                    t.take_date,
-                    a.athlete_name,
-                    a.handedness,
-                    ROW_NUMBER() OVER (
-                        PARTITION BY a.athlete_name, t.take_date
-                        ORDER BY t.take_id
-                    ) AS pitch_number
-                FROM takes t
-                JOIN athletes a ON a.athlete_id = t.athlete_id
-                WHERE a.athlete_name = %s
-                  AND t.throw_type = ANY(%s)
-                  {date_clause}
-                  {velocity_clause}
-                  {exclusion_clause}
-                  AND t.pitch_velo IS NOT NULL
-                ORDER BY t.take_id
-                """,
-                tuple(params),
-            )
-            return cur.fetchall()
-    finally:
-        conn.close()
+# --------------------------------------------------
+
+
+def get_report_take_rows(athlete_name, session_dates, throw_types=None, velocity_range=None, excluded_take_ids=None):
+    throw_types = throw_types or ["Mound"]
+    excluded_take_ids = excluded_take_ids or []
+    with pooled_cursor() as cur:
+        params = [athlete_name, throw_types]
+        date_clause = ""
+        velocity_clause = ""
+        exclusion_clause = ""
+        if session_dates:
+            date_clause = "AND t.take_date = ANY(%s::date[])"
+            params.append(list(session_dates))
+        if velocity_range and velocity_range[0] is not None and velocity_range[1] is not None:
+            velocity_clause = "AND t.pitch_velo BETWEEN %s AND %s"
+            params.extend(velocity_range)
+        if excluded_take_ids:
+            exclusion_clause = "AND NOT (t.take_id = ANY(%s::bigint[]))"
+            params.append(excluded_take_ids)
+        cur.execute(
+            f"""
+            SELECT
+                t.take_id,
+                t.pitch_velo,
+                t.take_date,
+                a.athlete_name,
+                a.handedness,
+                ROW_NUMBER() OVER (
+                    PARTITION BY a.athlete_name, t.take_date
+                    ORDER BY t.take_id
+                ) AS pitch_number
+            FROM takes t
+            JOIN athletes a ON a.athlete_id = t.athlete_id
+            WHERE a.athlete_name = %s
+              AND t.throw_type = ANY(%s)
+              {date_clause}
+              {velocity_clause}
+              {exclusion_clause}
+              AND t.pitch_velo IS NOT NULL
+            ORDER BY t.take_id
+            """,
+            tuple(params),
+        )
+        return cur.fetchall()
 
 
 def build_report_kinematic_summary(report_rows):
     if not report_rows:
         return [], {}
 
-    take_ids = [row[0] for row in report_rows]
+    take_ids = take_id_key(row[0] for row in report_rows)
     take_velocity = {row[0]: row[1] for row in report_rows}
     take_handedness = {row[0]: row[4] for row in report_rows}
     take_ids_by_handedness = {
-        "R": [take_id for take_id in take_ids if take_handedness.get(take_id) == "R"],
-        "L": [take_id for take_id in take_ids if take_handedness.get(take_id) == "L"],
+        "R": tuple(take_id for take_id in take_ids if take_handedness.get(take_id) == "R"),
+        "L": tuple(take_id for take_id in take_ids if take_handedness.get(take_id) == "L"),
     }
 
     def load_by_handedness(loader_fn):
-        merged = {}
-        for hand, ids in take_ids_by_handedness.items():
-            if ids:
-                merged.update(loader_fn(ids, hand))
-        return merged
-
-    cg_data = load_by_handedness(get_hand_cg_velocity)
-    shoulder_er_data = load_by_handedness(get_shoulder_er_angles)
+        return load_merged_by_handedness(loader_fn, take_ids_by_handedness)
+
+    report_series = run_loaders_concurrently({
+        "cg": lambda: load_by_handedness(get_hand_cg_velocity),
+        "shoulder_er": lambda: load_by_handedness(get_shoulder_er_angles),
+        "pelvis": lambda: get_pelvis_angular_velocity(take_ids),
+        "torso": lambda: get_torso_angular_velocity(take_ids),
+        "elbow": lambda: load_by_handedness(get_elbow_angular_velocity),
+        "shoulder_ir": lambda: load_by_handedness(get_shoulder_ir_velocity),
+    })
+    cg_data = report_series["cg"]
+    shoulder_er_data = report_series["shoulder_er"]
     br_frames = {}
     for take_id, d in cg_data.items():
-        valid = [(i, v) for i, v in enumerate(d["x"]) if v is not None]
-        if valid:
-            idx, _ = max(valid, key=lambda item: item[1])
-            br_frames[take_id] = d["frame"][idx] + 4
+        br_frame = extreme_frame(d["frame"], d["x"])
+        if br_frame is not None:
+            br_frames[take_id] = br_frame + 4
 
     shoulder_er_max_frames = {}
     for take_id, d in shoulder_er_data.items():
-        valid = [(frame, value) for frame, value in zip(d["frame"], d["z"]) if value is not None]
-        if not valid:
-            continue
-
-        if take_handedness.get(take_id) == "R":
-            shoulder_er_max_frames[take_id] = min(valid, key=lambda item: item[1])[0]
-        else:
-            shoulder_er_max_frames[take_id] = max(valid, key=lambda item: item[1])[0]
+        er_frame = extreme_frame(d["frame"], d["z"], largest=take_handedness.get(take_id) != "R")
+        if er_frame is not None:
+            shoulder_er_max_frames[take_id] = er_frame
 
     foot_plant_frames = {}
     for hand, ids in take_ids_by_handedness.items():
@@ -7756,10 +6652,10 @@ def build_report_kinematic_summary(report_rows):
         if er_frame is not None and fp_frame > er_frame:
             foot_plant_frames[take_id] = er_frame
 
-    pelvis_data = get_pelvis_angular_velocity(take_ids)
-    torso_data = get_torso_angular_velocity(take_ids)
-    elbow_data = load_by_handedness(get_elbow_angular_velocity)
-    shoulder_ir_data = load_by_handedness(get_shoulder_ir_velocity)
+    pelvis_data = report_series["pelvis"]
+    torso_data = report_series["torso"]
+    elbow_data = report_series["elbow"]
+    shoulder_ir_data = report_series["shoulder_ir"]
 
     segment_sources = {
         "Pelvis Rotation": (pelvis_data, "z"),
@@ -7774,20 +6670,12 @@ def build_report_kinematic_summary(report_rows):
             if take_id not in br_frames:
                 continue
 
-            norm_frames = []
-            norm_values = []
-            for frame, value in zip(d["frame"], d[axis_key]):
-                if value is None:
-                    continue
-
-                rel_frame = frame - br_frames[take_id]
-                norm_frames.append(rel_frame_to_ms(rel_frame))
-                normalized_value = value
-                if segment in {"Pelvis Rotation", "Torso Rotation", "Shoulder Internal Rotation"} and take_handedness.get(take_id) == "L":
-                    normalized_value = -normalized_value
-                elif segment == "Elbow Extension":
-                    normalized_value = -normalized_value
-                norm_values.append(normalized_value)
+            sign = 1.0
+            if segment in {"Pelvis Rotation", "Torso Rotation", "Shoulder Internal Rotation"} and take_handedness.get(take_id) == "L":
+                sign = -1.0
+            elif segment == "Elbow Extension":
+                sign = -1.0
+            norm_frames, norm_values = normalize_to_release(d["frame"], d[axis_key], br_frames[take_id], sign=sign)
 
             if norm_frames:
                 curves_by_segment[segment][take_id] = {
@@ -7861,80 +6749,71 @@ def build_report_kinematic_summary(report_rows):
 def get_report_take_rows_by_ids(take_ids):
     if not take_ids:
         return []
-    conn = get_connection()
-    try:
-        with conn.cursor() as cur:
-            placeholders = ",".join(["%s"] * len(take_ids))
-            cur.execute(
-                f"""
-                SELECT
-                    t.take_id,
-                    t.pitch_velo,
-                    t.take_date,
-                    a.athlete_name,
-                    a.handedness,
-                    ROW_NUMBER() OVER (
-                        PARTITION BY a.athlete_name, t.take_date
-                        ORDER BY t.take_id
-                    ) AS pitch_number
-                FROM takes t
-                JOIN athletes a ON a.athlete_id = t.athlete_id
-                WHERE t.take_id IN ({placeholders})
-                ORDER BY t.take_id
-                """,
-                tuple(take_ids),
-            )
-            return cur.fetchall()
-    finally:
-        conn.close()
+    with pooled_cursor() as cur:
+        cur.execute(
+            """
+            SELECT
+                t.take_id,
+                t.pitch_velo,
+                t.take_date,
+                a.athlete_name,
+                a.handedness,
+                ROW_NUMBER() OVER (
+                    PARTITION BY a.athlete_name, t.take_date
+                    ORDER BY t.take_id
+                ) AS pitch_number
+            FROM takes t
+            JOIN athletes a ON a.athlete_id = t.athlete_id
+            WHERE t.take_id = ANY(%s::bigint[])
+            ORDER BY t.take_id
+            """,
+            (list(take_ids),),
+        )
+        return cur.fetchall()
 
 
-@st.cache_data(ttl=300, show_spinner=False)
+@st.cache_data(ttl=CACHE_TTL_SECONDS, show_spinner=False, hash_funcs=TAKE_ID_HASH_FUNCS)
 def get_take_report_metric_summaries(take_ids, metric_keys, logic_version=REPORT_METRIC_LOGIC_VERSION):
     if not take_ids or not metric_keys:
         return {}
 
-    conn = get_connection()
-    try:
-        with conn.cursor() as cur:
-            cur.execute("SELECT to_regclass('public.take_report_metrics')")
-            if cur.fetchone()[0] is None:
-                return {}
-            cur.execute(
-                """
-                SELECT
-                    metric_key,
-                    event_label,
-                    AVG(metric_value)::double precision AS mean_value,
-                    CASE
-                        WHEN COUNT(metric_value) > 1 THEN STDDEV_SAMP(metric_value)::double precision
-                        WHEN COUNT(metric_value) = 1 THEN 0::double precision
-                        ELSE NULL::double precision
-                    END AS sd_value
-                FROM take_report_metrics
-                WHERE take_id = ANY(%s)
-                  AND metric_key = ANY(%s)
-                  AND event_label = ANY(%s)
-                  AND logic_version = %s
-                  AND metric_value IS NOT NULL
-                GROUP BY metric_key, event_label
-                """,
-                (
-                    list(take_ids),
-                    list(metric_keys),
-                    ["FP", "MER", "BR", "Max", "Average"],
-                    logic_version,
-                ),
-            )
-            summaries = {}
-            for metric_key, event_label, mean_value, sd_value in cur.fetchall():
-                summaries.setdefault(metric_key, {})[event_label] = {
-                    "mean": float(mean_value) if mean_value is not None else None,
-                    "std": float(sd_value) if sd_value is not None else None,
-                }
-            return summaries
-    finally:
-        conn.close()
+    with pooled_cursor() as cur:
+        cur.execute("SELECT to_regclass('public.take_report_metrics')")
+        if cur.fetchone()[0] is None:
+            return {}
+        cur.execute(
+            """
+            SELECT
+                metric_key,
+                event_label,
+                AVG(metric_value)::double precision AS mean_value,
+                CASE
+                    WHEN COUNT(metric_value) > 1 THEN STDDEV_SAMP(metric_value)::double precision
+                    WHEN COUNT(metric_value) = 1 THEN 0::double precision
+                    ELSE NULL::double precision
+                END AS sd_value
+            FROM take_report_metrics
+            WHERE take_id = ANY(%s::bigint[])
+              AND metric_key = ANY(%s)
+              AND event_label = ANY(%s)
+              AND logic_version = %s
+              AND metric_value IS NOT NULL
+            GROUP BY metric_key, event_label
+            """,
+            (
+                list(take_ids),
+                list(metric_keys),
+                ["FP", "MER", "BR", "Max", "Average"],
+                logic_version,
+            ),
+        )
+        summaries = {}
+        for metric_key, event_label, mean_value, sd_value in cur.fetchall():
+            summaries.setdefault(metric_key, {})[event_label] = {
+                "mean": float(mean_value) if mean_value is not None else None,
+                "std": float(sd_value) if sd_value is not None else None,
+            }
+        return summaries
 
 
 def apply_precomputed_metric_summary(report_metric_data, metric_summaries, metric_key):
@@ -8196,31 +7075,27 @@ def build_event_payload_from_rows(rows):
     return event_frames
 
 
-@st.cache_data(ttl=300, show_spinner=False)
+@st.cache_data(ttl=CACHE_TTL_SECONDS, show_spinner=False, hash_funcs=TAKE_ID_HASH_FUNCS)
 def get_cached_report_events(take_ids, logic_version=REPORT_METRIC_LOGIC_VERSION):
     take_ids = [take_id for take_id in take_ids if take_id is not None]
     if not take_ids:
         return {"fp_event_frames": [], "mer_event_frames": [], "pkh_event_frames": [], "events_by_take": {}}
 
-    conn = get_connection()
-    try:
-        with conn.cursor() as cur:
-            cur.execute("SELECT to_regclass('public.take_report_events')")
-            if cur.fetchone()[0] is None:
-                return {"fp_event_frames": [], "mer_event_frames": [], "pkh_event_frames": [], "events_by_take": {}}
-            cur.execute(
-                """
-                SELECT take_id, event_label, source_frame, relative_frame, relative_ms
-                FROM take_report_events
-                WHERE take_id = ANY(%s)
-                  AND logic_version = %s
-                ORDER BY event_label
-                """,
-                (take_ids, logic_version),
-            )
-            return build_event_payload_from_rows(cur.fetchall())
-    finally:
-        conn.close()
+    with pooled_cursor() as cur:
+        cur.execute("SELECT to_regclass('public.take_report_events')")
+        if cur.fetchone()[0] is None:
+            return {"fp_event_frames": [], "mer_event_frames": [], "pkh_event_frames": [], "events_by_take": {}}
+        cur.execute(
+            """
+            SELECT take_id, event_label, source_frame, relative_frame, relative_ms
+            FROM take_report_events
+            WHERE take_id = ANY(%s::bigint[])
+              AND logic_version = %s
+            ORDER BY event_label
+            """,
+            (take_ids, logic_version),
+        )
+        return build_event_payload_from_rows(cur.fetchall())
 
 
 def cache_report_events_from_metric_data(cur, report_metric_data, logic_version=REPORT_METRIC_LOGIC_VERSION):
@@ -8292,144 +7167,143 @@ def get_report_event_frame_maps(take_ids):
     }
 
 
-@st.cache_data(ttl=300, show_spinner=False)
+@st.cache_data(ttl=CACHE_TTL_SECONDS, show_spinner=False, hash_funcs=TAKE_ID_HASH_FUNCS)
 def get_cached_report_metric_data(take_ids, metric_key, logic_version=REPORT_METRIC_LOGIC_VERSION):
     take_ids = [take_id for take_id in take_ids if take_id is not None]
     if not take_ids or not metric_key:
         return None
 
-    conn = get_connection()
-    try:
-        with conn.cursor() as cur:
-            cur.execute("SELECT to_regclass('public.take_report_metric_cache_status')")
-            if cur.fetchone()[0] is None:
-                return None
+    with pooled_cursor() as cur:
+        cur.execute("SELECT to_regclass('public.take_report_metric_cache_status')")
+        if cur.fetchone()[0] is None:
+            return None
+        cur.execute(
+            """
+            SELECT COUNT(DISTINCT take_id)::int
+            FROM take_report_metric_cache_status
+            WHERE take_id = ANY(%s::bigint[])
+              AND metric_key = %s
+              AND logic_version = %s
+            """,
+            (take_ids, metric_key, logic_version),
+        )
+        processed_count = cur.fetchone()[0] or 0
+        if processed_count != len(set(take_ids)):
+            return None
+
+        cur.execute("SELECT to_regclass('public.take_report_metrics')")
+        if cur.fetchone()[0] is None:
+            return None
+        cur.execute(
+            """
+            SELECT
+                event_label,
+                AVG(metric_value)::double precision AS mean_value,
+                CASE
+                    WHEN COUNT(metric_value) > 1 THEN STDDEV_SAMP(metric_value)::double precision
+                    WHEN COUNT(metric_value) = 1 THEN 0::double precision
+                    ELSE NULL::double precision
+                END AS sd_value
+            FROM take_report_metrics
+            WHERE take_id = ANY(%s::bigint[])
+              AND metric_key = %s
+              AND logic_version = %s
+              AND metric_value IS NOT NULL
+            GROUP BY event_label
+            ORDER BY event_label
+            """,
+            (take_ids, metric_key, logic_version),
+        )
+        metrics = {
+            event_label: {
+                "mean": float(mean_value) if mean_value is not None else None,
+                "std": float(sd_value) if sd_value is not None else None,
+            }
+            for event_label, mean_value, sd_value in cur.fetchall()
+        }
+
+        curves = {}
+        cur.execute("SELECT to_regclass('public.take_report_metric_curves')")
+        if cur.fetchone()[0] is not None:
             cur.execute(
                 """
-                SELECT COUNT(DISTINCT take_id)::int
-                FROM take_report_metric_cache_status
-                WHERE take_id = ANY(%s)
+                SELECT
+                    time_ms,
+                    AVG(metric_value)::double precision AS mean_value,
+                    percentile_cont(0.25) WITHIN GROUP (ORDER BY metric_value)::double precision AS q1_value,
+                    percentile_cont(0.75) WITHIN GROUP (ORDER BY metric_value)::double precision AS q3_value
+                FROM take_report_metric_curves
+                WHERE take_id = ANY(%s::bigint[])
                   AND metric_key = %s
                   AND logic_version = %s
+                  AND metric_value IS NOT NULL
+                GROUP BY time_ms
+                ORDER BY time_ms
                 """,
                 (take_ids, metric_key, logic_version),
             )
-            processed_count = cur.fetchone()[0] or 0
-            if processed_count != len(set(take_ids)):
-                return None
-
-            cur.execute("SELECT to_regclass('public.take_report_metrics')")
-            if cur.fetchone()[0] is None:
-                return None
+            aggregate_curve = {"frame": [], "value": [], "q1": [], "q3": []}
+            for time_ms, mean_value, q1_value, q3_value in cur.fetchall():
+                aggregate_curve["frame"].append(float(time_ms))
+                aggregate_curve["value"].append(float(mean_value) if mean_value is not None else None)
+                aggregate_curve["q1"].append(float(q1_value) if q1_value is not None else None)
+                aggregate_curve["q3"].append(float(q3_value) if q3_value is not None else None)
+            if aggregate_curve["frame"]:
+                curves["__aggregate__"] = aggregate_curve
+
+    # Read after releasing the cursor above so one call never holds two
+    # pooled connections at once.
+    cached_events = get_cached_report_events(take_ids, logic_version)
+    fp_event_frames = list(cached_events.get("fp_event_frames", []))
+    mer_event_frames = list(cached_events.get("mer_event_frames", []))
+    if not fp_event_frames or not mer_event_frames:
+        take_metrics = {}
+        with pooled_cursor() as cur:
             cur.execute(
                 """
-                SELECT
-                    event_label,
-                    AVG(metric_value)::double precision AS mean_value,
-                    CASE
-                        WHEN COUNT(metric_value) > 1 THEN STDDEV_SAMP(metric_value)::double precision
-                        WHEN COUNT(metric_value) = 1 THEN 0::double precision
-                        ELSE NULL::double precision
-                    END AS sd_value
+                SELECT take_id, event_label, metric_value, source_frame
                 FROM take_report_metrics
-                WHERE take_id = ANY(%s)
+                WHERE take_id = ANY(%s::bigint[])
                   AND metric_key = %s
                   AND logic_version = %s
-                  AND metric_value IS NOT NULL
-                GROUP BY event_label
-                ORDER BY event_label
+                ORDER BY take_id, event_label
                 """,
                 (take_ids, metric_key, logic_version),
             )
-            metrics = {
-                event_label: {
-                    "mean": float(mean_value) if mean_value is not None else None,
-                    "std": float(sd_value) if sd_value is not None else None,
+            for take_id, event_label, metric_value, source_frame in cur.fetchall():
+                take_metrics.setdefault(take_id, {})[event_label] = {
+                    "value": float(metric_value) if metric_value is not None else None,
+                    "source_frame": int(source_frame) if source_frame is not None else None,
                 }
-                for event_label, mean_value, sd_value in cur.fetchall()
-            }
+        fallback_fp_event_frames = []
+        fallback_mer_event_frames = []
+        for event_values in take_metrics.values():
+            br_frame = event_values.get("BR", {}).get("source_frame")
+            fp_frame = event_values.get("FP", {}).get("source_frame")
+            mer_frame = event_values.get("MER", {}).get("source_frame")
+            if br_frame is not None and fp_frame is not None:
+                fallback_fp_event_frames.append(fp_frame - br_frame)
+            if br_frame is not None and mer_frame is not None:
+                fallback_mer_event_frames.append(mer_frame - br_frame)
+        if not fp_event_frames:
+            fp_event_frames = fallback_fp_event_frames
+        if not mer_event_frames:
+            mer_event_frames = fallback_mer_event_frames
 
-            curves = {}
-            cur.execute("SELECT to_regclass('public.take_report_metric_curves')")
-            if cur.fetchone()[0] is not None:
-                cur.execute(
-                    """
-                    SELECT
-                        time_ms,
-                        AVG(metric_value)::double precision AS mean_value,
-                        percentile_cont(0.25) WITHIN GROUP (ORDER BY metric_value)::double precision AS q1_value,
-                        percentile_cont(0.75) WITHIN GROUP (ORDER BY metric_value)::double precision AS q3_value
-                    FROM take_report_metric_curves
-                    WHERE take_id = ANY(%s)
-                      AND metric_key = %s
-                      AND logic_version = %s
-                      AND metric_value IS NOT NULL
-                    GROUP BY time_ms
-                    ORDER BY time_ms
-                    """,
-                    (take_ids, metric_key, logic_version),
-                )
-                aggregate_curve = {"frame": [], "value": [], "q1": [], "q3": []}
-                for time_ms, mean_value, q1_value, q3_value in cur.fetchall():
-                    aggregate_curve["frame"].append(float(time_ms))
-                    aggregate_curve["value"].append(float(mean_value) if mean_value is not None else None)
-                    aggregate_curve["q1"].append(float(q1_value) if q1_value is not None else None)
-                    aggregate_curve["q3"].append(float(q3_value) if q3_value is not None else None)
-                if aggregate_curve["frame"]:
-                    curves["__aggregate__"] = aggregate_curve
-
-            cached_events = get_cached_report_events(take_ids, logic_version)
-            fp_event_frames = list(cached_events.get("fp_event_frames", []))
-            mer_event_frames = list(cached_events.get("mer_event_frames", []))
-            if not fp_event_frames or not mer_event_frames:
-                take_metrics = {}
-                cur.execute(
-                    """
-                    SELECT take_id, event_label, metric_value, source_frame
-                    FROM take_report_metrics
-                    WHERE take_id = ANY(%s)
-                      AND metric_key = %s
-                      AND logic_version = %s
-                    ORDER BY take_id, event_label
-                    """,
-                    (take_ids, metric_key, logic_version),
-                )
-                for take_id, event_label, metric_value, source_frame in cur.fetchall():
-                    take_metrics.setdefault(take_id, {})[event_label] = {
-                        "value": float(metric_value) if metric_value is not None else None,
-                        "source_frame": int(source_frame) if source_frame is not None else None,
-                    }
-                fallback_fp_event_frames = []
-                fallback_mer_event_frames = []
-                for event_values in take_metrics.values():
-                    br_frame = event_values.get("BR", {}).get("source_frame")
-                    fp_frame = event_values.get("FP", {}).get("source_frame")
-                    mer_frame = event_values.get("MER", {}).get("source_frame")
-                    if br_frame is not None and fp_frame is not None:
-                        fallback_fp_event_frames.append(fp_frame - br_frame)
-                    if br_frame is not None and mer_frame is not None:
-                        fallback_mer_event_frames.append(mer_frame - br_frame)
-                if not fp_event_frames:
-                    fp_event_frames = fallback_fp_event_frames
-                if not mer_event_frames:
-                    mer_event_frames = fallback_mer_event_frames
-
-            return {
-                "curves": curves,
-                "events": {
-                    "fp_event_frames": fp_event_frames,
-                    "mer_event_frames": mer_event_frames,
-                    "pkh_event_frames": cached_events.get("pkh_event_frames", []),
-                    "events_by_take": cached_events.get("events_by_take", {}),
-                },
-                "metrics": metrics,
-                "take_metrics": {},
-            }
-    finally:
-        conn.close()
+    return {
+        "curves": curves,
+        "events": {
+            "fp_event_frames": fp_event_frames,
+            "mer_event_frames": mer_event_frames,
+            "pkh_event_frames": cached_events.get("pkh_event_frames", []),
+            "events_by_take": cached_events.get("events_by_take", {}),
+        },
+        "metrics": metrics,
+        "take_metrics": {},
+    }
 
 
-@st.cache_data(ttl=300, show_spinner=False)
+@st.cache_data(ttl=CACHE_TTL_SECONDS, show_spinner=False, hash_funcs=TAKE_ID_HASH_FUNCS)
 def get_cached_report_metric_bundle(take_ids, metric_keys, logic_version=REPORT_METRIC_LOGIC_VERSION):
     take_ids = sorted({take_id for take_id in take_ids if take_id is not None})
     metric_keys = [metric_key for metric_key in metric_keys if metric_key]
@@ -8438,8 +7312,7 @@ def get_cached_report_metric_bundle(take_ids, metric_keys, logic_version=REPORT_
 
     unique_take_count = len(take_ids)
     aggregate_hash = report_reference_aggregate_hash(take_ids, logic_version)
-    conn = get_connection()
-    try:
+    with pooled_connection() as conn:
         with conn.cursor() as cur:
             ensure_report_metric_cache_schema(cur)
             conn.commit()
@@ -8456,7 +7329,7 @@ def get_cached_report_metric_bundle(take_ids, metric_keys, logic_version=REPORT_
                 """
                 SELECT metric_key, COUNT(DISTINCT take_id)::int
                 FROM take_report_metric_cache_status
-                WHERE take_id = ANY(%s)
+                WHERE take_id = ANY(%s::bigint[])
                   AND metric_key = ANY(%s)
                   AND logic_version = %s
                 GROUP BY metric_key
@@ -8481,24 +7354,28 @@ def get_cached_report_metric_bundle(take_ids, metric_keys, logic_version=REPORT_
             if not missing_metric_keys:
                 return cached_bundle
 
-            cached_events = get_cached_report_events(take_ids, logic_version)
-            shared_events = {
-                "fp_event_frames": list(cached_events.get("fp_event_frames", [])),
-                "mer_event_frames": list(cached_events.get("mer_event_frames", [])),
-                "pkh_event_frames": list(cached_events.get("pkh_event_frames", [])),
-                "events_by_take": cached_events.get("events_by_take", {}),
-            }
-            bundle = dict(cached_bundle)
-            bundle.update({
-                metric_key: {
-                    "curves": {},
-                    "events": shared_events,
-                    "metrics": {},
-                    "take_metrics": {},
-                }
-                for metric_key in missing_metric_keys
-            })
+    # The events loader checks out its own connection, so read it between
+    # the two blocks rather than while this one is still held.
+    cached_events = get_cached_report_events(take_ids, logic_version)
+    shared_events = {
+        "fp_event_frames": list(cached_events.get("fp_event_frames", [])),
+        "mer_event_frames": list(cached_events.get("mer_event_frames", [])),
+        "pkh_event_frames": list(cached_events.get("pkh_event_frames", [])),
+        "events_by_take": cached_events.get("events_by_take", {}),
+    }
+    bundle = dict(cached_bundle)
+    bundle.update({
+        metric_key: {
+            "curves": {},
+            "events": shared_events,
+            "metrics": {},
+            "take_metrics": {},
+        }
+        for metric_key in missing_metric_keys
+    })
 
+    with pooled_connection() as conn:
+        with conn.cursor() as cur:
             cur.execute(
                 """
                 SELECT
@@ -8511,7 +7388,7 @@ def get_cached_report_metric_bundle(take_ids, metric_keys, logic_version=REPORT_
                         ELSE NULL::double precision
                     END AS sd_value
                 FROM take_report_metrics
-                WHERE take_id = ANY(%s)
+                WHERE take_id = ANY(%s::bigint[])
                   AND metric_key = ANY(%s)
                   AND logic_version = %s
                   AND metric_value IS NOT NULL
@@ -8535,7 +7412,7 @@ def get_cached_report_metric_bundle(take_ids, metric_keys, logic_version=REPORT_
                     percentile_cont(0.25) WITHIN GROUP (ORDER BY metric_value)::double precision AS q1_value,
                     percentile_cont(0.75) WITHIN GROUP (ORDER BY metric_value)::double precision AS q3_value
                 FROM take_report_metric_curves
-                WHERE take_id = ANY(%s)
+                WHERE take_id = ANY(%s::bigint[])
                   AND metric_key = ANY(%s)
                   AND logic_version = %s
                   AND metric_value IS NOT NULL
@@ -8564,19 +7441,16 @@ def get_cached_report_metric_bundle(take_ids, metric_keys, logic_version=REPORT_
             )
             conn.commit()
             return bundle
-    finally:
-        conn.close()
 
 
 def cache_report_metric_data(report_rows, metric_key, metric_label, metric_group, unit, source_category, source_segment, source_axis, report_metric_data, logic_version=REPORT_METRIC_LOGIC_VERSION):
     if not report_rows or not metric_key or not report_metric_data:
         return
-    take_ids = [row[0] for row in report_rows]
+    take_ids = take_id_key(row[0] for row in report_rows)
     take_metrics = report_metric_data.get("take_metrics", {})
     curves = report_metric_data.get("curves", {})
 
-    conn = get_connection()
-    try:
+    with pooled_connection() as conn:
         with conn:
             with conn.cursor() as cur:
                 ensure_report_metric_cache_schema(cur)
@@ -8641,7 +7515,7 @@ def cache_report_metric_data(report_rows, metric_key, metric_label, metric_group
                     cur.execute(
                         """
                         DELETE FROM take_report_metric_curves
-                        WHERE take_id = ANY(%s)
+                        WHERE take_id = ANY(%s::bigint[])
                           AND metric_key = %s
                           AND logic_version = %s
                         """,
@@ -8682,27 +7556,21 @@ def cache_report_metric_data(report_rows, metric_key, metric_label, metric_group
                         template="(%s,%s,%s,NOW())",
                         page_size=1000,
                     )
-    finally:
-        conn.close()
 
 
 def build_report_arm_metric_data(report_rows, loader_fn, max_selector=None, max_window="fp_to_br"):
     if not report_rows:
         return {"curves": {}, "events": {}, "metrics": {}}
 
-    take_ids = [row[0] for row in report_rows]
+    take_ids = take_id_key(row[0] for row in report_rows)
     take_handedness = {row[0]: row[4] for row in report_rows}
     take_ids_by_handedness = {
-        "R": [take_id for take_id in take_ids if take_handedness.get(take_id) == "R"],
-        "L": [take_id for take_id in take_ids if take_handedness.get(take_id) == "L"],
+        "R": tuple(take_id for take_id in take_ids if take_handedness.get(take_id) == "R"),
+        "L": tuple(take_id for take_id in take_ids if take_handedness.get(take_id) == "L"),
     }
 
     def load_by_handedness(loader_fn):
-        merged = {}
-        for hand, ids in take_ids_by_handedness.items():
-            if ids:
-                merged.update(loader_fn(ids, hand))
-        return merged
+        return load_merged_by_handedness(loader_fn, take_ids_by_handedness)
 
     metric_data = load_by_handedness(loader_fn)
     event_maps = get_report_event_frame_maps(take_ids)
@@ -8716,20 +7584,15 @@ def build_report_arm_metric_data(report_rows, loader_fn, max_selector=None, max_
         shoulder_er_data = load_by_handedness(get_shoulder_er_angles)
         br_frames = {}
         for take_id, d in cg_data.items():
-            valid = [(i, value) for i, value in enumerate(d["x"]) if value is not None]
-            if valid:
-                idx, _ = max(valid, key=lambda item: item[1])
-                br_frames[take_id] = d["frame"][idx] + 4
+            br_frame = extreme_frame(d["frame"], d["x"])
+            if br_frame is not None:
+                br_frames[take_id] = br_frame + 4
 
         mer_frames = {}
         for take_id, d in shoulder_er_data.items():
-            valid = [(frame, value) for frame, value in zip(d["frame"], d["z"]) if value is not None]
-            if valid:
-                mer_frames[take_id] = (
-                    min(valid, key=lambda item: item[1])[0]
-                    if take_handedness.get(take_id) == "R"
-                    else max(valid, key=lambda item: item[1])[0]
-                )
+            mer_frame = extreme_frame(d["frame"], d["z"], largest=take_handedness.get(take_id) != "R")
+            if mer_frame is not None:
+                mer_frames[take_id] = mer_frame
 
         fp_frames = {}
         for hand, ids in take_ids_by_handedness.items():
@@ -8766,16 +7629,11 @@ def build_report_arm_metric_data(report_rows, loader_fn, max_selector=None, max_
                 if ids:
                     pkh_frames.update(get_peak_glove_knee_pre_br(ids, hand, br_frames))
 
-    def value_near_frame(curve, frame):
-        candidates = [
-            (abs(curve_frame - frame), value, curve_frame)
-            for curve_frame, value in zip(curve.get("frame", []), curve.get("value", []))
-            if value is not None
-        ]
-        if not candidates:
+    def value_near_frame(curve_frames, curve_values, frame):
+        if not curve_frames.size:
             return None, None
-        _distance, value, actual_frame = min(candidates, key=lambda item: item[0])
-        return value, actual_frame
+        idx = int(np.argmin(np.abs(curve_frames - frame)))
+        return curve_values[idx], curve_frames[idx]
 
     curves = {}
     metric_values = {"FP": [], "MER": [], "BR": [], "Max": []}
@@ -8784,23 +7642,21 @@ def build_report_arm_metric_data(report_rows, loader_fn, max_selector=None, max_
         br_frame = br_frames.get(take_id)
         if br_frame is None:
             continue
-        normalized = {
-            "frame": [
-                rel_frame_to_ms(frame - br_frame)
-                for frame, value in zip(curve["frame"], curve["value"])
-                if value is not None and np.isfinite(value)
-            ],
-            "value": [
-                value
-                for value in curve["value"]
-                if value is not None and np.isfinite(value)
-            ],
-        }
-        curves[take_id] = normalized
+        normalized_frames, normalized_values = normalize_to_release(
+            curve["frame"], curve["value"], br_frame
+        )
+        curves[take_id] = {"frame": normalized_frames, "value": normalized_values}
+        # One array pass per take; missing samples drop out of every lookup below
+        curve_frames = np.asarray(curve["frame"], dtype=np.int64)
+        curve_values = np.asarray(curve["value"], dtype=np.float64)
+        present = ~np.isnan(curve_values)
+        curve_frames = curve_frames[present]
+        curve_values = curve_values[present]
+        finite = np.isfinite(curve_values)
         event_frame_map = {"FP": fp_frames.get(take_id), "MER": mer_frames.get(take_id), "BR": br_frame}
         for event_label, event_frame in event_frame_map.items():
             if event_frame is not None:
-                value, actual_frame = value_near_frame(curve, event_frame)
+                value, actual_frame = value_near_frame(curve_frames, curve_values, event_frame)
                 if value is not None:
                     metric_values[event_label].append(value)
                     take_metrics.setdefault(take_id, {})[event_label] = {
@@ -8809,12 +7665,8 @@ def build_report_arm_metric_data(report_rows, loader_fn, max_selector=None, max_
                     }
         fp_frame = fp_frames.get(take_id)
         if max_window == "pre_br":
-            finite_frames = [
-                frame
-                for frame, value in zip(curve["frame"], curve["value"])
-                if value is not None and np.isfinite(value) and frame <= br_frame
-            ]
-            window_start = min(finite_frames) if finite_frames else br_frame - ms_to_rel_frame(200)
+            finite_frames = curve_frames[finite & (curve_frames <= br_frame)]
+            window_start = int(finite_frames.min()) if finite_frames.size else br_frame - ms_to_rel_frame(200)
             window_end = br_frame
         elif max_window == "pkh_to_br":
             window_start = pkh_frames.get(take_id)
@@ -8826,20 +7678,12 @@ def build_report_arm_metric_data(report_rows, loader_fn, max_selector=None, max_
             window_end = mer_frames.get(take_id) if max_window == "fp_to_mer" else br_frame
         if window_end is None:
             window_end = br_frame
-        valid_samples = [
-            (frame, value)
-            for frame, value in zip(curve["frame"], curve["value"])
-            if value is not None
-            and np.isfinite(value)
-            and window_start <= frame <= window_end
-        ]
-        if valid_samples:
-            valid_values = [value for _frame, value in valid_samples]
-            max_value = max_selector(valid_values) if max_selector else max(valid_values)
-            max_frame, _raw_value = min(
-                valid_samples,
-                key=lambda item: abs(float(item[1]) - float(max_value)),
-            )
+        in_window = finite & (curve_frames >= window_start) & (curve_frames <= window_end)
+        if in_window.any():
+            valid_frames = curve_frames[in_window]
+            valid_values = curve_values[in_window]
+            max_value = max_selector(valid_values) if max_selector else valid_values.max()
+            max_frame = valid_frames[int(np.argmin(np.abs(valid_values - float(max_value))))]
             metric_values["Max"].append(max_value)
             take_metrics.setdefault(take_id, {})["Max"] = {
                 "value": float(max_value),
@@ -8909,20 +7753,19 @@ def build_report_pelvis_component_data(report_rows, component):
     )
 
 
+def negate_series_values(values):
+    """
+    Negates a whole series in one NumPy pass, keeping missing samples as None.
+    """
+    return numpy_column_to_list(-np.asarray(values, dtype=np.float64))
+
+
 def normalize_pelvis_torso_component_values(values, component, handedness):
-    normalized_values = []
-    for value in values:
-        if value is None:
-            normalized_values.append(value)
-        elif component == "x":
-            # Theia x tilt is negative into forward tilt; report positive means forward tilt.
-            normalized_values.append(-value)
-        elif component == "y" and handedness == "R":
-            # Report positive lateral tilt means glove-side tilt for both RHP and LHP.
-            normalized_values.append(-value)
-        else:
-            normalized_values.append(value)
-    return normalized_values
+    # Theia x tilt is negative into forward tilt; report positive means forward tilt.
+    # Report positive lateral tilt (y) means glove-side tilt for both RHP and LHP.
+    if component == "x" or (component == "y" and handedness == "R"):
+        return negate_series_values(values)
+    return list(values)
 
 
 def build_report_torso_component_data(report_rows, component):
@@ -8987,13 +7830,12 @@ def build_report_cg_velocity_data(report_rows, component):
         data = get_center_of_mass_velocity_component(take_ids, component, handedness)
         if component != "y":
             return data
+        if handedness != "R":
+            return data
         return {
             take_id: {
                 "frame": curve["frame"],
-                "value": [
-                    -value if handedness == "R" and value is not None else value
-                    for value in curve["value"]
-                ],
+                "value": negate_series_values(curve["value"]),
             }
             for take_id, curve in data.items()
         }
@@ -9037,7 +7879,7 @@ def build_report_lower_extremity_velocity_data(report_rows, leg_role, joint, com
     )
 
 
-@st.cache_data(ttl=300, show_spinner=False)
+@st.cache_data(ttl=CACHE_TTL_SECONDS, show_spinner=False, hash_funcs=TAKE_ID_HASH_FUNCS)
 def get_stride_foot_positions(take_ids, handedness, fp_frames, knee_peak_frames):
     """
     Returns lead-foot positions used for stride metrics.
@@ -9057,66 +7899,62 @@ def get_stride_foot_positions(take_ids, handedness, fp_frames, knee_peak_frames)
     if not needed_frames:
         return {}
 
-    conn = get_connection()
-    try:
-        with conn.cursor() as cur:
-            placeholders = ",".join(["%s"] * len(take_ids))
-            cur.execute(f"""
-                SELECT
-                    ts.take_id,
-                    ts.frame,
-                    ts.x_data,
-                    ts.y_data
-                FROM time_series_data ts
-                JOIN categories c ON ts.category_id = c.category_id
-                JOIN segments s ON ts.segment_id = s.segment_id
-                WHERE c.category_name = 'KINETIC_KINEMATIC_CGPos'
-                  AND s.segment_name = %s
-                  AND ts.take_id IN ({placeholders})
-                ORDER BY ts.take_id, ts.frame
-            """, (segment_name, *tuple(take_ids)))
-
-            positions = {}
-            for take_id, frame, x, y in cur.fetchall():
-                if frame not in needed_frames.get(take_id, set()):
-                    continue
-                positions.setdefault(take_id, {})[int(frame)] = (x, y)
+    # Only the FP and knee-peak rows are needed, so join on (take, frame) pairs
+    # instead of pulling every frame of every take and filtering here
+    pair_take_ids = [take_id for take_id, frames in needed_frames.items() for _ in frames]
+    pair_frames = [int(frame) for frames in needed_frames.values() for frame in frames]
 
-            out = {}
-            for take_id in take_ids:
-                fp_frame = fp_frames.get(take_id)
-                trail_frame = knee_peak_frames.get(take_id)
-                lead_pos = positions.get(take_id, {}).get(fp_frame)
-                trail_pos = positions.get(take_id, {}).get(trail_frame)
-                if lead_pos is None or trail_pos is None:
-                    continue
-                out[take_id] = {
-                    "lead_foot_x": lead_pos[0],
-                    "lead_foot_y": lead_pos[1],
-                    "trail_foot_x": trail_pos[0],
-                    "trail_foot_y": trail_pos[1],
-                }
-            return out
-    finally:
-        conn.close()
+    series_ids = resolve_series_ids("KINETIC_KINEMATIC_CGPos", segment_name)
+    if series_ids is None:
+        return {}
+
+    with pooled_cursor() as cur:
+        execute_prepared(cur, "stride_foot_positions", """
+            SELECT
+                ts.take_id,
+                ts.frame,
+                ts.x_data,
+                ts.y_data
+            FROM time_series_data ts
+            JOIN unnest($1::bigint[], $2::int[]) AS f(take_id, frame)
+              ON f.take_id = ts.take_id
+             AND f.frame = ts.frame
+            WHERE ts.category_id = $3
+              AND ts.segment_id = $4
+        """, (pair_take_ids, pair_frames, *series_ids))
+
+        positions = {}
+        for take_id, frame, x, y in cur.fetchall():
+            positions.setdefault(take_id, {})[int(frame)] = (x, y)
+
+        out = {}
+        for take_id in take_ids:
+            fp_frame = fp_frames.get(take_id)
+            trail_frame = knee_peak_frames.get(take_id)
+            lead_pos = positions.get(take_id, {}).get(fp_frame)
+            trail_pos = positions.get(take_id, {}).get(trail_frame)
+            if lead_pos is None or trail_pos is None:
+                continue
+            out[take_id] = {
+                "lead_foot_x": lead_pos[0],
+                "lead_foot_y": lead_pos[1],
+                "trail_foot_x": trail_pos[0],
+                "trail_foot_y": trail_pos[1],
+            }
+        return out
 
 
-@st.cache_data(ttl=300, show_spinner=False)
+@st.cache_data(ttl=CACHE_TTL_SECONDS, show_spinner=False, hash_funcs=TAKE_ID_HASH_FUNCS)
 def get_take_heights(take_ids):
     if not take_ids:
         return {}
-    conn = get_connection()
-    try:
-        with conn.cursor() as cur:
-            placeholders = ",".join(["%s"] * len(take_ids))
-            cur.execute(f"""
-                SELECT take_id, height
-                FROM takes
-                WHERE take_id IN ({placeholders})
-            """, tuple(take_ids))
-            return {take_id: height for take_id, height in cur.fetchall()}
-    finally:
-        conn.close()
+    with pooled_cursor() as cur:
+        execute_prepared(cur, "take_heights", """
+            SELECT take_id, height
+            FROM takes
+            WHERE take_id = ANY($1::bigint[])
+        """, (list(take_ids),))
+        return {take_id: height for take_id, height in cur.fetchall()}
 
 
 def summarize_values(values):
@@ -9131,19 +7969,15 @@ def build_report_stride_data(report_rows):
     if not report_rows:
         return {"metrics": {}}
 
-    take_ids = [row[0] for row in report_rows]
+    take_ids = take_id_key(row[0] for row in report_rows)
     take_handedness = {row[0]: row[4] for row in report_rows}
     take_ids_by_handedness = {
-        hand: [take_id for take_id in take_ids if take_handedness.get(take_id) == hand]
+        hand: tuple(take_id for take_id in take_ids if take_handedness.get(take_id) == hand)
         for hand in ("R", "L")
     }
 
     def load_by_handedness(loader_fn):
-        merged = {}
-        for hand, ids in take_ids_by_handedness.items():
-            if ids:
-                merged.update(loader_fn(ids, hand))
-        return merged
+        return load_merged_by_handedness(loader_fn, take_ids_by_handedness)
 
     event_maps = get_report_event_frame_maps(take_ids)
     br_frames = event_maps["BR"]
@@ -9155,21 +7989,16 @@ def build_report_stride_data(report_rows):
         cg_data = load_by_handedness(get_hand_cg_velocity)
         br_frames = {}
         for take_id, curve in cg_data.items():
-            valid = [(idx, value) for idx, value in enumerate(curve["x"]) if value is not None]
-            if valid:
-                idx, _ = max(valid, key=lambda item: item[1])
-                br_frames[take_id] = curve["frame"][idx] + 4
+            br_frame = extreme_frame(curve["frame"], curve["x"])
+            if br_frame is not None:
+                br_frames[take_id] = br_frame + 4
 
         shoulder_er_data = load_by_handedness(get_shoulder_er_angles)
         mer_frames = {}
         for take_id, curve in shoulder_er_data.items():
-            valid = [(frame, value) for frame, value in zip(curve["frame"], curve["z"]) if value is not None]
-            if valid:
-                mer_frames[take_id] = (
-                    min(valid, key=lambda item: item[1])[0]
-                    if take_handedness.get(take_id) == "R"
-                    else max(valid, key=lambda item: item[1])[0]
-                )
+            mer_frame = extreme_frame(curve["frame"], curve["z"], largest=take_handedness.get(take_id) != "R")
+            if mer_frame is not None:
+                mer_frames[take_id] = mer_frame
 
         fp_frames = {}
         knee_peak_frames = {}
@@ -9367,36 +8196,9 @@ def get_shoulder_horizontal_abduction_velocity(take_ids, handedness):
         return {}
 
     segment_name = "RT_SHOULDER_RTA_ANGULAR_VELOCITY" if handedness == "R" else "LT_SHOULDER_RTA_ANGULAR_VELOCITY"
-    conn = get_connection()
-    try:
-        with conn.cursor() as cur:
-            placeholders = ",".join(["%s"] * len(take_ids))
-            cur.execute(f"""
-                SELECT
-                    ts.take_id,
-                    ts.frame,
-                    ts.x_data
-                FROM time_series_data ts
-                JOIN categories c ON ts.category_id = c.category_id
-                JOIN segments s ON ts.segment_id = s.segment_id
-                WHERE c.category_name = 'ORIGINAL'
-                  AND s.segment_name = %s
-                  AND ts.take_id IN ({placeholders})
-                  AND ts.x_data IS NOT NULL
-                ORDER BY ts.take_id, ts.frame
-            """, (segment_name, *take_ids))
-
-            data = {}
-            for take_id, frame, x in cur.fetchall():
-                data.setdefault(take_id, {"frame": [], "value": []})
-                data[take_id]["frame"].append(frame)
-                data[take_id]["value"].append(x)
-            return data
-    finally:
-        conn.close()
+    return load_time_series_component(take_ids, "ORIGINAL", segment_name, "x", drop_null=True)
 
 
-@st.cache_data(ttl=300, show_spinner=False)
 def get_original_shoulder_horizontal_angle(take_ids, handedness):
     """
     Raw shoulder angle x_data used only to locate max scap retraction.
@@ -9411,42 +8213,16 @@ def get_original_shoulder_horizontal_angle(take_ids, handedness):
         return {}
 
     segment_name = "RT_SHOULDER_ANGLE" if handedness == "R" else "LT_SHOULDER_ANGLE"
-    conn = get_connection()
-    try:
-        with conn.cursor() as cur:
-            placeholders = ",".join(["%s"] * len(take_ids))
-            cur.execute(f"""
-                SELECT
-                    ts.take_id,
-                    ts.frame,
-                    ts.x_data
-                FROM time_series_data ts
-                JOIN categories c ON ts.category_id = c.category_id
-                JOIN segments s ON ts.segment_id = s.segment_id
-                WHERE c.category_name = 'ORIGINAL'
-                  AND s.segment_name = %s
-                  AND ts.take_id IN ({placeholders})
-                  AND ts.x_data IS NOT NULL
-                ORDER BY ts.take_id, ts.frame
-            """, (segment_name, *take_ids))
-
-            data = {}
-            for take_id, frame, x in cur.fetchall():
-                data.setdefault(take_id, {"frame": [], "value": []})
-                data[take_id]["frame"].append(frame)
-                data[take_id]["value"].append(x)
-            return data
-    finally:
-        conn.close()
+    return load_time_series_component(take_ids, "ORIGINAL", segment_name, "x", drop_null=True)
 
 
 def build_report_arm_velocity_data(report_rows, loader_fn, value_key="value", invert_for_all=False, invert_left=False, peak_mode="max"):
     if not report_rows:
         return {"curves": {}, "events": {}, "metrics": {}}
-    take_ids = [row[0] for row in report_rows]
+    take_ids = take_id_key(row[0] for row in report_rows)
     take_handedness = {row[0]: row[4] for row in report_rows}
     take_ids_by_handedness = {
-        hand: [take_id for take_id in take_ids if take_handedness.get(take_id) == hand]
+        hand: tuple(take_id for take_id in take_ids if take_handedness.get(take_id) == hand)
         for hand in ("R", "L")
     }
     raw_data = {}
@@ -9462,36 +8238,34 @@ def build_report_arm_velocity_data(report_rows, loader_fn, value_key="value", in
                 cg_data.update(get_hand_cg_velocity(ids, hand))
         br_frames = {}
         for take_id, curve in cg_data.items():
-            valid = [(i, value) for i, value in enumerate(curve["x"]) if value is not None]
-            if valid:
-                idx, _ = max(valid, key=lambda item: item[1])
-                br_frames[take_id] = curve["frame"][idx] + 4
+            br_frame = extreme_frame(curve["frame"], curve["x"])
+            if br_frame is not None:
+                br_frames[take_id] = br_frame + 4
     curves = {}
     peaks = []
     take_metrics = {}
     for take_id, curve in raw_data.items():
         if take_id not in br_frames:
             continue
-        normalized_frames = []
-        normalized_values = []
-        normalized_samples = []
-        for frame, value in zip(curve.get("frame", []), curve.get(value_key, [])):
-            if value is None or not np.isfinite(value):
-                continue
-            normalized = -value if invert_for_all or (invert_left and take_handedness.get(take_id) == "L") else value
-            normalized_frames.append(rel_frame_to_ms(frame - br_frames[take_id]))
-            normalized_values.append(normalized)
-            normalized_samples.append((frame, normalized))
-        if normalized_values:
+        sign = -1.0 if invert_for_all or (invert_left and take_handedness.get(take_id) == "L") else 1.0
+        frames = np.asarray(curve.get("frame", []), dtype=np.int64)
+        values = np.asarray(curve.get(value_key, []), dtype=np.float64)
+        keep = np.isfinite(values)
+        if keep.any():
+            frames = frames[keep]
+            values = values[keep] * sign
+            normalized_frames, normalized_values = normalize_to_release(frames, values, br_frames[take_id])
             curves[take_id] = {"frame": normalized_frames, "value": normalized_values}
             if peak_mode == "external":
-                peak_value = abs(min(normalized_values))
-                peak_frame, _ = min(normalized_samples, key=lambda item: item[1])
+                peak_idx = np.argmin(values)
+                peak_value = abs(values[peak_idx])
             elif peak_mode == "absolute":
-                peak_frame, peak_raw_value = max(normalized_samples, key=lambda item: abs(item[1]))
-                peak_value = abs(peak_raw_value)
+                peak_idx = np.argmax(np.abs(values))
+                peak_value = abs(values[peak_idx])
             else:
-                peak_frame, peak_value = max(normalized_samples, key=lambda item: item[1])
+                peak_idx = np.argmax(values)
+                peak_value = values[peak_idx]
+            peak_frame = frames[peak_idx]
             peaks.append(float(peak_value))
             take_metrics.setdefault(take_id, {})["Max"] = {
                 "value": float(peak_value),
@@ -9514,19 +8288,15 @@ def build_report_shoulder_horizontal_abduction_velocity_data(report_rows):
     if not report_rows:
         return {"curves": {}, "events": {}, "metrics": {}}
 
-    take_ids = [row[0] for row in report_rows]
+    take_ids = take_id_key(row[0] for row in report_rows)
     take_handedness = {row[0]: row[4] for row in report_rows}
     take_ids_by_handedness = {
-        hand: [take_id for take_id in take_ids if take_handedness.get(take_id) == hand]
+        hand: tuple(take_id for take_id in take_ids if take_handedness.get(take_id) == hand)
         for hand in ("R", "L")
     }
 
     def load_by_handedness(loader_fn):
-        merged = {}
-        for hand, ids in take_ids_by_handedness.items():
-            if ids:
-                merged.update(loader_fn(ids, hand))
-        return merged
+        return load_merged_by_handedness(loader_fn, take_ids_by_handedness)
 
     velocity_data = load_by_handedness(get_shoulder_horizontal_abduction_velocity)
     raw_angle_data = load_by_handedness(get_original_shoulder_horizontal_angle)
@@ -9541,20 +8311,15 @@ def build_report_shoulder_horizontal_abduction_velocity_data(report_rows):
         shoulder_er_data = load_by_handedness(get_shoulder_er_angles)
         br_frames = {}
         for take_id, curve in cg_data.items():
-            valid = [(idx, value) for idx, value in enumerate(curve.get("x", [])) if value is not None]
-            if valid:
-                idx, _ = max(valid, key=lambda item: item[1])
-                br_frames[take_id] = curve["frame"][idx] + 4
+            br_frame = extreme_frame(curve["frame"], curve.get("x", []))
+            if br_frame is not None:
+                br_frames[take_id] = br_frame + 4
 
         mer_frames = {}
         for take_id, curve in shoulder_er_data.items():
-            valid = [(frame, value) for frame, value in zip(curve.get("frame", []), curve.get("z", [])) if value is not None]
-            if valid:
-                mer_frames[take_id] = (
-                    min(valid, key=lambda item: item[1])[0]
-                    if take_handedness.get(take_id) == "R"
-                    else max(valid, key=lambda item: item[1])[0]
-                )
+            mer_frame = extreme_frame(curve.get("frame", []), curve.get("z", []), largest=take_handedness.get(take_id) != "R")
+            if mer_frame is not None:
+                mer_frames[take_id] = mer_frame
 
         fp_frames = {}
         for hand, ids in take_ids_by_handedness.items():
@@ -9593,63 +8358,59 @@ def build_report_shoulder_horizontal_abduction_velocity_data(report_rows):
         if br_frame is None:
             continue
 
-        valid_velocity = [
-            (int(frame), float(value))
-            for frame, value in zip(velocity_curve.get("frame", []), velocity_curve.get("value", []))
-            if value is not None and np.isfinite(value)
-        ]
-        if valid_velocity:
-            curves[take_id] = {
-                "frame": [rel_frame_to_ms(frame - br_frame) for frame, _ in valid_velocity],
-                "value": [value for _, value in valid_velocity],
-            }
+        velocity_frames = np.asarray(velocity_curve.get("frame", []), dtype=np.int64)
+        velocity_values = np.asarray(velocity_curve.get("value", []), dtype=np.float64)
+        finite = np.isfinite(velocity_values)
+        velocity_frames = velocity_frames[finite]
+        velocity_values = velocity_values[finite]
+        if velocity_frames.size:
+            normalized_frames, normalized_values = normalize_to_release(velocity_frames, velocity_values, br_frame)
+            curves[take_id] = {"frame": normalized_frames, "value": normalized_values}
 
         mer_frame = mer_frames.get(take_id)
         angle_curve = raw_angle_data.get(take_id, {})
-        valid_angle = [
-            (int(frame), float(value))
-            for frame, value in zip(angle_curve.get("frame", []), angle_curve.get("value", []))
-            if value is not None and np.isfinite(value)
-        ]
-        if mer_frame is None or not valid_angle or not valid_velocity:
+        angle_frames = np.asarray(angle_curve.get("frame", []), dtype=np.int64)
+        angle_values = np.asarray(angle_curve.get("value", []), dtype=np.float64)
+        finite = np.isfinite(angle_values)
+        angle_frames = angle_frames[finite]
+        angle_values = angle_values[finite]
+        if mer_frame is None or not angle_frames.size or not velocity_frames.size:
             continue
 
-        scap_window = [(frame, value) for frame, value in valid_angle if mer_frame - 50 <= frame <= mer_frame]
-        if not scap_window:
+        right_handed = take_handedness.get(take_id) == "R"
+        scap_window = (angle_frames >= mer_frame - 50) & (angle_frames <= mer_frame)
+        if not scap_window.any():
             continue
-        max_scap_frame, _ = (
-            min(scap_window, key=lambda item: item[1])
-            if take_handedness.get(take_id) == "R"
-            else max(scap_window, key=lambda item: item[1])
-        )
-
-        preceding_angles = [(frame, value) for frame, value in valid_angle if frame <= max_scap_frame]
-        start_frame = None
-        if take_handedness.get(take_id) == "R":
-            for (prev_frame, prev_value), (curr_frame, curr_value) in zip(preceding_angles, preceding_angles[1:]):
-                if prev_value > 0 and curr_value <= 0:
-                    start_frame = curr_frame
+        scap_frames = angle_frames[scap_window]
+        scap_values = angle_values[scap_window]
+        max_scap_frame = int(scap_frames[np.argmin(scap_values) if right_handed else np.argmax(scap_values)])
+
+        preceding = angle_frames <= max_scap_frame
+        preceding_frames = angle_frames[preceding]
+        preceding_values = angle_values[preceding]
+        # Last zero crossing toward the scap-load direction before max scap load
+        if right_handed:
+            crossings = np.flatnonzero((preceding_values[:-1] > 0) & (preceding_values[1:] <= 0))
         else:
-            for (prev_frame, prev_value), (curr_frame, curr_value) in zip(preceding_angles, preceding_angles[1:]):
-                if prev_value < 0 and curr_value >= 0:
-                    start_frame = curr_frame
-        if start_frame is None and preceding_angles:
-            start_frame, _ = min(preceding_angles, key=lambda item: abs(item[1]))
+            crossings = np.flatnonzero((preceding_values[:-1] < 0) & (preceding_values[1:] >= 0))
+        start_frame = None
+        if crossings.size:
+            start_frame = int(preceding_frames[crossings[-1] + 1])
+        elif preceding_frames.size:
+            start_frame = int(preceding_frames[np.argmin(np.abs(preceding_values))])
         if start_frame is None:
             continue
 
-        velocity_window = [
-            (frame, value)
-            for frame, value in valid_velocity
-            if start_frame <= frame <= max_scap_frame
-        ]
-        if velocity_window:
-            peak_frame, peak_raw_value = max(velocity_window, key=lambda item: item[1])
-            peak_value = abs(float(peak_raw_value))
+        velocity_window = (velocity_frames >= start_frame) & (velocity_frames <= max_scap_frame)
+        if velocity_window.any():
+            window_frames = velocity_frames[velocity_window]
+            window_values = velocity_values[velocity_window]
+            peak_idx = int(np.argmax(window_values))
+            peak_value = abs(float(window_values[peak_idx]))
             peaks.append(peak_value)
             take_metrics.setdefault(take_id, {})["Max"] = {
                 "value": peak_value,
-                "source_frame": int(peak_frame),
+                "source_frame": int(window_frames[peak_idx]),
             }
 
     return {
@@ -9694,19 +8455,15 @@ def build_report_pelvis_velocity_window_data(report_rows, loader_fn, peak_select
     if not report_rows:
         return {"curves": {}, "events": {}, "metrics": {}}
 
-    take_ids = [row[0] for row in report_rows]
+    take_ids = take_id_key(row[0] for row in report_rows)
     take_handedness = {row[0]: row[4] for row in report_rows}
     take_ids_by_handedness = {
-        hand: [take_id for take_id in take_ids if take_handedness.get(take_id) == hand]
+        hand: tuple(take_id for take_id in take_ids if take_handedness.get(take_id) == hand)
         for hand in ("R", "L")
     }
 
     def load_by_handedness(loader_fn):
-        merged = {}
-        for hand, ids in take_ids_by_handedness.items():
-            if ids:
-                merged.update(loader_fn(ids, hand))
-        return merged
+        return load_merged_by_handedness(loader_fn, take_ids_by_handedness)
 
     pelvis_velocity_data = load_by_handedness(loader_fn)
 
@@ -9721,20 +8478,15 @@ def build_report_pelvis_velocity_window_data(report_rows, loader_fn, peak_select
         shoulder_er_data = load_by_handedness(get_shoulder_er_angles)
         br_frames = {}
         for take_id, curve in cg_data.items():
-            valid = [(idx, value) for idx, value in enumerate(curve["x"]) if value is not None]
-            if valid:
-                idx, _ = max(valid, key=lambda item: item[1])
-                br_frames[take_id] = curve["frame"][idx] + 4
+            br_frame = extreme_frame(curve["frame"], curve["x"])
+            if br_frame is not None:
+                br_frames[take_id] = br_frame + 4
 
         mer_frames = {}
         for take_id, curve in shoulder_er_data.items():
-            valid = [(frame, value) for frame, value in zip(curve["frame"], curve["z"]) if value is not None]
-            if valid:
-                mer_frames[take_id] = (
-                    min(valid, key=lambda item: item[1])[0]
-                    if take_handedness.get(take_id) == "R"
-                    else max(valid, key=lambda item: item[1])[0]
-                )
+            mer_frame = extreme_frame(curve["frame"], curve["z"], largest=take_handedness.get(take_id) != "R")
+            if mer_frame is not None:
+                mer_frames[take_id] = mer_frame
 
         fp_frames = {}
         for hand, ids in take_ids_by_handedness.items():
@@ -10067,7 +8819,7 @@ def get_report_metric_specs():
 
 
 def load_or_build_report_metric(report_rows, spec):
-    take_ids = [row[0] for row in report_rows]
+    take_ids = take_id_key(row[0] for row in report_rows)
     cached_data = get_cached_report_metric_data(take_ids, spec["metric_key"])
     if cached_data is not None:
         return cached_data
@@ -10091,8 +8843,8 @@ def build_report_arm_kinematics(report_rows, reference_report_rows):
     arm_kinematics = {}
     specs = get_report_metric_specs()
     metric_keys = [spec["metric_key"] for spec in specs]
-    athlete_take_ids = [row[0] for row in report_rows]
-    reference_take_ids = [row[0] for row in reference_report_rows]
+    athlete_take_ids = take_id_key(row[0] for row in report_rows)
+    reference_take_ids = take_id_key(row[0] for row in reference_report_rows)
     athlete_bundle = get_cached_report_metric_bundle(athlete_take_ids, metric_keys)
     reference_bundle = get_cached_report_metric_bundle(reference_take_ids, metric_keys)
     for spec in specs:
@@ -11981,11 +10733,7 @@ with tab_energy:
     energy_data_by_metric = {}
 
     def load_energy_by_handedness(loader_fn):
-        merged = {}
-        for hand, ids in take_ids_by_handedness.items():
-            if ids:
-                merged.update(loader_fn(ids, hand))
-        return merged
+        return load_merged_by_handedness(loader_fn, take_ids_by_handedness)
 
     for metric in energy_metrics:
         if metric == "Trunk-Shoulder Energy Flow (RTA_DIST_L | RTA_DIST_R)":
@@ -12057,10 +10805,10 @@ with tab_energy:
     legend_keys_added = set()
     energy_median_pkh_frame = None
     if mound_only_sidebar and knee_event_frames:
-        energy_median_pkh_frame = int(np.median(knee_event_frames))
+        energy_median_pkh_frame = knee_median_frame
 
     if energy_window_mode == "Foot Plant to Ball Release View":
-        energy_median_fp_frame = int(np.median(fp_event_frames)) if fp_event_frames else None
+        energy_median_fp_frame = fp_median_frame
         energy_window_start = (
             energy_median_fp_frame - 25
             if energy_median_fp_frame is not None else
@@ -12089,6 +10837,8 @@ with tab_energy:
 
         grouped_power = {}
         grouped_by_date = {}
+        # Individual Throws curves keyed by (legendgroup, color, dash)
+        individual_polylines = {}
 
         for take_id, d in energy_data.items():
             if take_id not in br_frames:
@@ -12098,12 +10848,10 @@ with tab_energy:
             values = d["value"]
             br = br_frames[take_id]
 
-            norm_f, norm_v = [], []
-            for f, v in zip(frames, values):
-                rel = f - br
-                if energy_window_start <= rel <= energy_window_end:
-                    norm_f.append(rel_frame_to_ms(rel))
-                    norm_v.append(v)
+            norm_f, norm_v = normalize_to_release(
+                frames, values, br, energy_window_start, energy_window_end,
+                as_arrays=True,
+            )
 
             grouped_power[take_id] = {"frame": norm_f, "value": norm_v}
 
@@ -12138,34 +10886,13 @@ with tab_energy:
                     if show_group_pitcher_breakout else
                     f"{metric}_{date}"
                 )
-                fig.add_trace(
-                    go.Scatter(
-                        x=norm_f,
-                        y=norm_v,
-                        mode="lines",
-                        line=dict(
-                            color=trace_color,
-                            dash=date_dash_map[date]
-                        ),
-                        customdata=[[metric, date, take_order[take_id], take_velocity[take_id], hover_pitcher_name]] * len(norm_f),
-                        hovertemplate=(
-                            ("%{customdata[4]} | %{customdata[1]}" if show_group_pitcher_breakout else "%{customdata[1]}")
-                            + "<br>%{customdata[0]}: %{y:.1f}"
-                            + "<br>Pitch %{customdata[2]} (%{customdata[3]:.1f} mph)"
-                            + "<br>Time: %{x:.0f} ms rel BR"
-                            + "<extra></extra>"
-                        ),
-                        name=(
-                            f"Control Group | {metric} – Pitch {take_order[take_id]} ({take_velocity[take_id]:.1f} mph)"
-                            if (comparison_grouping_enabled and control_group_take) else
-                            f"{group_label} | {metric} – {date} | Pitch {take_order[take_id]} ({take_velocity[take_id]:.1f} mph) | {pitcher_name}"
-                            if (comparison_grouping_enabled and show_group_pitcher_breakout) else
-                            f"{group_label} | {metric} – {date} | Pitch {take_order[take_id]} ({take_velocity[take_id]:.1f} mph)"
-                            if comparison_grouping_enabled else None
-                        ),
-                        showlegend=False,
-                        legendgroup=legendgroup
-                    )
+                # Same-styled takes share one trace (no legend)
+                append_polyline(
+                    individual_polylines,
+                    (legendgroup, trace_color, date_dash_map[date]),
+                    norm_f,
+                    norm_v,
+                    [metric, date, take_order[take_id], take_velocity[take_id], hover_pitcher_name],
                 )
                 legend_key = (metric, date_key)
                 if control_group_take and legend_key not in legend_keys_added:
@@ -12196,6 +10923,27 @@ with tab_energy:
                     )
                     legend_keys_added.add(legend_key)
 
+        # One trace per metric + date style instead of one per take
+        for (legendgroup, color, dash), polyline in individual_polylines.items():
+            fig.add_trace(
+                go.Scattergl(
+                    x=np.concatenate(polyline["x"]),
+                    y=np.concatenate(polyline["y"]),
+                    mode="lines",
+                    line=dict(color=color, dash=dash),
+                    customdata=polyline["customdata"],
+                    hovertemplate=(
+                        ("%{customdata[4]} | %{customdata[1]}" if show_group_pitcher_breakout else "%{customdata[1]}")
+                        + "<br>%{customdata[0]}: %{y:.1f}"
+                        + "<br>Pitch %{customdata[2]} (%{customdata[3]:.1f} mph)"
+                        + "<br>Time: %{x:.0f} ms rel BR"
+                        + "<extra></extra>"
+                    ),
+                    showlegend=False,
+                    legendgroup=legendgroup
+                )
+            )
+
         # -------------------------------
         # Grouped (Mean + IQR per date)
         # -------------------------------
@@ -12218,7 +10966,7 @@ with tab_energy:
                     date = date_key
                     pitcher_name = ""
                     group_label = ""
-                x, y, q1, q3 = aggregate_curves(curves, "Mean")
+                x, y, q1, q3 = aggregate_curves(curves, "Mean", as_arrays=True)
                 avg_velocity = np.mean([take_velocity[tid] for tid in curves.keys()])
                 legendgroup = (
                     f"{group_label}_{metric}_{pitcher_name}_{date}"
@@ -12231,7 +10979,7 @@ with tab_energy:
                 )
 
                 fig.add_trace(
-                    go.Scatter(
+                    go.Scattergl(
                         x=x,
                         y=y,
                         mode="lines",
@@ -12261,9 +11009,9 @@ with tab_energy:
 
                 if show_energy_signal_iqr_band:
                     fig.add_trace(
-                        go.Scatter(
-                            x=x + x[::-1],
-                            y=q3 + q1[::-1],
+                        go.Scattergl(
+                            x=np.concatenate([x, x[::-1]]),
+                            y=np.concatenate([q3, q1[::-1]]),
                             fill="toself",
                             fillcolor=to_rgba(
                                 group_color_map.get(group_label, metric_color)
@@ -12309,77 +11057,25 @@ with tab_energy:
     # -------------------------------
     # Event Lines (with text labels above)
     # -------------------------------
+    event_markers = []
     if energy_median_pkh_frame is not None:
         add_event_iqr_band(fig, knee_event_frames, "gold", show_energy_fp_iqr_band)
-        median_pkh = rel_frame_to_ms(energy_median_pkh_frame)
-        fig.add_vline(x=median_pkh, line_width=3, line_dash="dash", line_color="gold")
-        fig.add_annotation(
-            x=median_pkh,
-            y=1.06,
-            xref="x",
-            yref="paper",
-            text="PKH",
-            showarrow=False,
-            font=dict(color="gold", size=13, family="Arial"),
-            align="center"
-        )
+        event_markers.append((rel_frame_to_ms(energy_median_pkh_frame), "gold", "PKH"))
     elif knee_event_frames:
         add_event_iqr_band(fig, knee_event_frames, "gold", show_energy_fp_iqr_band)
-        median_knee = rel_frame_to_ms(int(np.median(knee_event_frames)))
-        fig.add_vline(x=median_knee, line_width=3, line_dash="dash", line_color="gold")
-        fig.add_annotation(
-            x=median_knee,
-            y=1.06,
-            xref="x",
-            yref="paper",
-            text="Knee",
-            showarrow=False,
-            font=dict(color="gold", size=13, family="Arial"),
-            align="center"
-        )
+        event_markers.append((rel_frame_to_ms(knee_median_frame), "gold", "Knee"))
 
     if fp_event_frames:
         add_event_iqr_band(fig, fp_event_frames, "green", show_energy_fp_iqr_band)
-        median_fp = rel_frame_to_ms(int(np.median(fp_event_frames)))
-        fig.add_vline(x=median_fp, line_width=3, line_dash="dash", line_color="green")
-        fig.add_annotation(
-            x=median_fp,
-            y=1.06,
-            xref="x",
-            yref="paper",
-            text="FP",
-            showarrow=False,
-            font=dict(color="green", size=13, family="Arial"),
-            align="center"
-        )
+        event_markers.append((fp_median_ms, "green", "FP"))
 
     if mer_event_frames:
         add_event_iqr_band(fig, mer_event_frames, "red", show_energy_fp_iqr_band)
-        median_mer = rel_frame_to_ms(int(np.median(mer_event_frames)))
-        fig.add_vline(x=median_mer, line_width=3, line_dash="dash", line_color="red")
-        fig.add_annotation(
-            x=median_mer,
-            y=1.06,
-            xref="x",
-            yref="paper",
-            text="MER",
-            showarrow=False,
-            font=dict(color="red", size=13, family="Arial"),
-            align="center"
-        )
+        event_markers.append((mer_median_ms, "red", "MER"))
 
     add_event_iqr_band(fig, [0] * max(len(take_ids), 1), "blue", show_energy_fp_iqr_band)
-    fig.add_vline(x=0, line_width=3, line_dash="dash", line_color="blue")
-    fig.add_annotation(
-        x=0,
-        y=1.06,
-        xref="x",
-        yref="paper",
-        text="BR",
-        showarrow=False,
-        font=dict(color="blue", size=13, family="Arial"),
-        align="center"
-    )
+    event_markers.append((0, "blue", "BR"))
+    add_event_markers(fig, event_markers, label_y=1.06, font_size=13, font_family="Arial")
 
     fig.update_layout(
         xaxis_title="Time Relative to Ball Release (ms)",
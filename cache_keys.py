@@ -0,0 +1,54 @@
+"""
+Cache-key helpers for take-id arguments of st.cache_data loaders.
+
+Kept out of app.py so they can be imported without running the dashboard.
+"""
+import functools
+import hashlib
+
+import numpy as np
+
+
+class TakeIds(tuple):
+    """
+    Sorted take ids used as a loader cache key. The digest is computed on first
+    use and kept on the object, so passing the same TakeIds through every
+    loader of a rerun pays for hashing once.
+    """
+
+    @functools.cached_property
+    def digest(self):
+        packed = np.asarray(self, dtype=np.int64)
+        return hashlib.blake2b(packed.tobytes(), digest_size=16).digest()
+
+
+def take_id_key(take_ids):
+    """
+    Returns take ids as a sorted TakeIds tuple. Loaders are called with this key
+    so the same takes selected in a different order hit the same cache entry.
+    """
+    if isinstance(take_ids, TakeIds):
+        return take_ids
+    return TakeIds(sorted(take_ids))
+
+
+def hash_take_ids(values):
+    return values.digest
+
+
+def hash_take_id_list(values):
+    """
+    Cache-key hash for list arguments. Integer lists (take ids) are hashed in
+    order as one packed int64 buffer instead of element by element; any other
+    list is handed back to Streamlit's default hashing as a tuple.
+    """
+    if values and isinstance(values[0], (int, np.integer)):
+        packed = np.asarray(values)
+        if packed.ndim == 1 and packed.dtype.kind in "iu":
+            return hashlib.blake2b(packed.astype(np.int64).tobytes(), digest_size=16).digest()
+    return tuple(values)
+
+
+# Plain tuples (dict items, (lo, hi) pairs, series keys) keep Streamlit's
+# default hashing; only TakeIds and lists go through the functions above.
+TAKE_ID_HASH_FUNCS = {list: hash_take_id_list, TakeIds: hash_take_ids}
@@ -1,11 +1,41 @@
 import os
+import threading
+from contextlib import contextmanager
+
 import psycopg2
+import psycopg2.extensions
+from psycopg2.pool import PoolError, ThreadedConnectionPool
 
+POOL_MIN_CONNECTIONS = int(os.getenv("DB_POOL_MIN", 2))
+POOL_MAX_CONNECTIONS = int(os.getenv("DB_POOL_MAX", 16))
+POOL_CHECKOUT_TIMEOUT_SECONDS = float(os.getenv("DB_POOL_TIMEOUT", 30))
 
-def get_connection():
+_pool = None
+_pool_lock = threading.Lock()
+# ThreadedConnectionPool.getconn raises as soon as every connection is out;
+# checkouts wait on this semaphore for a free slot instead.
+_pool_slots = threading.BoundedSemaphore(POOL_MAX_CONNECTIONS)
+
+
+class PooledConnection(psycopg2.extensions.connection):
     """
-    Returns a PostgreSQL connection using environment variables.
+    Connection that keeps one cursor open across pool checkouts and remembers
+    which server-side prepared statements exist on its session.
     """
+
+    _cached_cursor = None
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.prepared_statements = set()
+
+    def cached_cursor(self):
+        if self._cached_cursor is None or self._cached_cursor.closed:
+            self._cached_cursor = self.cursor()
+        return self._cached_cursor
+
+
+def _connection_kwargs():
     required_vars = ["DB_HOST", "DB_NAME", "DB_USER", "DB_PASSWORD"]
     missing = [v for v in required_vars if not os.getenv(v)]
 
@@ -14,11 +44,115 @@ def get_connection():
             f"Missing required database environment variables: {', '.join(missing)}"
         )
 
-    return psycopg2.connect(
-        host=os.getenv("DB_HOST"),
-        dbname=os.getenv("DB_NAME"),
-        user=os.getenv("DB_USER"),
-        password=os.getenv("DB_PASSWORD"),
-        port=int(os.getenv("DB_PORT", 5432)),
-        sslmode="require",
-    )
\ No newline at end of file
+    return {
+        "host": os.getenv("DB_HOST"),
+        "dbname": os.getenv("DB_NAME"),
+        "user": os.getenv("DB_USER"),
+        "password": os.getenv("DB_PASSWORD"),
+        "port": int(os.getenv("DB_PORT", 5432)),
+        "sslmode": "require",
+        # Pooled connections sit idle between reruns; keepalives stop NATs and
+        # load balancers from silently dropping the TLS session underneath them.
+        "keepalives": 1,
+        "keepalives_idle": 30,
+        "keepalives_interval": 10,
+        "keepalives_count": 3,
+    }
+
+
+def get_connection():
+    """
+    Returns a PostgreSQL connection using environment variables.
+    """
+    return psycopg2.connect(**_connection_kwargs())
+
+
+def get_pool():
+    """
+    Returns the process-wide connection pool, creating it on first use.
+
+    The pool lives at module level, so it survives Streamlit script reruns
+    and is shared by every session served by this process.
+    """
+    global _pool
+    if _pool is None or _pool.closed:
+        with _pool_lock:
+            if _pool is None or _pool.closed:
+                _pool = ThreadedConnectionPool(
+                    POOL_MIN_CONNECTIONS,
+                    POOL_MAX_CONNECTIONS,
+                    connection_factory=PooledConnection,
+                    **_connection_kwargs(),
+                )
+    return _pool
+
+
+@contextmanager
+def pooled_connection():
+    """
+    Checks a connection out of the pool for the duration of the block.
+
+    Commits on success and rolls back on error so the connection goes back
+    to the pool outside of a transaction. Connections that were closed or
+    broken while checked out are discarded instead of being reused.
+
+    When every connection is checked out, waits up to
+    POOL_CHECKOUT_TIMEOUT_SECONDS for one to come back before raising PoolError.
+    """
+    if not _pool_slots.acquire(timeout=POOL_CHECKOUT_TIMEOUT_SECONDS):
+        raise PoolError(
+            f"No database connection became available within {POOL_CHECKOUT_TIMEOUT_SECONDS:g}s"
+        )
+    try:
+        pool = get_pool()
+        conn = pool.getconn()
+    except Exception:
+        _pool_slots.release()
+        raise
+    discard = False
+    try:
+        yield conn
+        if not conn.closed:
+            conn.commit()
+    except (psycopg2.OperationalError, psycopg2.InterfaceError):
+        discard = True
+        raise
+    except Exception:
+        if not conn.closed:
+            conn.rollback()
+        raise
+    finally:
+        try:
+            pool.putconn(conn, close=discard or bool(conn.closed))
+        finally:
+            _pool_slots.release()
+
+
+def execute_prepared(cur, name, statement, params=()):
+    """
+    Executes a named prepared statement, running PREPARE the first time the
+    statement is used on the cursor's connection.
+
+    statement uses $1, $2, ... placeholders; params are bound in that order.
+    """
+    conn = cur.connection
+    if name not in conn.prepared_statements:
+        cur.execute(f"PREPARE {name} AS {statement}")
+        conn.prepared_statements.add(name)
+
+    if params:
+        cur.execute(f"EXECUTE {name} ({', '.join(['%s'] * len(params))})", params)
+    else:
+        cur.execute(f"EXECUTE {name}")
+
+
+@contextmanager
+def pooled_cursor():
+    """
+    Yields the reusable cursor of a pooled connection for the duration of the block.
+
+    The cursor is not closed on exit; it stays attached to its connection and
+    is handed out again on the connection's next checkout.
+    """
+    with pooled_connection() as conn:
+        yield conn.cached_cursor()
@@ -0,0 +1,96 @@
+"""
+Builds the indexes the dashboard's loaders depend on.
+
+Run once per database, and again after restoring or rebuilding a table:
+
+    python -m db.indexes
+"""
+import logging
+
+from db.connection import get_connection
+
+logger = logging.getLogger(__name__)
+
+TIME_SERIES_COVERING_INDEX = "idx_time_series_data_series_take_frame"
+TAKES_ATHLETE_DATE_VELO_INDEX = "idx_theia_takes_athlete_date_velo"
+
+# { index name: definition after "ON" }
+INDEX_DEFINITIONS = {
+    # Covers the id-based predicates and frame ordering of the time series
+    # batch loader, so its reads can be index-only scans.
+    TIME_SERIES_COVERING_INDEX: """
+        time_series_data (category_id, segment_id, take_id, frame)
+        INCLUDE (x_data, y_data, z_data)
+    """,
+    # Session date and velocity bound lookups for the sidebar filters.
+    TAKES_ATHLETE_DATE_VELO_INDEX: """
+        takes (athlete_id, take_date)
+        WHERE pitch_velo IS NOT NULL
+    """,
+}
+
+
+def index_state(cur, index_name):
+    """
+    Returns None when the index is missing, otherwise whether PostgreSQL marks
+    it valid (usable by the planner).
+    """
+    cur.execute(
+        """
+        SELECT i.indisvalid
+        FROM pg_index i
+        WHERE i.indexrelid = to_regclass(%s)
+        """,
+        (f"public.{index_name}",),
+    )
+    row = cur.fetchone()
+    return row[0] if row else None
+
+
+def ensure_index(cur, index_name, definition):
+    """
+    Builds an index with CREATE INDEX CONCURRENTLY so ingest writes are not
+    blocked. A failed or interrupted concurrent build leaves an INVALID index
+    behind that IF NOT EXISTS would skip forever, so an invalid index is
+    dropped and rebuilt. cur must be on an autocommit connection.
+    """
+    state = index_state(cur, index_name)
+    if state:
+        logger.info("%s is present and valid", index_name)
+        return
+    if state is False:
+        logger.warning("%s is INVALID; dropping and rebuilding it", index_name)
+        cur.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name}")
+
+    logger.info("Building %s", index_name)
+    cur.execute(f"CREATE INDEX CONCURRENTLY {index_name} ON {definition}")
+    if not index_state(cur, index_name):
+        raise RuntimeError(f"{index_name} was built but is not valid")
+    logger.info("%s built", index_name)
+
+
+def ensure_indexes(index_definitions=INDEX_DEFINITIONS):
+    """
+    Builds every missing or invalid index in index_definitions. CONCURRENTLY
+    cannot run inside a transaction, so this uses its own autocommit connection.
+    """
+    conn = get_connection()
+    try:
+        conn.autocommit = True
+        with conn.cursor() as cur:
+            for index_name, definition in index_definitions.items():
+                try:
+                    ensure_index(cur, index_name, definition)
+                except Exception:
+                    logger.exception("Could not build %s", index_name)
+                    raise
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    from dotenv import load_dotenv
+
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
+    load_dotenv()
+    ensure_indexes()
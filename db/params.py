@@ -0,0 +1,11 @@
+import datetime
+
+
+def as_date_list(values):
+    """
+    Returns session dates ("YYYY-MM-DD" strings or dates) as datetime.date objects.
+
+    Prepared statements bind parameters by assignment, which cannot coerce a
+    text[] into date[], so ANY($n::date[]) needs real dates rather than strings.
+    """
+    return [datetime.date.fromisoformat(str(value)[:10]) for value in values]
@@ -0,0 +1,35 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Loader threads are shared by every session of the process and kept below
+# DB_POOL_MAX, so concurrent renders cannot drain the connection pool.
+LOADER_MAX_WORKERS = int(os.getenv("LOADER_MAX_WORKERS", 8))
+LOADER_THREAD_PREFIX = "loader"
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_loader_executor():
+    """
+    Returns the process-wide thread pool loaders are submitted to, creating it
+    on first use.
+
+    The executor lives at module level rather than in st.cache_resource, so a
+    cache reset (?refresh=1) cannot replace it while other sessions still have
+    work queued on it, and the LOADER_MAX_WORKERS cap always holds.
+    """
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=LOADER_MAX_WORKERS,
+                    thread_name_prefix=LOADER_THREAD_PREFIX,
+                )
+    return _executor
+
+
+def in_loader_thread():
+    return threading.current_thread().name.startswith(LOADER_THREAD_PREFIX)
@@ -0,0 +1,71 @@
+import hashlib
+import importlib.util
+import unittest
+
+HAS_NUMPY = importlib.util.find_spec("numpy") is not None
+HAS_STREAMLIT = importlib.util.find_spec("streamlit") is not None
+
+if HAS_NUMPY:
+    from cache_keys import TAKE_ID_HASH_FUNCS, TakeIds, hash_take_id_list, hash_take_ids, take_id_key
+
+
+def cache_data_key(value):
+    """Hashes value the way st.cache_data hashes an argument."""
+    from streamlit.runtime.caching.cache_type import CacheType
+    from streamlit.runtime.caching.hashing import update_hash
+
+    hasher = hashlib.new("md5")
+    update_hash(value, hasher=hasher, cache_type=CacheType.DATA, hash_funcs=TAKE_ID_HASH_FUNCS)
+    return hasher.hexdigest()
+
+
+@unittest.skipUnless(HAS_NUMPY, "requires numpy")
+class TakeIdHashTests(unittest.TestCase):
+    def test_reordered_ids_hash_differently(self):
+        self.assertNotEqual(hash_take_id_list([101, 202, 303]), hash_take_id_list([303, 101, 202]))
+
+    def test_take_id_key_makes_order_irrelevant(self):
+        self.assertEqual(take_id_key([303, 101, 202]), (101, 202, 303))
+        self.assertEqual(
+            hash_take_ids(take_id_key([101, 202, 303])),
+            hash_take_ids(take_id_key([303, 101, 202])),
+        )
+
+    def test_take_id_key_is_interned(self):
+        key = take_id_key([303, 101])
+        self.assertIsInstance(key, TakeIds)
+        self.assertIs(take_id_key(key), key)
+        self.assertIs(hash_take_ids(key), hash_take_ids(key))
+
+    def test_non_id_lists_use_default_hashing(self):
+        self.assertEqual(hash_take_id_list(["R", "L"]), ("R", "L"))
+        self.assertNotIn(tuple, TAKE_ID_HASH_FUNCS)
+
+    def test_different_ids_hash_differently(self):
+        self.assertNotEqual(hash_take_id_list([101, 202]), hash_take_id_list([101, 203]))
+
+
+@unittest.skipUnless(HAS_NUMPY and HAS_STREAMLIT, "requires numpy and streamlit")
+class CacheDataKeyTests(unittest.TestCase):
+    def test_swapped_frame_maps_get_distinct_keys(self):
+        self.assertNotEqual(cache_data_key({250: 300, 400: 500}), cache_data_key({300: 250, 500: 400}))
+
+    def test_equal_frame_maps_share_a_key(self):
+        self.assertEqual(cache_data_key({250: 300, 400: 500}), cache_data_key({250: 300, 400: 500}))
+
+    def test_handedness_maps_hash_their_take_ids(self):
+        self.assertNotEqual(
+            cache_data_key({"R": take_id_key([101, 202])}),
+            cache_data_key({"R": take_id_key([101, 203])}),
+        )
+
+    def test_reordered_id_lists(self):
+        self.assertNotEqual(cache_data_key([101, 202, 303]), cache_data_key([303, 101, 202]))
+        self.assertEqual(
+            cache_data_key(take_id_key([101, 202, 303])),
+            cache_data_key(take_id_key([303, 101, 202])),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+import datetime
+import os
+import unittest
+
+from db.params import as_date_list
+
+
+class AsDateListTests(unittest.TestCase):
+    def test_converts_session_date_strings(self):
+        self.assertEqual(
+            as_date_list(["2024-03-01", "2024-03-15"]),
+            [datetime.date(2024, 3, 1), datetime.date(2024, 3, 15)],
+        )
+
+    def test_passes_dates_through(self):
+        take_date = datetime.date(2024, 3, 1)
+        self.assertEqual(as_date_list([take_date]), [take_date])
+        self.assertEqual(as_date_list([datetime.datetime(2024, 3, 1, 12, 30)]), [take_date])
+
+    def test_empty_selection(self):
+        self.assertEqual(as_date_list([]), [])
+
+
+@unittest.skipUnless(os.getenv("DB_HOST"), "requires a PostgreSQL database")
+class PreparedDateFilterTests(unittest.TestCase):
+    """
+    Binds selected session dates into a prepared ANY($n::date[]) filter, the
+    same shape get_filtered_takes_for_pitcher and the shared dashboard use.
+    """
+
+    def test_specific_dates_filter(self):
+        import psycopg2
+
+        from db.connection import PooledConnection, _connection_kwargs, execute_prepared
+
+        conn = psycopg2.connect(connection_factory=PooledConnection, **_connection_kwargs())
+        try:
+            with conn.cursor() as cur:
+                execute_prepared(cur, "test_take_dates_by_filter", """
+                    SELECT d::date
+                    FROM unnest($1::date[]) AS d
+                    WHERE ($2::boolean OR d = ANY($3::date[]))
+                    ORDER BY d
+                """, (
+                    as_date_list(["2024-03-01", "2024-03-08", "2024-03-15"]),
+                    False,
+                    as_date_list(["2024-03-08", "2024-03-15"]),
+                ))
+                rows = [row[0] for row in cur.fetchall()]
+        finally:
+            conn.close()
+
+        self.assertEqual(rows, [datetime.date(2024, 3, 8), datetime.date(2024, 3, 15)])
+
+
+if __name__ == "__main__":
+    unittest.main()